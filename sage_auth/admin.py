@@ -1,9 +1,35 @@
 from django.contrib import admin
+from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin
+from django.core.exceptions import PermissionDenied
 from django.db.models import Max
+from django.http import StreamingHttpResponse
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from sage_auth.models import LoginAttempt, SageUser, SecurityAnnouncement
+from sage_auth.helpers.admin import (
+    EstimatedCountPaginator,
+    KeysetChangeList,
+    admin_performance_mode,
+)
+from sage_auth.helpers.profiler import query_profiles
+from sage_auth.helpers.search import (
+    SEARCH_FIELDS,
+    prefix_search_query,
+    user_search_backend,
+)
+from sage_auth.models import (
+    LoginAttempt,
+    LoginSummary,
+    SageUser,
+    SecurityAnnouncement,
+)
+from sage_auth.repository.services.login_export import (
+    CONTENT_TYPES,
+    LoginAttemptExporter,
+)
 
 from .utils import set_required_fields
 
@@ -52,14 +78,54 @@ class SageUserAdmin(UserAdmin):
 
     ordering = [username_field]
 
+    @property
+    def show_full_result_count(self):
+        return not (admin_performance_mode() or user_search_backend())
+
+    def get_paginator(self, request, queryset, per_page, **kwargs):
+        if admin_performance_mode() or user_search_backend():
+            return EstimatedCountPaginator(queryset, per_page, **kwargs)
+        return super().get_paginator(request, queryset, per_page, **kwargs)
+
+    def get_search_fields(self, request):
+        """Search only the indexed identifiers when a search backend is set."""
+        if user_search_backend():
+            fields = [self.username_field] + self.required_fields
+            return [field for field in SEARCH_FIELDS if field in fields]
+        return super().get_search_fields(request)
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search with the configured `USER_ADMIN_SEARCH_BACKEND`.
+
+        `prefix` matches the beginning of the normalized identifiers with
+        `LIKE 'term%'`; `trigram` keeps Django's `icontains` search, which
+        the trigram indexes created by `create_user_search_indexes` serve.
+        """
+        if user_search_backend() != "prefix" or not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        query = prefix_search_query(self.get_search_fields(request), search_term)
+        return queryset.filter(query), False
+
 
 @admin.register(LoginAttempt)
 class LoginAttemptModelAdmin(admin.ModelAdmin):
-    """Admin interface for managing LoginAttempt Model entries."""
+    """
+    Admin interface for managing LoginAttempt Model entries.
+
+    With `ADMIN_PERFORMANCE_MODE` enabled the changelist stays fast on very
+    large tables: the row count comes from the planner statistics, pages are
+    fetched with a `(timestamp, id)` cursor instead of `OFFSET`, and the
+    search matches identifier prefixes through the user indexes instead of
+    `LIKE '%term%'` joins.
+    """
 
     list_display = ["user", "total_logins", "admin_logins", "failed_attempts"]
+    list_select_related = ["user"]
     search_fields = ["user__username", "user__email", "user__phone_number"]
     list_filter = ["user__is_staff", "user__is_superuser"]
+    ordering = ["-timestamp", "-id"]
+    keyset_field = "timestamp"
 
     readonly_fields = ["total_logins", "admin_logins", "failed_attempts"]
 
@@ -77,6 +143,161 @@ class LoginAttemptModelAdmin(admin.ModelAdmin):
         ),
     )
 
+    actions = ["export_csv", "export_ndjson"]
+
+    @property
+    def show_full_result_count(self):
+        return not admin_performance_mode()
+
+    def stream_export(self, queryset, export_format):
+        """Stream `queryset` as a file download without loading it in memory."""
+        exporter = LoginAttemptExporter(queryset=queryset)
+        response = StreamingHttpResponse(
+            exporter.lines(export_format), content_type=CONTENT_TYPES[export_format]
+        )
+        filename = f"login-attempts-{timezone.now():%Y%m%d%H%M%S}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @admin.action(description=_("Export selected login attempts as CSV"))
+    def export_csv(self, request, queryset):
+        return self.stream_export(queryset, "csv")
+
+    @admin.action(description=_("Export selected login attempts as NDJSON"))
+    def export_ndjson(self, request, queryset):
+        return self.stream_export(queryset, "ndjson")
+
+    def get_urls(self):
+        opts = self.model._meta
+        return [
+            path(
+                "query-profiles/",
+                self.admin_site.admin_view(self.query_profiles_view),
+                name=f"{opts.app_label}_{opts.model_name}_query_profiles",
+            ),
+        ] + super().get_urls()
+
+    def query_profiles_view(self, request):
+        """List the auth views issuing the most queries, recorded by
+        `QueryProfilerMiddleware`."""
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        context = {
+            **self.admin_site.each_context(request),
+            "title": _("Query profiles"),
+            "opts": self.model._meta,
+            "profiles": query_profiles.worst(),
+        }
+        return TemplateResponse(
+            request, "admin/sage_auth/loginattempt/query_profiles.html", context
+        )
+
+    def get_changelist(self, request, **kwargs):
+        if admin_performance_mode():
+            return KeysetChangeList
+        return super().get_changelist(request, **kwargs)
+
+    def get_paginator(self, request, queryset, per_page, **kwargs):
+        if admin_performance_mode():
+            return EstimatedCountPaginator(queryset, per_page, **kwargs)
+        return super().get_paginator(request, queryset, per_page, **kwargs)
+
+    def get_search_results(self, request, queryset, search_term):
+        """Match user identifier prefixes in performance mode."""
+        search_term = search_term.strip()
+        if not admin_performance_mode() or not search_term:
+            return super().get_search_results(request, queryset, search_term)
+
+        fields = [field.removeprefix("user__") for field in self.search_fields]
+        query = prefix_search_query(fields, search_term)
+        users = get_user_model().objects.filter(query).values("pk")
+        return queryset.filter(user__in=users), False
+
+
+class FailedAttemptsFilter(admin.SimpleListFilter):
+    """Filter login summaries by their number of failed attempts."""
+
+    title = _("failed attempts")
+    parameter_name = "failures"
+
+    def lookups(self, request, model_admin):
+        return [
+            ("none", _("None")),
+            ("some", _("1 to 9")),
+            ("many", _("10 or more")),
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value() == "none":
+            return queryset.filter(failed_attempts=0)
+        if self.value() == "some":
+            return queryset.filter(failed_attempts__range=(1, 9))
+        if self.value() == "many":
+            return queryset.filter(failed_attempts__gte=10)
+        return queryset
+
+
+@admin.register(LoginSummary)
+class LoginSummaryModelAdmin(admin.ModelAdmin):
+    """
+    Read-only admin showing one line per user instead of one per login.
+
+    The totals are `Sum`/`Max` annotations computed by a grouped query, so
+    sorting by a column and filtering by failures run in the database.
+    """
+
+    list_display = [
+        "__str__",
+        "display_attempts",
+        "display_total_logins",
+        "display_admin_logins",
+        "display_failed_attempts",
+        "display_last_attempt",
+    ]
+    list_display_links = None
+    list_filter = [FailedAttemptsFilter, "is_staff", "is_active"]
+    search_fields = ["^username", "^email", "^phone_number"]
+    show_full_result_count = False
+
+    def get_ordering(self, request):
+        # `last_attempt` is an annotation, which the `ordering` attribute
+        # check does not accept.
+        return ["-last_attempt", "-id"]
+
+    def get_paginator(self, request, queryset, per_page, **kwargs):
+        if admin_performance_mode():
+            return EstimatedCountPaginator(queryset, per_page, **kwargs)
+        return super().get_paginator(request, queryset, per_page, **kwargs)
+
+    @admin.display(description=_("Attempts"), ordering="attempts")
+    def display_attempts(self, obj):
+        return obj.attempts
+
+    @admin.display(description=_("Total logins"), ordering="total_logins")
+    def display_total_logins(self, obj):
+        return obj.total_logins
+
+    @admin.display(description=_("Admin logins"), ordering="admin_logins")
+    def display_admin_logins(self, obj):
+        return obj.admin_logins
+
+    @admin.display(description=_("Failed attempts"), ordering="failed_attempts")
+    def display_failed_attempts(self, obj):
+        return obj.failed_attempts
+
+    @admin.display(description=_("Last attempt"), ordering="last_attempt")
+    def display_last_attempt(self, obj):
+        return obj.last_attempt
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(SecurityAnnouncement)
 class SecurityAnnouncementAdmin(admin.ModelAdmin):
@@ -138,6 +359,7 @@ class SecurityAnnouncementAdmin(admin.ModelAdmin):
     @admin.action(description="Mark selected announcements as active")
     def mark_active(self, request, queryset):
         """Custom action to mark selected announcements as active."""
+        # `update()` also drops the cached announcement feed.
         updated = queryset.update(is_active=True)
         self.message_user(
             request, f"{updated} announcement(s) successfully marked as active."
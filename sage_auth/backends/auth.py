@@ -0,0 +1,46 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from sage_auth.helpers.metrics import STAGE_SECONDS, metrics
+
+UserModel = get_user_model()
+
+
+class SageModelBackend(ModelBackend):
+    """
+    Authenticate like `ModelBackend` and record the login stages.
+
+    The user lookup and the password check of `authenticate()` are timed as
+    the `user_lookup` and `hashing` stages of the `login` flow, for
+    successful and failed logins alike. The checked user and whether the
+    password matched are kept on the request as `sage_auth_credentials`, so
+    `SageLoginMixin` can tell an inactive account from a wrong password
+    without hashing the password a second time.
+
+    Examples
+    --------
+    >>> AUTHENTICATION_BACKENDS = ["sage_auth.backends.auth.SageModelBackend"]
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            with metrics.timer(STAGE_SECONDS, flow="login", stage="user_lookup"):
+                user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Hash anyway, so a missing user takes as long as a wrong password.
+            with metrics.timer(STAGE_SECONDS, flow="login", stage="hashing"):
+                UserModel().set_password(password)
+            user, password_valid = None, False
+        else:
+            with metrics.timer(STAGE_SECONDS, flow="login", stage="hashing"):
+                password_valid = user.check_password(password)
+
+        if request is not None:
+            request.sage_auth_credentials = (user, password_valid)
+        if password_valid and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,205 @@
+import random
+import threading
+import time
+from collections import deque
+
+from sage_sms.design.interfaces.provider import ISmsProvider
+
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+
+class SmsProviderError(Exception):
+    """A simulated provider failure."""
+
+
+class SmsRateLimitError(SmsProviderError):
+    """A simulated rate-limit response; `retry_after` is in seconds."""
+
+    def __init__(self, message, retry_after):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MemoryOutbox:
+    """A bounded, thread-safe store of the messages sent by `MemorySms`."""
+
+    def __init__(self, size=1000):
+        self._messages = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def resize(self, size):
+        with self._lock:
+            if size != self._messages.maxlen:
+                self._messages = deque(self._messages, maxlen=size)
+
+    def append(self, message):
+        with self._lock:
+            self._messages.append(message)
+
+    def messages(self):
+        """Return a copy of the stored messages, oldest first."""
+        with self._lock:
+            return list(self._messages)
+
+    def clear(self):
+        with self._lock:
+            self._messages.clear()
+
+    def __len__(self):
+        return len(self._messages)
+
+
+class RateLimiter:
+    """A sliding window allowing `requests` calls per `period` seconds."""
+
+    def __init__(self, requests, period):
+        self.requests = requests
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Return 0 if the call is allowed, else the seconds until it is."""
+        now = time.monotonic()
+        with self._lock:
+            while self._calls and self._calls[0] <= now - self.period:
+                self._calls.popleft()
+            if len(self._calls) >= self.requests:
+                return self._calls[0] + self.period - now
+            self._calls.append(now)
+            return 0
+
+
+outbox = MemoryOutbox()
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+_rngs = {}
+_rngs_lock = threading.Lock()
+
+
+def provider_config(settings):
+    """
+    Return the provider dict from `settings`: Django settings (read from
+    `SMS_CONFIGS`), a whole `SMS_CONFIGS` dict, or the provider dict itself.
+    """
+    if settings is None:
+        return {}
+    if not isinstance(settings, dict):
+        settings = getattr(settings, "SMS_CONFIGS", {})
+    return settings.get("provider", settings)
+
+
+class MemorySms(ISmsProvider):
+    """
+    An SMS provider that keeps messages in memory instead of sending them,
+    with simulated latency, errors and rate limits for offline load tests.
+
+    Messages are stored in `sage_auth.backends.memory.outbox`, a bounded
+    thread-safe store. Each send sleeps for a latency drawn from the
+    configured distribution, then fails with `SmsProviderError` at
+    `ERROR_RATE`, or with `SmsRateLimitError` once more than `RATE_LIMIT`
+    messages were sent in its window. Rate limits are shared by every
+    instance with the same `LABEL`, and so is the random generator of a
+    `LABEL` and `SEED`, so a seeded sequence carries on across the
+    instances created for each send.
+
+    Configuration, all keys but `NAME` optional:
+
+    >>> SMS_CONFIGS = {
+    >>>     "debug": False,
+    >>>     "provider": {
+    >>>         "NAME": "memory",
+    >>>         "LABEL": "memory",
+    >>>         "OUTBOX_SIZE": 1000,
+    >>>         "LATENCY": {"DISTRIBUTION": "lognormal", "MEDIAN_MS": 120, "SIGMA": 0.5},
+    >>>         "ERROR_RATE": 0.02,
+    >>>         "RATE_LIMIT": {"REQUESTS": 50, "PERIOD": 1},
+    >>>         "SEED": 0,
+    >>>     },
+    >>> }
+
+    `DISTRIBUTION` is one of `constant` (`MS`), `uniform` (`MIN_MS`,
+    `MAX_MS`), `normal` (`MEAN_MS`, `STDDEV_MS`), `lognormal` (`MEDIAN_MS`,
+    `SIGMA`) or `exponential` (`MEAN_MS`).
+    """
+
+    def __init__(self, settings=None):
+        config = provider_config(settings)
+        self.label = config.get("LABEL", config.get("NAME", "memory"))
+        self.latency = config.get("LATENCY") or {}
+        self.error_rate = config.get("ERROR_RATE", 0)
+        seed = config.get("SEED")
+        with _rngs_lock:
+            self.rng = _rngs.setdefault(
+                (self.label, seed),
+                random.Random(seed),  # noqa: S311 - seeded latency simulation, not security
+            )
+
+        distribution = self.latency.get("DISTRIBUTION", "constant")
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+
+        if "OUTBOX_SIZE" in config:
+            outbox.resize(config["OUTBOX_SIZE"])
+
+        self.rate_limiter = None
+        rate_limit = config.get("RATE_LIMIT")
+        if rate_limit:
+            with _rate_limiters_lock:
+                self.rate_limiter = _rate_limiters.setdefault(
+                    self.label,
+                    RateLimiter(rate_limit["REQUESTS"], rate_limit.get("PERIOD", 1)),
+                )
+
+    def sample_latency(self):
+        """Draw one latency in seconds from the configured distribution."""
+        latency, rng = self.latency, self.rng
+        distribution = latency.get("DISTRIBUTION", "constant")
+        if distribution == "uniform":
+            ms = rng.uniform(latency.get("MIN_MS", 0), latency.get("MAX_MS", 0))
+        elif distribution == "normal":
+            ms = rng.gauss(latency.get("MEAN_MS", 0), latency.get("STDDEV_MS", 0))
+        elif distribution == "lognormal":
+            median = latency.get("MEDIAN_MS", 0)
+            ms = median * rng.lognormvariate(0, latency.get("SIGMA", 0)) if median else 0
+        elif distribution == "exponential":
+            mean = latency.get("MEAN_MS", 0)
+            ms = rng.expovariate(1 / mean) if mean else 0
+        else:
+            ms = latency.get("MS", 0)
+        return max(ms, 0) / 1000
+
+    def deliver(self, phone_number, message):
+        delay = self.sample_latency()
+        if delay:
+            time.sleep(delay)
+        if self.rate_limiter is not None:
+            retry_after = self.rate_limiter.acquire()
+            if retry_after:
+                raise SmsRateLimitError(
+                    f"Rate limit of provider '{self.label}' exceeded.", retry_after
+                )
+        if self.error_rate and self.rng.random() < self.error_rate:
+            raise SmsProviderError(f"Provider '{self.label}' failed to send the message.")
+        outbox.append(
+            {
+                "provider": self.label,
+                "phone_number": str(phone_number),
+                "message": message,
+                "sent_at": time.time(),
+            }
+        )
+
+    def send_one_message(
+        self, phone_number: str, message: str, linenumber=None
+    ) -> None:
+        self.deliver(phone_number, message)
+
+    def send_bulk_messages(
+        self, phone_numbers: list[str], message: str, linenumber=None
+    ) -> None:
+        for phone_number in phone_numbers:
+            self.deliver(phone_number, message)
+
+    def send_verify_message(self, phone_number: str, value: str) -> None:
+        self.deliver(phone_number, value)
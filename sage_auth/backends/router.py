@@ -0,0 +1,255 @@
+import logging
+import threading
+import time
+
+from sage_sms.design.interfaces.provider import ISmsProvider
+from sage_sms.factory import SMSBackendFactory
+
+from sage_auth.helpers.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+BASE_PACKAGE = "sage_auth.backends"
+
+
+class SmsRoutingError(Exception):
+    """No provider of the router could deliver the message."""
+
+
+class ProviderHealth:
+    """
+    Latency and error tracking with a circuit breaker for one provider.
+
+    The latency is an exponentially weighted moving average. The circuit
+    opens after `threshold` consecutive failures or when the average passes
+    `slow_ms`; after `reset_seconds` a single call is let through to probe
+    the provider, which closes the circuit again if it succeeds in time. An
+    average not updated for `reset_seconds` is forgotten, so a provider
+    skipped for one slow call is measured again.
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.ewma_ms = None
+        self.measured_at = None
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if self.probing else "open"
+
+    def allow(self, reset_seconds):
+        """Return whether a call may go to the provider now."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.probing or time.monotonic() - self.opened_at < reset_seconds:
+                return False
+            self.probing = True
+            return True
+
+    def expected_ms(self, reset_seconds):
+        """Return the average latency, or None if it is unknown or stale."""
+        with self._lock:
+            if (
+                self.measured_at is not None
+                and time.monotonic() - self.measured_at >= reset_seconds
+            ):
+                self.ewma_ms = self.measured_at = None
+            return self.ewma_ms
+
+    def record_success(self, elapsed_ms, alpha, slow_ms):
+        with self._lock:
+            if self.ewma_ms is None or self.probing:
+                # A successful probe starts the average over.
+                self.ewma_ms = elapsed_ms
+            else:
+                self.ewma_ms = alpha * elapsed_ms + (1 - alpha) * self.ewma_ms
+            self.measured_at = time.monotonic()
+            self.failures = 0
+            self.probing = False
+            if slow_ms and self.ewma_ms > slow_ms:
+                self.opened_at = time.monotonic()
+            else:
+                self.opened_at = None
+
+    def record_failure(self, threshold):
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= threshold:
+                self.opened_at = time.monotonic()
+            self.probing = False
+
+
+_health = {}
+_health_lock = threading.Lock()
+
+
+def provider_health(label):
+    """Return the shared `ProviderHealth` of the provider `label`."""
+    with _health_lock:
+        health = _health.get(label)
+        if health is None:
+            health = _health[label] = ProviderHealth(label)
+        return health
+
+
+def routing_state():
+    """Return the circuit state, average latency and failures per provider."""
+    with _health_lock:
+        return {
+            label: {
+                "state": health.state,
+                "ewma_ms": health.ewma_ms,
+                "failures": health.failures,
+            }
+            for label, health in _health.items()
+        }
+
+
+class RouterSms(ISmsProvider):
+    """
+    An SMS provider that sends through the first healthy provider of a list.
+
+    Each provider's latency and failures are tracked across requests. A
+    provider whose circuit is open is skipped, as is one whose average
+    latency exceeds what is left of `LATENCY_BUDGET_MS`, and a failed send
+    moves on to the next provider. When every available provider was
+    skipped for its latency, the one with the lowest average is tried
+    anyway. `SmsRoutingError` is raised when none delivered the message. The circuit state, latency and failures are
+    exported as `sage_auth_sms_provider_*` metrics.
+
+    >>> SMS_CONFIGS = {
+    >>>     "debug": False,
+    >>>     "provider": {
+    >>>         "NAME": "router",
+    >>>         "PROVIDERS": [
+    >>>             {"NAME": "sms", "API_KEY": "...", "LINE_NUMBER": "..."},
+    >>>             {"NAME": "memory", "LABEL": "fallback"},
+    >>>         ],
+    >>>         "LATENCY_BUDGET_MS": 5000,
+    >>>         "FAILURE_THRESHOLD": 3,
+    >>>         "SLOW_MS": 2000,
+    >>>         "RESET_SECONDS": 30,
+    >>>         "EWMA_ALPHA": 0.2,
+    >>>     },
+    >>> }
+
+    Providers are told apart by their `LABEL`, or `NAME` without one.
+    """
+
+    def __init__(self, settings):
+        if not isinstance(settings, dict):
+            settings = settings.SMS_CONFIGS
+        config = settings["provider"]
+        self.latency_budget_ms = config.get("LATENCY_BUDGET_MS", 5000)
+        self.failure_threshold = config.get("FAILURE_THRESHOLD", 3)
+        self.slow_ms = config.get("SLOW_MS")
+        self.reset_seconds = config.get("RESET_SECONDS", 30)
+        self.alpha = config.get("EWMA_ALPHA", 0.2)
+
+        self.providers = []
+        for provider in config.get("PROVIDERS", []):
+            if provider.get("NAME") == "router":
+                raise ValueError("A router cannot route to another router.")
+            self.providers.append(
+                (provider.get("LABEL", provider.get("NAME")), provider)
+            )
+        if not self.providers:
+            raise ValueError("The SMS router needs at least one provider.")
+
+    @staticmethod
+    def load_provider(config):
+        provider_settings = {"debug": False, "provider": config}
+        provider_class = SMSBackendFactory(provider_settings, BASE_PACKAGE).get_backend()
+        return provider_class(provider_settings)
+
+    def publish(self, health):
+        metrics.set_gauge(
+            "sage_auth_sms_provider_circuit_open",
+            int(health.state != "closed"),
+            provider=health.label,
+        )
+        if health.ewma_ms is not None:
+            metrics.set_gauge(
+                "sage_auth_sms_provider_latency_ms", health.ewma_ms, provider=health.label
+            )
+
+    def attempt(self, label, config, health, method, args):
+        """Call `method` on one provider and return the error, if any."""
+        started = time.monotonic()
+        try:
+            getattr(self.load_provider(config), method)(*args)
+        except Exception as error:
+            logger.warning("SMS provider %s failed: %s", label, error)
+            health.record_failure(self.failure_threshold)
+            metrics.increment("sage_auth_sms_provider_failures_total", provider=label)
+            return error
+        else:
+            elapsed_ms = (time.monotonic() - started) * 1000
+            health.record_success(elapsed_ms, self.alpha, self.slow_ms)
+            return None
+        finally:
+            self.publish(health)
+
+    def attempt_least_slow(self, too_slow, method, args):
+        """Try the allowed provider with the lowest average latency."""
+        for __, label, config, health in sorted(too_slow, key=lambda item: item[0]):
+            if health.allow(self.reset_seconds):
+                return label, self.attempt(label, config, health, method, args)
+        return None, None
+
+    def route(self, method, *args):
+        """Call `method` on the providers in order until one succeeds."""
+        deadline = time.monotonic() + self.latency_budget_ms / 1000
+        last_error = None
+        attempts = 0
+        too_slow = []
+        for label, config in self.providers:
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                break
+            health = provider_health(label)
+            expected_ms = health.expected_ms(self.reset_seconds)
+            if expected_ms is not None and expected_ms > remaining_ms:
+                too_slow.append((expected_ms, label, config, health))
+                continue
+            if not health.allow(self.reset_seconds):
+                continue
+
+            attempts += 1
+            last_error = self.attempt(label, config, health, method, args)
+            if last_error is None:
+                if attempts > 1:
+                    metrics.increment("sage_auth_sms_failovers_total", provider=label)
+                return label
+
+        if not attempts:
+            # Every provider was skipped: try the least slow one rather than none.
+            label, last_error = self.attempt_least_slow(too_slow, method, args)
+            if label is not None:
+                attempts = 1
+                if last_error is None:
+                    return label
+
+        raise SmsRoutingError(
+            f"No SMS provider delivered the message after {attempts} attempt(s)."
+        ) from last_error
+
+    def send_one_message(
+        self, phone_number: str, message: str, linenumber=None
+    ) -> None:
+        self.route("send_one_message", phone_number, message, linenumber)
+
+    def send_bulk_messages(
+        self, phone_numbers: list[str], message: str, linenumber=None
+    ) -> None:
+        self.route("send_bulk_messages", phone_numbers, message, linenumber)
+
+    def send_verify_message(self, phone_number: str, value: str) -> None:
+        self.route("send_verify_message", phone_number, value)
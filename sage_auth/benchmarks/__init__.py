@@ -0,0 +1,7 @@
+from .results import summarize, timed, write_results
+
+__all__ = [
+    "summarize",
+    "timed",
+    "write_results",
+]
@@ -0,0 +1,173 @@
+import base64
+import itertools
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.test import Client
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+from sage_otp.helpers.choices import OTPState, ReasonOptions
+from sage_otp.models import OTP
+
+from sage_auth.benchmarks.results import summarize
+from sage_auth.helpers.profiler import record_queries
+from sage_auth.utils import set_required_fields
+from sage_auth.utils.single_flight import forget, issuance_key
+
+FLOWS = ("signup", "login", "login_otp", "otp_verify", "resend", "activate")
+PASSWORD = "Bench-Password-4821"  # noqa: S105 - throwaway password of the benchmark users
+
+
+def identifiers(prefix, index):
+    """Return unique email, phone number and username values for a user."""
+    return {
+        "email": f"{prefix}-{index}@example.com",
+        "phone_number": f"+49151{index:08d}",
+        "username": f"{prefix}-{index}",
+    }
+
+
+class AuthFlowBenchmark:
+    """
+    Drive the `sage_auth` mixins through the test client and time them.
+
+    Each flow runs `iterations` requests against the views in
+    `sage_auth.benchmarks.urls`. The data every request needs (users, OTPs,
+    activation links) is prepared outside the timed section, and the queries
+    of each request are counted with an `execute_wrapper`. Run it against a
+    test database with locmem email and the `memory` SMS provider, as the
+    `benchmark_auth_flows` command does.
+
+    Parameters
+    ----------
+    iterations : int
+        Requests timed per flow.
+    flows : list of str, optional
+        The flows to run, all of `FLOWS` by default.
+    """
+
+    def __init__(self, iterations, flows=None):
+        self.iterations = iterations
+        self.flows = flows or FLOWS
+        self.username_field, _ = set_required_fields()
+        self.User = get_user_model()
+        # Identifiers are numbered across flows, since phone numbers are unique.
+        self.sequence = itertools.count()
+
+    def run(self):
+        return {flow: getattr(self, f"bench_{flow}")() for flow in self.flows}
+
+    def create_user(self, prefix, is_active=True):
+        data = identifiers(prefix, next(self.sequence))
+        user = self.User(is_active=is_active, **data)
+        user.set_password(PASSWORD)
+        user.save()
+        return user
+
+    def measure(self, requests):
+        """
+        Time `requests`, an iterable of `(client, method, path, data,
+        expected_status)` built lazily so preparation is not timed.
+        """
+        durations, queries, errors = [], [], 0
+        for client, method, path, data, expected in requests:
+            with record_queries() as recorder:
+                started = time.perf_counter()
+                response = getattr(client, method)(path, data)
+                durations.append(time.perf_counter() - started)
+            queries.append(recorder.count)
+            errors += response.status_code != expected
+        return summarize(
+            durations,
+            queries_per_request=round(sum(queries) / len(queries), 2) if queries else 0,
+            max_queries=max(queries, default=0),
+            errors=errors,
+        )
+
+    def bench_signup(self):
+        def requests():
+            for _ in range(self.iterations):
+                data = {
+                    **identifiers("signup", next(self.sequence)),
+                    "password1": PASSWORD,
+                    "password2": PASSWORD,
+                }
+                yield Client(), "post", "/signup/", data, 302
+
+        return self.measure(requests())
+
+    def bench_login(self):
+        user = self.create_user("login")
+        identifier = str(getattr(user, self.username_field))
+
+        def requests():
+            for _ in range(self.iterations):
+                data = {"username": identifier, "password": PASSWORD}
+                yield Client(), "post", "/login/", data, 302
+
+        return self.measure(requests())
+
+    def start_otp_login(self, client, identifier):
+        client.post("/login/otp/", {"login_field": identifier})
+
+    def bench_login_otp(self):
+        user = self.create_user("otp")
+        identifier = str(getattr(user, self.username_field))
+
+        def requests():
+            for _ in range(self.iterations):
+                OTP.objects.filter(user=user).update(state=OTPState.CONSUMED)
+                yield Client(), "post", "/login/otp/", {"login_field": identifier}, 302
+
+        return self.measure(requests())
+
+    def bench_otp_verify(self):
+        user = self.create_user("verify")
+        identifier = str(getattr(user, self.username_field))
+
+        def requests():
+            for _ in range(self.iterations):
+                client = Client()
+                self.start_otp_login(client, identifier)
+                otp = OTP.objects.filter(
+                    user=user, reason=ReasonOptions.LOGIN, state=OTPState.ACTIVE
+                ).first()
+                token = otp.token if otp else ""
+                yield client, "post", "/login/otp/verify/", {"verify_code": token}, 302
+
+        return self.measure(requests())
+
+    def bench_resend(self):
+        user = self.create_user("resend", is_active=False)
+        identifier = str(getattr(user, self.username_field))
+        if self.username_field == "phone_number":
+            reason = ReasonOptions.PHONE_NUMBER_ACTIVATION
+        else:
+            reason = ReasonOptions.EMAIL_ACTIVATION
+
+        def requests():
+            client = Client()
+            self.start_otp_login(client, identifier)
+            for _ in range(self.iterations):
+                OTP.objects.filter(user=user).update(state=OTPState.EXPIRED)
+                # Time a new issuance, not the result shared with the last one.
+                forget(issuance_key(user, reason))
+                yield client, "post", "/resend/", {}, 302
+
+        return self.measure(requests())
+
+    def bench_activate(self):
+        users = [
+            self.create_user("activate", is_active=False)
+            for _ in range(self.iterations)
+        ]
+        ts = base64.urlsafe_b64encode(str(int(time.time())).encode()).decode()
+
+        def requests():
+            for user in users:
+                uid = urlsafe_base64_encode(force_bytes(user.pk))
+                token = default_token_generator.make_token(user)
+                yield Client(), "get", f"/activate/{uid}/{token}/{ts}/", {}, 302
+
+        return self.measure(requests())
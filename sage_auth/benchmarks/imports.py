@@ -0,0 +1,103 @@
+import os
+import re
+import subprocess
+import sys
+
+PACKAGE = "sage_auth"
+DEFAULT_MODULES = ("sage_auth.utils", "sage_auth.mixins", "sage_auth.views")
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+
+
+class ImportNode:
+    """One module of an `-X importtime` report, with the modules it imported."""
+
+    def __init__(self, name, self_us, cumulative_us, depth):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+        self.children = []
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+def parse_importtime(output):
+    """
+    Build the import tree from the stderr of `python -X importtime`.
+
+    Modules are reported after the modules they import, one level of
+    indentation deeper, so a module adopts the deeper entries before it.
+    """
+    stack = []
+    for line in output.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        node = ImportNode(name, int(self_us), int(cumulative_us), len(indent) // 2)
+        while stack and stack[-1].depth > node.depth:
+            node.children.insert(0, stack.pop())
+        stack.append(node)
+    return stack
+
+
+def package_roots(roots, package=PACKAGE):
+    """Return the outermost modules of `package`, whose trees it caused."""
+    found = []
+    pending = list(roots)
+    while pending:
+        node = pending.pop(0)
+        if node.name == package or node.name.startswith(f"{package}."):
+            found.append(node)
+        else:
+            pending[:0] = node.children
+    return found
+
+
+def probe_imports(modules, settings_module):
+    """
+    Set Django up and import `modules` in a fresh interpreter with
+    `-X importtime`, and return the stderr report.
+    """
+    code = "import django; django.setup()\n" + "".join(
+        f"import {module}\n" for module in modules
+    )
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": settings_module,
+        "PYTHONPATH": os.pathsep.join(path for path in sys.path if path),
+    }
+    completed = subprocess.run(  # noqa: S603 - runs this interpreter with a fixed import snippet
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if completed.returncode:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return completed.stderr
+
+
+def measure_imports(modules, settings_module, slowest=10):
+    """
+    Measure one cold start: the total import time, the share caused by
+    `sage_auth` (its modules and everything they imported first), and the
+    modules of that share with the highest own import time.
+    """
+    roots = parse_importtime(probe_imports(modules, settings_module))
+    package = package_roots(roots)
+    nodes = [node for root in package for node in root.walk()]
+    nodes.sort(key=lambda node: node.self_us, reverse=True)
+    return {
+        "total_ms": round(sum(root.cumulative_us for root in roots) / 1000, 3),
+        "sage_auth_ms": round(sum(node.cumulative_us for node in package) / 1000, 3),
+        "modules": len(nodes),
+        "slowest": [
+            {"module": node.name, "self_ms": round(node.self_us / 1000, 3)}
+            for node in nodes[:slowest]
+        ],
+    }
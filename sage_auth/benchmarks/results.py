@@ -0,0 +1,72 @@
+import json
+import platform
+import time
+from contextlib import contextmanager
+from importlib import metadata
+
+import django
+
+
+def percentile(samples, fraction):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+def summarize(durations, **extra):
+    """
+    Reduce a list of per-operation durations (in seconds) to the figures
+    reported by every benchmark: throughput and p50/p99/max latency in
+    milliseconds.
+    """
+    samples = sorted(durations)
+    total = sum(samples)
+    summary = {
+        "operations": len(samples),
+        "throughput_per_second": round(len(samples) / total, 2) if total else 0.0,
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 4),
+        "max_ms": round(samples[-1] * 1000, 4) if samples else 0.0,
+    }
+    summary.update(extra)
+    return summary
+
+
+@contextmanager
+def timed(durations):
+    """Append the wall time of the wrapped block to `durations`."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        durations.append(time.perf_counter() - started)
+
+
+def write_results(name, results, path=None, stream=None):
+    """
+    Serialize benchmark results together with the environment they were
+    measured in, so runs from different releases can be compared.
+    """
+    try:
+        version = metadata.version("django-sage-auth")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+
+    document = {
+        "benchmark": name,
+        "sage_auth_version": version,
+        "django_version": django.get_version(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": results,
+    }
+    payload = json.dumps(document, indent=2, default=str)
+    if path:
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    if stream is not None:
+        stream.write(payload)
+    return document
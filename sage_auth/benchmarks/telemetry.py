@@ -0,0 +1,188 @@
+import bisect
+import math
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.utils import timezone
+
+from sage_auth.models import LoginAttempt
+
+USER_PREFIX = "telemetry"
+
+
+@contextmanager
+def historical_timestamps(model):
+    """
+    Let `bulk_create` keep the given values of `auto_now`/`auto_now_add`
+    fields, which otherwise overwrite them with the current time.
+    """
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.DateField) and (field.auto_now or field.auto_now_add)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield [field.attname for field in fields]
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def hourly_weights(peak_hour, amplitude):
+    """
+    Weights of the 24 hours of a day following a cosine curve that peaks
+    at `peak_hour`; `amplitude` 0 is flat, 1 leaves the opposite hour empty.
+    """
+    return [
+        1 + amplitude * math.cos(2 * math.pi * (hour - peak_hour) / 24)
+        for hour in range(24)
+    ]
+
+
+class LoginTelemetryGenerator:
+    """
+    Generate realistic `LoginAttempt` rows for benchmarking at scale.
+
+    Attempts are spread over the last `days` days with a diurnal curve
+    (`peak_hour`, `amplitude`) and quieter weekends (`weekend_factor`).
+    A few users produce most of the traffic (`user_skew`, a Zipf exponent),
+    a share of the users are staff, and `failure_ratio` of the attempts
+    fail. Rows are written in chunks with `bulk_create`, so millions of rows
+    need neither much memory nor one huge transaction.
+
+    Parameters
+    ----------
+    users : int
+        Synthetic users to create, named `telemetry-<n>`.
+    attempts : int
+        Login attempts to create.
+    days : int
+        Length of the period ending at `end`.
+    failure_ratio : float
+        Share of failed attempts.
+    staff_ratio : float
+        Share of staff users, whose successful logins count as admin logins.
+    seed : int, optional
+        Makes the data reproducible.
+
+    Examples
+    --------
+    >>> generator = LoginTelemetryGenerator(users=10_000, attempts=5_000_000, days=365)
+    >>> for written in generator.generate():
+    >>>     print(written)
+    """
+
+    def __init__(
+        self,
+        users,
+        attempts,
+        days=90,
+        failure_ratio=0.1,
+        staff_ratio=0.02,
+        peak_hour=14,
+        amplitude=0.8,
+        weekend_factor=0.5,
+        user_skew=1.1,
+        chunk_size=10_000,
+        seed=None,
+        end=None,
+    ):
+        if users < 1 or days < 1:
+            raise ValueError("At least one user and one day are required.")
+        if not 0 <= failure_ratio <= 1 or not 0 <= staff_ratio <= 1:
+            raise ValueError("Ratios must be between 0 and 1.")
+
+        self.users = users
+        self.attempts = attempts
+        self.days = days
+        self.failure_ratio = failure_ratio
+        self.staff_ratio = staff_ratio
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)  # noqa: S311 - reproducible synthetic data, not security
+        self.end = end or timezone.now()
+        self.start = self.end - timedelta(days=days)
+        self.first_day = self.start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        self.hour_weights = list(accumulate(hourly_weights(peak_hour, amplitude)))
+        weekdays = [
+            (self.first_day + timedelta(days=day)).weekday() for day in range(days + 1)
+        ]
+        self.day_weights = list(
+            accumulate(weekend_factor if weekday >= 5 else 1 for weekday in weekdays)
+        )
+        self.user_weights = list(
+            accumulate(1 / (rank + 1) ** user_skew for rank in range(users))
+        )
+
+    def create_users(self):
+        """Create the synthetic users and return their `(pk, is_staff)`."""
+        User = get_user_model()
+        taken = User.objects.filter(username__startswith=f"{USER_PREFIX}-").count()
+        staff_count = round(self.users * self.staff_ratio)
+        users = [
+            User(
+                username=f"{USER_PREFIX}-{taken + index}",
+                email=f"{USER_PREFIX}-{taken + index}@example.com",
+                password="!",  # noqa: S106 - an unusable password marker
+                is_staff=index < staff_count,
+            )
+            for index in range(self.users)
+        ]
+        created = []
+        for offset in range(0, len(users), self.chunk_size):
+            chunk = User.objects.bulk_create(users[offset:offset + self.chunk_size])
+            created.extend(chunk)
+        if any(user.pk is None for user in created):
+            # Backends without RETURNING do not set the primary keys.
+            names = [user.username for user in users]
+            created = list(User.objects.filter(username__in=names))
+        pairs = [(user.pk, user.is_staff) for user in created]
+        self.rng.shuffle(pairs)
+        return pairs
+
+    def random_timestamp(self):
+        rng = self.rng
+        while True:
+            day = bisect.bisect_left(self.day_weights, rng.random() * self.day_weights[-1])
+            hour = bisect.bisect_left(self.hour_weights, rng.random() * self.hour_weights[-1])
+            moment = self.first_day + timedelta(
+                days=day, hours=hour, seconds=rng.random() * 3600
+            )
+            # The first and last day are partial; draw again outside the period.
+            if self.start <= moment < self.end:
+                return moment
+
+    def build_attempt(self, users, timestamp_fields):
+        rng = self.rng
+        index = bisect.bisect_left(self.user_weights, rng.random() * self.user_weights[-1])
+        user_id, is_staff = users[min(index, len(users) - 1)]
+        failed = rng.random() < self.failure_ratio
+        attempt = LoginAttempt(
+            user_id=user_id,
+            total_logins=0 if failed else 1,
+            admin_logins=int(is_staff and not failed),
+            failed_attempts=1 if failed else 0,
+        )
+        timestamp = self.random_timestamp()
+        for attname in timestamp_fields:
+            setattr(attempt, attname, timestamp)
+        return attempt
+
+    def generate(self):
+        """Create the users and attempts, yielding the running row count."""
+        users = self.create_users()
+        written = 0
+        with historical_timestamps(LoginAttempt) as timestamp_fields:
+            while written < self.attempts:
+                size = min(self.chunk_size, self.attempts - written)
+                chunk = [self.build_attempt(users, timestamp_fields) for _ in range(size)]
+                LoginAttempt.objects.bulk_create(chunk)
+                written += size
+                yield written
@@ -0,0 +1,61 @@
+"""URLs of the views driven by `benchmark_auth_flows`."""
+
+from django.urls import path
+from sage_otp.helpers.choices import ReasonOptions
+
+from sage_auth.forms import OtpLoginFormMixin, SageUserFormMixin
+from sage_auth.mixins import (
+    ActivateAccountMixin,
+    LoginOtpMixin,
+    ResendMixin,
+    SageLoginMixin,
+    UserCreationMixin,
+    VerifyOtpMixin,
+)
+
+DONE_URL = "/done/"
+
+
+class SignupView(UserCreationMixin):
+    form_class = SageUserFormMixin
+    template_name = "signup.html"
+    success_url = DONE_URL
+    already_login_url = DONE_URL
+
+
+class LoginView(SageLoginMixin):
+    template_name = "login.html"
+    success_url = DONE_URL
+    reactivate_url = "/reactivate/"
+
+
+class LoginOtpView(LoginOtpMixin):
+    form_class = OtpLoginFormMixin
+    template_name = "login_otp.html"
+
+    def get_success_url(self):
+        return "/login/otp/verify/"
+
+
+class LoginOtpVerifyView(VerifyOtpMixin):
+    reason = ReasonOptions.LOGIN
+    success_url = DONE_URL
+
+
+class ResendView(ResendMixin):
+    pass
+
+
+class ActivateView(ActivateAccountMixin):
+    success_url = DONE_URL
+    register_url = "/signup/"
+
+
+urlpatterns = [
+    path("signup/", SignupView.as_view(), name="signup"),
+    path("login/", LoginView.as_view(), name="login"),
+    path("login/otp/", LoginOtpView.as_view(), name="login_otp"),
+    path("login/otp/verify/", LoginOtpVerifyView.as_view(), name="login_otp_verify"),
+    path("resend/", ResendView.as_view(), name="resend"),
+    path("activate/<uidb64>/<token>/<ts>/", ActivateView.as_view(), name="activate"),
+]
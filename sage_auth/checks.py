@@ -1,6 +1,9 @@
 from django.conf import settings
 from django.core.checks import Error, register
 
+from sage_auth.dispatch import DISPATCH_MODES
+from sage_auth.utils.flow import FLOW_BACKENDS
+
 
 @register()
 def check_authentication_methods(app_configs, **kwargs):
@@ -135,3 +138,84 @@ def check_sms_settings(app_configs, **kwargs):
                 )
 
     return errors
+
+
+@register()
+def check_user_admin_search_backend(app_configs, **kwargs):
+    errors = []
+    backend = getattr(settings, "USER_ADMIN_SEARCH_BACKEND", None)
+    if backend not in (None, "prefix", "trigram"):
+        errors.append(
+            Error(
+                f"'USER_ADMIN_SEARCH_BACKEND' has an unknown value: {backend!r}.",
+                hint="Set 'USER_ADMIN_SEARCH_BACKEND' to 'prefix', 'trigram' or None.",
+                obj=settings,
+                id="authentication.E013",
+            )
+        )
+    return errors
+
+
+@register()
+def check_flow_state_backend(app_configs, **kwargs):
+    errors = []
+    backend = getattr(settings, "AUTH_FLOW_STATE_BACKEND", "session")
+    if backend not in FLOW_BACKENDS:
+        errors.append(
+            Error(
+                f"'AUTH_FLOW_STATE_BACKEND' has an unknown value: {backend!r}.",
+                hint="Set 'AUTH_FLOW_STATE_BACKEND' to 'session' or 'signed'.",
+                obj=settings,
+                id="authentication.E014",
+            )
+        )
+    elif backend == "signed" and (
+        "sage_auth.middleware.FlowStateMiddleware" not in settings.MIDDLEWARE
+    ):
+        errors.append(
+            Error(
+                "'AUTH_FLOW_STATE_BACKEND' is 'signed' but 'FlowStateMiddleware' is not installed.",
+                hint="Add 'sage_auth.middleware.FlowStateMiddleware' to 'MIDDLEWARE'.",
+                obj=settings,
+                id="authentication.E015",
+            )
+        )
+    return errors
+
+
+@register()
+def check_signal_dispatch(app_configs, **kwargs):
+    errors = []
+    mode = getattr(settings, "AUTH_SIGNAL_DISPATCH", "sync")
+    if mode not in DISPATCH_MODES:
+        errors.append(
+            Error(
+                f"'AUTH_SIGNAL_DISPATCH' has an unknown value: {mode!r}.",
+                hint="Set 'AUTH_SIGNAL_DISPATCH' to 'sync' or 'deferred'.",
+                obj=settings,
+                id="authentication.E016",
+            )
+        )
+    return errors
+
+
+@register()
+def check_sms_router(app_configs, **kwargs):
+    errors = []
+    sms_configs = getattr(settings, "SMS_CONFIGS", None)
+    if not isinstance(sms_configs, dict):
+        return errors
+    provider = sms_configs.get("provider") or {}
+    if provider.get("NAME") != "router":
+        return errors
+    providers = provider.get("PROVIDERS") or []
+    if not providers or any(item.get("NAME") in (None, "router") for item in providers):
+        errors.append(
+            Error(
+                "The SMS router needs a non-empty 'PROVIDERS' list of named, non-router providers.",
+                hint="Set 'SMS_CONFIGS[\"provider\"][\"PROVIDERS\"]' to the provider configurations to route between.",
+                obj=settings,
+                id="authentication.E017",
+            )
+        )
+    return errors
@@ -0,0 +1,26 @@
+from django.utils.functional import SimpleLazyObject
+
+from sage_auth.models import SecurityAnnouncement
+
+
+def security_announcements(request):
+    """
+    Add the active security announcements, grouped by `GroupChoices`, to the
+    template context as `security_announcements`.
+
+    The feed is only read from the cache when a template uses it.
+
+    Usage:
+        TEMPLATES[0]["OPTIONS"]["context_processors"].append(
+            "sage_auth.context_processors.security_announcements"
+        )
+
+        {% for announcement in security_announcements.ALERT %}
+            {{ announcement.title }}
+        {% endfor %}
+    """
+    return {
+        "security_announcements": SimpleLazyObject(
+            SecurityAnnouncement.objects.cached_feed
+        )
+    }
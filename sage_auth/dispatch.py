@@ -0,0 +1,238 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.dispatch import Signal
+
+from sage_auth.helpers.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_MODES = ("sync", "deferred")
+
+
+def signal_dispatch_mode():
+    return getattr(settings, "AUTH_SIGNAL_DISPATCH", "sync")
+
+
+class SignalDispatcher:
+    """
+    Deliver queued signals on a single background thread.
+
+    Events are taken from an in-process queue in batches of up to
+    `AUTH_SIGNAL_BATCH_SIZE` (100 by default). Regular receivers get each
+    event as usual, batch receivers get all events of a batch in one call.
+    A failing receiver is logged and does not stop the others.
+
+    The queue holds at most `AUTH_SIGNAL_QUEUE_SIZE` events (10000 by
+    default). When it is full, the event is delivered inline by the sending
+    thread and counted in `sage_auth_signal_overflow_total`, so events are
+    never dropped. The thread is started again if it died, and a forked
+    process (e.g. under `gunicorn --preload`) gets its own queue and thread.
+    """
+
+    def __init__(self):
+        self.queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def batch_size(self):
+        return getattr(settings, "AUTH_SIGNAL_BATCH_SIZE", 100)
+
+    @property
+    def queue_size(self):
+        return getattr(settings, "AUTH_SIGNAL_QUEUE_SIZE", 10000)
+
+    def put(self, signal, sender, named):
+        self.start()
+        try:
+            self.queue.put_nowait((signal, sender, named))
+        except queue.Full:
+            metrics.increment("sage_auth_signal_overflow_total")
+            self.deliver([(signal, sender, named)])
+
+    def running(self):
+        return (
+            self._pid == os.getpid()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def start(self):
+        if self.running():
+            return
+        with self._lock:
+            if self.running():
+                return
+            if self._pid != os.getpid():
+                # A forked child must not share the parent's pending events.
+                self.queue = queue.Queue(maxsize=self.queue_size)
+                self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self.run, name="sage_auth-signals", daemon=True
+            )
+            self._thread.start()
+
+    def run(self):
+        while True:
+            events = [self.queue.get()]
+            while len(events) < self.batch_size:
+                try:
+                    events.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.deliver(events)
+            finally:
+                close_old_connections()
+                for _ in events:
+                    self.queue.task_done()
+
+    def deliver(self, events):
+        batches = {}
+        for signal, sender, named in events:
+            for receiver, response in signal.send_robust(sender, **named):
+                if isinstance(response, Exception):
+                    logger.error(
+                        "Receiver %r of a deferred signal failed.",
+                        receiver,
+                        exc_info=response,
+                    )
+            batches.setdefault(signal, []).append((sender, named))
+        for signal, batch in batches.items():
+            signal.send_batch(batch, robust=True)
+
+    def flush(self, timeout=None):
+        """
+        Wait until every queued event has been delivered, for at most
+        `timeout` seconds (`AUTH_SIGNAL_FLUSH_TIMEOUT`, 5 by default). Events
+        still queued then are logged and dropped, so a hung receiver cannot
+        block the process from exiting.
+        """
+        if not self.running():
+            return
+        if timeout is None:
+            timeout = getattr(settings, "AUTH_SIGNAL_FLUSH_TIMEOUT", 5)
+        deadline = time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.queue.all_tasks_done.wait(remaining)
+            else:
+                return
+        dropped = 0
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.queue.task_done()
+            dropped += 1
+        logger.warning(
+            "Deferred signals were not delivered within %ss; dropped %s queued event(s).",
+            timeout,
+            dropped,
+        )
+
+
+dispatcher = SignalDispatcher()
+atexit.register(dispatcher.flush)
+
+
+class DeferredSignal(Signal):
+    """
+    A signal that can be delivered after the response instead of inline.
+
+    With `AUTH_SIGNAL_DISPATCH = "deferred"`, `send()` queues the event once
+    the current transaction commits and a background thread delivers it, so
+    slow receivers such as audit writes or webhooks do not add to the
+    request latency. `send()` then only returns the responses of
+    synchronous receivers. With the default `"sync"` mode every receiver
+    runs inline, as with a regular `Signal`.
+
+    Receivers choose how they are called when they connect:
+
+    - `synchronous=True` always runs inline, before `send()` returns.
+    - `batch=True` is called once per batch of queued events as
+      `receiver(signal=..., events=[(sender, kwargs), ...])`, which suits
+      bulk writes. In `"sync"` mode the batch holds a single event.
+
+    Examples
+    --------
+    >>> @receiver(user_login_attempt, batch=True)
+    >>> def audit(signal, events, **kwargs):
+    >>>     AuditEntry.objects.bulk_create(AuditEntry(**kw) for _, kw in events)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.synchronous = Signal()
+        self.batch_receivers = []
+
+    def connect(
+        self, receiver, sender=None, weak=True, dispatch_uid=None,
+        synchronous=False, batch=False,
+    ):
+        if synchronous:
+            self.synchronous.connect(receiver, sender, weak, dispatch_uid)
+        elif batch:
+            with self.lock:
+                if (receiver, sender) not in self.batch_receivers:
+                    self.batch_receivers.append((receiver, sender))
+        else:
+            super().connect(receiver, sender, weak, dispatch_uid)
+
+    def disconnect(self, receiver=None, sender=None, dispatch_uid=None):
+        with self.lock:
+            batched = (receiver, sender) in self.batch_receivers
+            if batched:
+                self.batch_receivers.remove((receiver, sender))
+        disconnected = self.synchronous.disconnect(receiver, sender, dispatch_uid)
+        return super().disconnect(receiver, sender, dispatch_uid) or disconnected or batched
+
+    def has_listeners(self, sender=None):
+        return (
+            super().has_listeners(sender)
+            or self.synchronous.has_listeners(sender)
+            or bool(self.batch_receivers)
+        )
+
+    def send(self, sender, **named):
+        responses = self.synchronous.send(sender, **named)
+        if signal_dispatch_mode() == "deferred":
+            if super().has_listeners(sender) or self.batch_receivers:
+                transaction.on_commit(lambda: dispatcher.put(self, sender, named))
+            return responses
+        responses += super().send(sender, **named)
+        self.send_batch([(sender, named)])
+        return responses
+
+    def send_batch(self, events, robust=False):
+        """
+        Call the batch receivers with the events their sender filter
+        matches. With `robust=True` a failing receiver is logged instead of
+        raising.
+        """
+        for receiver, sender in list(self.batch_receivers):
+            matching = [
+                (event_sender, named)
+                for event_sender, named in events
+                if sender is None or event_sender is sender
+            ]
+            if not matching:
+                continue
+            try:
+                receiver(signal=self, events=matching)
+            except Exception:
+                if not robust:
+                    raise
+                logger.exception("Batch receiver %r of a deferred signal failed.", receiver)
@@ -1,12 +1,19 @@
 from django import forms
 from django.conf import settings
-from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.password_validation import (
+    get_default_password_validators,
+    validate_password,
+)
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, transaction
 from django.utils.translation import gettext_lazy as _
 from phonenumber_field.formfields import PhoneNumberField
 
-from sage_auth.helpers.validators import CompanyEmailValidator
+from sage_auth.helpers.validators import (
+    BreachedPasswordValidator,
+    CompanyEmailValidator,
+    DisposableEmailValidator,
+)
 from sage_auth.models import SageUser
 from sage_auth.utils import set_required_fields
 
@@ -46,6 +53,7 @@ class SageUserFormMixin(forms.ModelForm):
                 required=True, widget=forms.EmailInput(attrs={"placeholder": "Email"})
             )
             self.fields["email"].validators.append(CompanyEmailValidator())
+            self.fields["email"].validators.append(DisposableEmailValidator())
 
         elif username_field == "phone_number":
             self.fields["phone_number"] = PhoneNumberField(
@@ -66,6 +74,7 @@ class SageUserFormMixin(forms.ModelForm):
                     widget=forms.EmailInput(attrs={"placeholder": "Email"}),
                 )
                 self.fields["email"].validators.append(CompanyEmailValidator())
+                self.fields["email"].validators.append(DisposableEmailValidator())
 
             if field == "username" and "username" not in self.fields:
                 self.fields["username"] = forms.CharField(
@@ -84,11 +93,22 @@ class SageUserFormMixin(forms.ModelForm):
         self.fields["password2"] = self.fields.pop("password2")
 
     def clean_password1(self):
-        """Validate the password using Django's default password validators."""
+        """Validate the password using Django's default password validators.
+
+        The offline breached password check also runs when
+        `BREACHED_PASSWORDS_PATH` is set, unless it is already part of
+        `AUTH_PASSWORD_VALIDATORS`.
+        """
         password = self.cleaned_data.get("password1")
         if password:
+            validators = get_default_password_validators()
+            if getattr(settings, "BREACHED_PASSWORDS_PATH", None) and not any(
+                isinstance(validator, BreachedPasswordValidator)
+                for validator in validators
+            ):
+                validators = [*validators, BreachedPasswordValidator()]
             try:
-                validate_password(password)
+                validate_password(password, password_validators=validators)
             except ValidationError as e:
                 raise forms.ValidationError(e) from e
         return password
@@ -0,0 +1,163 @@
+import json
+import logging
+
+from django.conf import settings
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ALL_VAR, ORDER_VAR, ChangeList
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+logger = logging.getLogger(__name__)
+
+CURSOR_VAR = "cursor"
+
+
+def admin_performance_mode():
+    """Return whether the admin should avoid full scans on large tables."""
+    return getattr(settings, "ADMIN_PERFORMANCE_MODE", False)
+
+
+def estimate_count(queryset):
+    """
+    Return the planner's row estimate for `queryset`, or None when it is
+    not available.
+
+    On PostgreSQL an unfiltered table is estimated from `pg_class.reltuples`
+    and a filtered queryset from the top node of its `EXPLAIN` plan, both of
+    which are read from the statistics instead of scanning the table. Other
+    databases return None so the caller can fall back to `count()`.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                # `reltuples` is -1 until the table has been analyzed.
+                return row[0] if row and row[0] >= 0 else None
+
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+    except DatabaseError:
+        logger.warning("Unable to estimate the row count of %s.", queryset.model)
+        return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    A paginator that trusts the database statistics for large results.
+
+    The admin runs `COUNT(*)` over the filtered changelist on every page,
+    which scans the whole table. This paginator asks the planner for an
+    estimate first and only counts exactly when the estimate is below
+    `ADMIN_ESTIMATED_COUNT_THRESHOLD` (10000 by default), so small results
+    stay exact and large ones cost a single catalog lookup.
+    """
+
+    @cached_property
+    def count(self):
+        threshold = getattr(settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", 10000)
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < threshold:
+            return super().count
+        return estimate
+
+
+class KeysetChangeList(ChangeList):
+    """
+    A changelist that pages with a cursor instead of `OFFSET`.
+
+    With the default ordering, rows are fetched with
+    `WHERE (keyset_field, pk) < (cursor)` and a `LIMIT`, so any page costs
+    the same index range scan as the first one no matter how deep it is.
+    The model admin names the field with `keyset_field` and must order by
+    it, descending, followed by the primary key. Sorting by another column
+    or "Show all" falls back to the regular numbered pages.
+    """
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # A cursor only makes sense for the exact listing it was taken from,
+        # so filter, search and sort links always start from the first page.
+        new_params = new_params or {}
+        if CURSOR_VAR not in new_params:
+            remove = [*(remove or []), CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    @property
+    def keyset_enabled(self):
+        return ORDER_VAR not in self.params and ALL_VAR not in self.params
+
+    def get_results(self, request):
+        if not self.keyset_enabled:
+            self.next_cursor = None
+            return super().get_results(request)
+
+        field = self.model_admin.keyset_field
+        queryset = self.queryset
+        cursor = request.GET.get(CURSOR_VAR)
+        if cursor:
+            value, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(**{f"{field}__lt": value}) | Q(**{field: value, "pk__lt": pk})
+            )
+
+        rows = list(queryset[: self.list_per_page + 1])
+        result_list = rows[: self.list_per_page]
+        if len(rows) > self.list_per_page:
+            last = result_list[-1]
+            self.next_cursor = self.encode_cursor(getattr(last, field), last.pk)
+        else:
+            self.next_cursor = None
+
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        self.result_count = paginator.count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = result_list
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = paginator
+        self.is_first_page = not cursor
+
+    @staticmethod
+    def encode_cursor(value, pk):
+        return f"{value.isoformat()}_{pk}"
+
+    @staticmethod
+    def decode_cursor(cursor):
+        value, __, pk = cursor.rpartition("_")
+        try:
+            value = parse_datetime(value)
+            pk = int(pk)
+        except ValueError:
+            value = None
+        if value is None:
+            raise IncorrectLookupParameters(f"Invalid cursor: {cursor}")
+        return value, pk
+
+    def next_page_url(self):
+        return self.get_query_string({CURSOR_VAR: self.next_cursor})
+
+    def first_page_url(self):
+        return self.get_query_string()
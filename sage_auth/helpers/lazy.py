@@ -0,0 +1,31 @@
+from importlib import import_module
+
+
+def lazy_module(namespace, attributes):
+    """
+    Return the PEP 562 `__getattr__` and `__dir__` of a package whose
+    attributes are imported on first access.
+
+    `attributes` maps each name to the module defining it, absolute or
+    relative to the package. A resolved attribute is stored in `namespace`,
+    so later lookups no longer go through `__getattr__`.
+
+    Examples
+    --------
+    >>> _LAZY_ATTRIBUTES = {"FlowState": ".flow"}
+    >>> __getattr__, __dir__ = lazy_module(globals(), _LAZY_ATTRIBUTES)
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name):
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(namespace.get("__all__", attributes)))
+
+    return __getattr__, __dir__
@@ -0,0 +1,56 @@
+import mmap
+import os
+import threading
+
+
+class MappedFile:
+    """
+    Base class for read-only lookup files that are memory-mapped rather than
+    loaded into the heap.
+
+    Mapping the file lets every worker process share one copy through the OS
+    page cache and makes opening it effectively free, regardless of size.
+    Subclasses implement the lookup over `self.data`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        stat = os.fstat(self._file.fileno())
+        self.signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stat.st_size:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data = b""
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self._file.close()
+
+
+_mapped_files = {}
+_mapped_files_lock = threading.Lock()
+
+
+def get_mapped_file(cls, path):
+    """
+    Return the shared `cls` instance for `path`, reopening it when the file on
+    disk has been replaced, e.g. by a rebuild that swapped in a new version.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    key = (cls, path)
+
+    mapped = _mapped_files.get(key)
+    if mapped is not None and mapped.signature == signature:
+        return mapped
+
+    with _mapped_files_lock:
+        mapped = _mapped_files.get(key)
+        if mapped is None or mapped.signature != signature:
+            # The replaced map is left for the garbage collector because
+            # other threads may still be reading from it.
+            mapped = cls(path)
+            _mapped_files[key] = mapped
+    return mapped
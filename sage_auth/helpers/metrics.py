@@ -0,0 +1,186 @@
+import bisect
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+from django.conf import settings
+
+STAGE_SECONDS = "sage_auth_stage_seconds"
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def metrics_enabled():
+    return getattr(settings, "AUTH_METRICS_ENABLED", False)
+
+
+class _ShardOwner:
+    """Kept in a thread's local storage; collected when the thread exits."""
+
+
+def _merge(target, shard):
+    """Add the counters and histograms of `shard` to `target`."""
+    counters, histograms = target
+    for key, value in shard[0].copy().items():
+        counters[key] = counters.get(key, 0) + value
+    for key, values in shard[1].copy().items():
+        merged = histograms.setdefault(key, [0] * len(values))
+        for index, value in enumerate(list(values)):
+            merged[index] += value
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels, **extra):
+    items = list(labels) + list(extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+class MetricsRegistry:
+    """
+    An in-process registry of counters, gauges and latency histograms.
+
+    Each thread records into its own shard, so recording a value takes no
+    lock; the shards are only merged when the registry is collected, for
+    example by `metrics_view`. When a thread exits, its shard is folded
+    into a shared one, so short-lived threads do not add up. Gauges hold a single current value and are
+    shared by all threads.
+
+    Every method is a no-op unless `AUTH_METRICS_ENABLED` is True.
+
+    Parameters
+    ----------
+    buckets : tuple of float, optional
+        Upper bounds of the histogram buckets in seconds.
+
+    Examples
+    --------
+    >>> with metrics.timer(STAGE_SECONDS, flow="login", stage="user_lookup"):
+    >>>     user = User.objects.get(email=email)
+    >>> metrics.increment("sage_auth_logins_total", result="success")
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = {}
+        self._retired = ({}, {})
+        self._gauges = {}
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = ({}, {})
+            owner = _ShardOwner()
+            with self._lock:
+                self._shards[id(shard)] = shard
+            weakref.finalize(owner, self._retire, shard)
+            self._local.shard, self._local.owner = shard, owner
+        return shard
+
+    def _retire(self, shard):
+        """Fold the shard of a finished thread into the retired values."""
+        with self._lock:
+            _merge(self._retired, shard)
+            del self._shards[id(shard)]
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def increment(self, name, value=1, **labels):
+        """Add `value` to the counter `name` with `labels`."""
+        if not metrics_enabled():
+            return
+        counters = self._shard()[0]
+        key = self._key(name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration in the histogram `name` with `labels`."""
+        if not metrics_enabled():
+            return
+        histograms = self._shard()[1]
+        key = self._key(name, labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            # One slot per bucket, then +Inf, then the sum.
+            histogram = histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+
+    def set_gauge(self, name, value, **labels):
+        """Set the current value of the gauge `name` with `labels`."""
+        if not metrics_enabled():
+            return
+        self._gauges[self._key(name, labels)] = value
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Observe the wall time of the wrapped block in `name`."""
+        if not metrics_enabled():
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def collect(self):
+        """
+        Merge the thread shards and return `(counters, gauges, histograms)`,
+        each a dict keyed by `(name, labels)`. Histogram values hold the
+        per-bucket counts (not cumulative), the +Inf count and the sum.
+        """
+        merged = ({}, {})
+        with self._lock:
+            _merge(merged, self._retired)
+            shards = list(self._shards.values())
+        for shard in shards:
+            _merge(merged, shard)
+        counters, histograms = merged
+        return counters, self._gauges.copy(), histograms
+
+    def render(self):
+        """Return the collected metrics in the Prometheus text format."""
+        counters, gauges, histograms = self.collect()
+        lines = []
+        for kind, values in (("counter", counters), ("gauge", gauges)):
+            for name in sorted({name for name, _ in values}):
+                lines.append(f"# TYPE {name} {kind}")
+                for (metric, labels), value in sorted(values.items()):
+                    if metric == name:
+                        lines.append(f"{name}{_format_labels(labels)} {value}")
+        for name in sorted({name for name, _ in histograms}):
+            lines.append(f"# TYPE {name} histogram")
+            for (metric, labels), values in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), values[:-1], strict=True):
+                    cumulative += count
+                    lines.append(
+                        f"{name}_bucket{_format_labels(labels, le=bound)} {cumulative}"
+                    )
+                lines.append(f"{name}_sum{_format_labels(labels)} {values[-1]}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """Drop every recorded value."""
+        with self._lock:
+            for counters, histograms in (self._retired, *self._shards.values()):
+                counters.clear()
+                histograms.clear()
+            self._gauges.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+
+class QueryRecorder:
+    """
+    A `connection.execute_wrapper` that counts queries and keeps their total
+    time and the slowest statement.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest_sql = None
+        self.slowest_duration = 0.0
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.count += 1
+            self.duration += duration
+            self.statements.append(sql)
+            if duration >= self.slowest_duration:
+                self.slowest_duration = duration
+                self.slowest_sql = sql
+
+
+@contextmanager
+def record_queries(using=None):
+    """Record the queries run in the block on `using`, or on every database."""
+    recorder = QueryRecorder()
+    aliases = [using] if using else list(connections)
+    with _wrap(aliases, recorder):
+        yield recorder
+
+
+@contextmanager
+def _wrap(aliases, recorder):
+    if not aliases:
+        yield
+        return
+    with connections[aliases[0]].execute_wrapper(recorder):
+        with _wrap(aliases[1:], recorder):
+            yield
+
+
+class QueryProfileBuffer:
+    """
+    A bounded, thread-safe ring buffer of per-request query profiles.
+
+    Only the last `AUTH_QUERY_PROFILE_SIZE` (500 by default) requests are
+    kept, so profiling can stay on for a while without growing memory.
+    """
+
+    def __init__(self, size=None):
+        self._size = size
+        self._entries = None
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = deque(
+                        maxlen=self._size
+                        or getattr(settings, "AUTH_QUERY_PROFILE_SIZE", 500)
+                    )
+        return self._entries
+
+    def record(self, view, path, recorder):
+        self.entries.append(
+            {
+                "view": view,
+                "path": path,
+                "queries": recorder.count,
+                "duration_ms": round(recorder.duration * 1000, 3),
+                "slowest_sql": recorder.slowest_sql,
+                "slowest_ms": round(recorder.slowest_duration * 1000, 3),
+            }
+        )
+
+    def worst(self, limit=20):
+        """
+        Aggregate the buffered requests per view, the views issuing the
+        most queries first.
+        """
+        views = {}
+        for entry in list(self.entries):
+            summary = views.setdefault(
+                entry["view"],
+                {
+                    "view": entry["view"],
+                    "requests": 0,
+                    "max_queries": 0,
+                    "total_queries": 0,
+                    "total_ms": 0.0,
+                    "slowest_sql": None,
+                    "slowest_ms": 0.0,
+                },
+            )
+            summary["requests"] += 1
+            summary["total_queries"] += entry["queries"]
+            summary["total_ms"] += entry["duration_ms"]
+            summary["max_queries"] = max(summary["max_queries"], entry["queries"])
+            if entry["slowest_ms"] >= summary["slowest_ms"]:
+                summary["slowest_ms"] = entry["slowest_ms"]
+                summary["slowest_sql"] = entry["slowest_sql"]
+
+        for summary in views.values():
+            summary["avg_queries"] = round(summary["total_queries"] / summary["requests"], 2)
+            summary["avg_ms"] = round(summary["total_ms"] / summary["requests"], 3)
+        return sorted(
+            views.values(),
+            key=lambda summary: (summary["max_queries"], summary["avg_ms"]),
+            reverse=True,
+        )[:limit]
+
+    def clear(self):
+        self.entries.clear()
+
+
+query_profiles = QueryProfileBuffer()
+
+
+@contextmanager
+def assert_query_budget(budget, using=None):
+    """
+    Fail when the block runs more than `budget` queries, listing them.
+
+    Examples
+    --------
+    >>> with assert_query_budget(3):
+    >>>     client.post(reverse("login"), {"username": "...", "password": "..."})
+    """
+    with record_queries(using) as recorder:
+        yield recorder
+    if recorder.count > budget:
+        statements = "\n".join(
+            f"{index}. {sql}" for index, sql in enumerate(recorder.statements, 1)
+        )
+        raise AssertionError(
+            f"{recorder.count} queries executed, the budget is {budget}:\n{statements}"
+        )
@@ -0,0 +1,122 @@
+import re
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, migrations
+from django.db.models import Q
+
+SEARCH_BACKENDS = ("prefix", "trigram")
+SEARCH_FIELDS = ("email", "phone_number", "username")
+
+
+def user_search_backend():
+    """Return the configured `USER_ADMIN_SEARCH_BACKEND`, or None."""
+    return getattr(settings, "USER_ADMIN_SEARCH_BACKEND", None)
+
+
+def normalize_search_term(field, term):
+    """
+    Normalize a search term the way the values of `field` are stored, so a
+    prefix lookup can compare it byte for byte.
+    """
+    term = term.strip()
+    if field == "phone_number":
+        term = re.sub(r"[\s().-]", "", term)
+        if term.startswith("00"):
+            term = "+" + term[2:]
+    return term
+
+
+def prefix_search_query(fields, term):
+    """
+    Build a case-sensitive `startswith` filter over `fields`.
+
+    `LIKE 'term%'` can be answered from a `varchar_pattern_ops` index,
+    unlike the `UPPER(...) LIKE '%TERM%'` of the default admin search.
+    """
+    query = Q()
+    for field in fields:
+        value = normalize_search_term(field, term)
+        if value:
+            query |= Q(**{f"{field}__startswith": value})
+    return query
+
+
+def has_pattern_index(field):
+    """
+    Return whether Django already gives `field` a `*_like` pattern index.
+
+    On PostgreSQL, Django adds a `varchar_pattern_ops` or `text_pattern_ops`
+    index next to the regular one of every unique or indexed `varchar` or
+    `text` column.
+    """
+    db_type = field.db_type(connection)
+    return bool(
+        db_type
+        and (field.db_index or field.unique)
+        and "[" not in db_type
+        and db_type.startswith(("varchar", "text"))
+    )
+
+
+def search_index_statements(backend, concurrently=False, drop=False):
+    """
+    Return the SQL creating (or dropping) the indexes for a search backend.
+
+    The `trigram` backend indexes `UPPER(column::text)` with `gin_trgm_ops`,
+    the exact expression of Django's `icontains` lookup, so the regular
+    admin search uses it. The `prefix` backend adds `varchar_pattern_ops`
+    B-tree indexes for `LIKE 'term%'`, but only on the columns lacking
+    Django's own `*_like` index; the unique identifiers of `SageUser` all
+    have one, so it creates nothing for the default model. Dropping covers
+    every column. Both are PostgreSQL only.
+    """
+    if backend not in SEARCH_BACKENDS:
+        raise ValueError(f"Unknown search backend: {backend}")
+
+    User = get_user_model()
+    table = connection.ops.quote_name(User._meta.db_table)
+    concurrently = " CONCURRENTLY" if concurrently else ""
+    statements = []
+    if backend == "trigram" and not drop:
+        statements.append("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for field_name in SEARCH_FIELDS:
+        field = User._meta.get_field(field_name)
+        if backend == "prefix" and not drop and has_pattern_index(field):
+            continue
+        column = field.column
+        name = connection.ops.quote_name(f"{User._meta.db_table}_{column}_{backend}")
+        if drop:
+            statements.append(f"DROP INDEX{concurrently} IF EXISTS {name}")
+        elif backend == "trigram":
+            statements.append(
+                f"CREATE INDEX{concurrently} IF NOT EXISTS {name} ON {table} "
+                f"USING gin ((UPPER({connection.ops.quote_name(column)}::text)) gin_trgm_ops)"
+            )
+        else:
+            statements.append(
+                f"CREATE INDEX{concurrently} IF NOT EXISTS {name} ON {table} "
+                f"({connection.ops.quote_name(column)} varchar_pattern_ops)"
+            )
+    return statements
+
+
+def user_search_index_operations(backend):
+    """
+    Return migration operations creating the indexes for a search backend.
+
+    `sage_auth` does not ship migrations, so add these to a migration of
+    your project that depends on the `sage_auth` initial migration:
+
+    >>> from sage_auth.helpers.search import user_search_index_operations
+    >>> class Migration(migrations.Migration):
+    >>>     dependencies = [("sage_auth", "0001_initial")]
+    >>>     operations = user_search_index_operations("trigram")
+    """
+    return [
+        migrations.RunSQL(
+            sql=search_index_statements(backend),
+            reverse_sql=search_index_statements(backend, drop=True),
+        )
+    ]
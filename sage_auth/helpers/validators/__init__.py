@@ -1,5 +1,9 @@
+from .blocklist import DisposableEmailValidator
 from .email import CompanyEmailValidator
+from .password import BreachedPasswordValidator
 
 __all__ = [
+    "BreachedPasswordValidator",
     "CompanyEmailValidator",
+    "DisposableEmailValidator",
 ]
@@ -0,0 +1,109 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils.deconstruct import deconstructible
+from django.utils.translation import gettext_lazy as _
+
+from sage_auth.helpers.mapped import MappedFile, get_mapped_file
+
+
+def normalize_domain(domain):
+    """
+    Normalize a domain the same way the blocklist builder does: stripped,
+    lower-cased, without a trailing dot and IDNA encoded.
+
+    Returns `None` when the value cannot be encoded as a domain name.
+    """
+    domain = domain.strip().lower().rstrip(".")
+    if not domain:
+        return None
+    try:
+        return domain.encode("idna")
+    except UnicodeError:
+        return None
+
+
+class DomainBlocklist(MappedFile):
+    """
+    Read-only view over a sorted, newline separated domain file.
+
+    The file is memory-mapped instead of being parsed into a set, so every
+    worker process shares the same page cache and opening it costs nothing
+    up front. Lookups are a binary search over byte offsets, which keeps
+    them O(log n) no matter how many domains the list holds.
+
+    The file is produced by the `build_email_blocklist` management command
+    and must contain one normalized domain per line in byte order.
+    """
+
+    def __contains__(self, domain):
+        key = domain if isinstance(domain, bytes) else normalize_domain(domain)
+        if not key:
+            return False
+
+        data = self.data
+        low, high = 0, len(data)
+        while low < high:
+            middle = (low + high) // 2
+            start = data.rfind(b"\n", 0, middle) + 1
+            end = data.find(b"\n", start)
+            if end == -1:
+                end = len(data)
+
+            line = data[start:end]
+            if line == key:
+                return True
+            if line < key:
+                low = end + 1
+            else:
+                high = start
+        return False
+
+    def is_blocked(self, domain):
+        """
+        Check a domain and each of its parent domains against the list, so
+        `mx.mailinator.com` is rejected when `mailinator.com` is listed.
+        """
+        key = normalize_domain(domain)
+        if not key:
+            return False
+
+        labels = key.split(b".")
+        return any(b".".join(labels[i:]) in self for i in range(len(labels) - 1))
+
+
+@deconstructible
+class DisposableEmailValidator:
+    """
+    Reject email addresses whose domain appears in the blocklist file set
+    in `EMAIL_DOMAIN_BLOCKLIST_PATH`.
+
+    The validator does nothing when the setting is not defined, which makes
+    it safe to attach next to `CompanyEmailValidator` unconditionally.
+    """
+
+    message = _("Email addresses from this domain are not allowed.")
+    code = "blocked_domain"
+
+    def __init__(self, path=None, message=None, code=None):
+        self.path = path
+        if message is not None:
+            self.message = message
+        if code is not None:
+            self.code = code
+
+    def __call__(self, value):
+        path = self.path or getattr(settings, "EMAIL_DOMAIN_BLOCKLIST_PATH", None)
+        if not path or not value or "@" not in value:
+            return
+
+        domain = value.rsplit("@", 1)[-1]
+        if get_mapped_file(DomainBlocklist, path).is_blocked(domain):
+            raise ValidationError(self.message, code=self.code)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, DisposableEmailValidator)
+            and self.path == other.path
+            and self.message == other.message
+            and self.code == other.code
+        )
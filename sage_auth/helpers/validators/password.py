@@ -0,0 +1,111 @@
+import hashlib
+import struct
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from sage_auth.helpers.mapped import MappedFile, get_mapped_file
+
+DIGEST_SIZE = 20
+MAGIC = b"SAGEBPW1"
+FANOUT_ENTRIES = 1 << 16
+HEADER_SIZE = len(MAGIC) + FANOUT_ENTRIES * 8
+
+
+def password_digest(password):
+    """Return the raw SHA-1 digest used as the key in breached hash files."""
+    return hashlib.sha1(password.encode("utf-8"), usedforsecurity=False).digest()
+
+
+class BreachedHashIndex(MappedFile):
+    """
+    Memory-mapped, binary-searchable set of SHA-1 password hashes.
+
+    The file starts with an 8 byte magic followed by a fan-out table of
+    65536 little-endian uint64 values, where entry `p` is the number of
+    records whose first two bytes are `<= p`. The records that follow are the
+    sorted, de-duplicated 20 byte digests.
+
+    The fan-out table narrows every lookup to one two-byte bucket, so even a
+    list of hundreds of millions of hashes is resolved in about a dozen
+    probes touching only a few pages. Nothing is loaded into the heap.
+
+    The file is produced by the `build_breached_passwords` command.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        if len(self.data) < HEADER_SIZE or self.data[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a breached password hash file.")
+        self.count = (len(self.data) - HEADER_SIZE) // DIGEST_SIZE
+
+    def _bucket(self, prefix):
+        offset = len(MAGIC)
+        end = struct.unpack_from("<Q", self.data, offset + prefix * 8)[0]
+        start = (
+            struct.unpack_from("<Q", self.data, offset + (prefix - 1) * 8)[0]
+            if prefix
+            else 0
+        )
+        return start, end
+
+    def __contains__(self, digest):
+        data = self.data
+        low, high = self._bucket(int.from_bytes(digest[:2], "big"))
+        while low < high:
+            middle = (low + high) // 2
+            offset = HEADER_SIZE + middle * DIGEST_SIZE
+            record = data[offset : offset + DIGEST_SIZE]
+            if record == digest:
+                return True
+            if record < digest:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def __len__(self):
+        return self.count
+
+    def record(self, index):
+        """Return the digest stored at position `index`."""
+        offset = HEADER_SIZE + index * DIGEST_SIZE
+        return bytes(self.data[offset : offset + DIGEST_SIZE])
+
+    def is_breached(self, password):
+        return password_digest(password) in self
+
+
+class BreachedPasswordValidator:
+    """
+    Validate that the password does not appear in an offline list of
+    breached password hashes.
+
+    The list path comes from the `path` option or `BREACHED_PASSWORDS_PATH`
+    and the check is skipped when neither is set. It can be listed in
+    `AUTH_PASSWORD_VALIDATORS` like any other Django password validator.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+
+    def get_path(self):
+        return self.path or getattr(settings, "BREACHED_PASSWORDS_PATH", None)
+
+    def validate(self, password, user=None):
+        path = self.get_path()
+        if not path or not password:
+            return
+
+        if get_mapped_file(BreachedHashIndex, path).is_breached(password):
+            raise ValidationError(
+                _(
+                    "This password has appeared in a data breach and can not be used."
+                ),
+                code="password_breached",
+            )
+
+    def get_help_text(self):
+        return _("Your password can't be one that has appeared in a data breach.")
@@ -0,0 +1,75 @@
+"""Custom command to benchmark breached password lookups."""
+
+import os
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sage_auth.benchmarks import summarize, write_results
+from sage_auth.helpers.validators.password import BreachedHashIndex, DIGEST_SIZE
+
+
+class Command(BaseCommand):
+    """
+    Django management command for measuring lookup latency against a built
+    breached password hash file.
+
+    Hits are sampled from the file itself and misses are random digests,
+    so both paths of the binary search are exercised. The time it takes to
+    open the file is reported too, since workers pay it on first use.
+
+    Usage:
+        python manage.py benchmark_breached_passwords breached.dat --output bench.json
+    """
+
+    help = "Benchmark lookups in a breached password hash file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Compiled breached password hash file.")
+        parser.add_argument(
+            "--lookups",
+            type=int,
+            default=100_000,
+            help="Number of hit and of miss lookups to time.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="Write the JSON results to this file.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            index = BreachedHashIndex(options["path"])
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error)) from error
+        open_seconds = time.perf_counter() - started
+
+        if not len(index):
+            raise CommandError("The hash file is empty.")
+
+        # Sampling only picks lookups to time, it protects nothing.
+        rng = random.Random(options["seed"])  # noqa: S311
+        lookups = options["lookups"]
+        hits = [index.record(rng.randrange(len(index))) for _ in range(lookups)]
+        misses = [rng.randbytes(DIGEST_SIZE) for _ in range(lookups)]
+
+        results = {
+            "file_bytes": os.path.getsize(options["path"]),
+            "records": len(index),
+            "open_ms": round(open_seconds * 1000, 4),
+        }
+        for label, digests, expected in (("hit", hits, True), ("miss", misses, False)):
+            durations = []
+            unexpected = 0
+            for digest in digests:
+                started = time.perf_counter()
+                found = digest in index
+                durations.append(time.perf_counter() - started)
+                unexpected += found is not expected
+            results[label] = summarize(durations, unexpected_results=unexpected)
+
+        index.close()
+
+        write_results(
+            "breached_passwords", results, path=options["output"], stream=self.stdout
+        )
@@ -0,0 +1,78 @@
+"""Custom command to benchmark the import time of sage_auth."""
+
+import statistics
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from sage_auth.benchmarks import write_results
+from sage_auth.benchmarks.imports import DEFAULT_MODULES, measure_imports
+
+
+class Command(BaseCommand):
+    """
+    Django management command for measuring how much `sage_auth` adds to
+    the boot time of a worker or management command.
+
+    Each run starts a fresh interpreter with `-X importtime`, sets Django up
+    and imports the given modules. The time spent in `sage_auth` and the
+    modules it pulled in first is reported as the median over the runs,
+    with the modules that took longest. With `--threshold-ms` the command
+    fails when the median exceeds it, to catch import regressions in CI.
+
+    Usage:
+        python manage.py benchmark_imports --repeat 10 --output imports.json
+        python manage.py benchmark_imports --threshold-ms 150 --module sage_auth.admin
+    """
+
+    help = "Benchmark the import time of sage_auth in a fresh interpreter."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--module",
+            action="append",
+            dest="modules",
+            help="Module to import after django.setup(), can be repeated.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Cold starts to measure.",
+        )
+        parser.add_argument(
+            "--threshold-ms",
+            type=float,
+            help="Fail if the median sage_auth import time exceeds this.",
+        )
+        parser.add_argument("--output", help="Write the JSON results to this file.")
+
+    def handle(self, *args, **options):
+        modules = options["modules"] or list(DEFAULT_MODULES)
+        runs = []
+        for _ in range(max(options["repeat"], 1)):
+            try:
+                runs.append(measure_imports(modules, settings.SETTINGS_MODULE))
+            except RuntimeError as error:
+                raise CommandError(f"Importing failed: {error}") from error
+
+        timings = [run["sage_auth_ms"] for run in runs]
+        median = statistics.median(timings)
+        typical = min(runs, key=lambda run: abs(run["sage_auth_ms"] - median))
+        results = {
+            "modules": modules,
+            "runs": len(runs),
+            "sage_auth_ms": median,
+            "sage_auth_ms_runs": timings,
+            "total_ms": statistics.median(run["total_ms"] for run in runs),
+            "sage_auth_modules": typical["modules"],
+            "slowest": typical["slowest"],
+            "threshold_ms": options["threshold_ms"],
+        }
+        write_results("imports", results, path=options["output"], stream=self.stdout)
+
+        if options["threshold_ms"] is not None and median > options["threshold_ms"]:
+            raise CommandError(
+                f"sage_auth import time {median} ms exceeds the threshold of "
+                f"{options['threshold_ms']} ms."
+            )
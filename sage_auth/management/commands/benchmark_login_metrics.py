@@ -0,0 +1,64 @@
+"""Custom command to benchmark the LoginAttempt metrics queries."""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from sage_auth.benchmarks import summarize, write_results
+from sage_auth.helpers.profiler import record_queries
+from sage_auth.models import LoginAttempt
+from sage_auth.repository.queryset import LoginAttemptQuerySet
+
+METRIC_METHODS = sorted(
+    name for name in vars(LoginAttemptQuerySet) if name.endswith("_metrics")
+)
+
+
+class Command(BaseCommand):
+    """
+    Django management command for timing every `*_metrics` method of
+    `LoginAttemptQuerySet` against the current `LoginAttempt` table.
+
+    Fill the table with `generate_login_attempts` first. Each method is
+    run once to warm the caches, then timed `--repeat` times; the number of
+    queries of a run and the table size are reported with the latencies.
+
+    Usage:
+        python manage.py benchmark_login_metrics --repeat 20 --output metrics-bench.json
+        python manage.py benchmark_login_metrics --method daily_metrics
+    """
+
+    help = "Benchmark the LoginAttempt *_metrics aggregations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=10)
+        parser.add_argument(
+            "--method",
+            action="append",
+            choices=METRIC_METHODS,
+            dest="methods",
+            help="Method to time, can be repeated. Defaults to every method.",
+        )
+        parser.add_argument("--output", help="Write the JSON results to this file.")
+
+    def handle(self, *args, **options):
+        rows = LoginAttempt.objects.count()
+        if not rows:
+            raise CommandError("No login attempts. Run generate_login_attempts first.")
+
+        results = {"rows": rows, "vendor": connection.vendor}
+        for name in options["methods"] or METRIC_METHODS:
+            method = getattr(LoginAttempt.objects.all(), name)
+            method()
+            durations = []
+            with record_queries() as recorder:
+                for _ in range(options["repeat"]):
+                    started = time.perf_counter()
+                    method()
+                    durations.append(time.perf_counter() - started)
+            results[name] = summarize(
+                durations, queries=recorder.count // options["repeat"]
+            )
+
+        write_results("login_metrics", results, path=options["output"], stream=self.stdout)
@@ -0,0 +1,184 @@
+"""Custom command to build the breached password hash file."""
+
+import heapq
+import os
+import sys
+import tempfile
+from array import array
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sage_auth.helpers.validators.password import (
+    DIGEST_SIZE,
+    FANOUT_ENTRIES,
+    MAGIC,
+    password_digest,
+)
+
+READ_BLOCK_RECORDS = 8192
+
+
+def iter_run(path):
+    """Yield the 20 byte records of a sorted run file."""
+    with open(path, "rb") as handle:
+        while True:
+            block = handle.read(DIGEST_SIZE * READ_BLOCK_RECORDS)
+            if not block:
+                return
+            for offset in range(0, len(block), DIGEST_SIZE):
+                yield block[offset : offset + DIGEST_SIZE]
+
+
+class Command(BaseCommand):
+    """
+    Django management command for compiling a list of breached password hashes
+    into the memory-mapped file read by `BreachedPasswordValidator`.
+
+    The source uses the "Have I Been Pwned" SHA-1 format, one `HASH` or
+    `HASH:COUNT` per line; `--plaintext` hashes raw passwords instead. Input
+    is processed in bounded, sorted runs that are merged on disk, so lists of
+    hundreds of millions of entries build without holding them in memory.
+    Already sorted input, such as the official downloads, skips the merge.
+
+    Usage:
+        python manage.py build_breached_passwords pwned-passwords-sha1.txt breached.dat
+    """
+
+    help = "Build the breached password hash file used by BreachedPasswordValidator."
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="Text file with one SHA-1 hash per line.")
+        parser.add_argument("output", help="Path of the compiled hash file.")
+        parser.add_argument(
+            "--min-count",
+            type=int,
+            default=0,
+            help="Skip hashes seen fewer times than this in breaches.",
+        )
+        parser.add_argument(
+            "--plaintext",
+            action="store_true",
+            help="Treat each line as a plain password and hash it.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5_000_000,
+            help="Number of hashes sorted in memory per run.",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        directory = os.path.dirname(os.path.abspath(output))
+
+        with tempfile.TemporaryDirectory(dir=directory) as work_dir:
+            runs, is_sorted, skipped = self.write_runs(options, work_dir)
+            if is_sorted:
+                records = (record for run in runs for record in iter_run(run))
+            else:
+                records = heapq.merge(*(iter_run(run) for run in runs))
+
+            temp_path = os.path.join(work_dir, "output.tmp")
+            total = self.write_index(records, temp_path)
+            os.chmod(temp_path, 0o644)  # noqa: S103
+            os.replace(temp_path, output)
+
+        if skipped:
+            self.show_error_msg(f"Skipped {skipped} invalid line(s).")
+        self.show_success_msg(f"Wrote {total} hash(es) to {output}.")
+
+    def parse_line(self, line, options):
+        if options["plaintext"]:
+            password = line.rstrip("\r\n")
+            return password_digest(password) if password else None
+
+        value, __, count = line.strip().partition(":")
+        if options["min_count"] and count and int(count) < options["min_count"]:
+            return b""
+        if len(value) != DIGEST_SIZE * 2:
+            return None
+        return bytes.fromhex(value)
+
+    @staticmethod
+    def flush_run(chunk, runs, work_dir):
+        """Sort `chunk` into the next run file and empty it."""
+        chunk.sort()
+        path = os.path.join(work_dir, f"run-{len(runs):05d}")
+        with open(path, "wb") as handle:
+            handle.write(b"".join(chunk))
+        runs.append(path)
+        chunk.clear()
+
+    def write_runs(self, options, work_dir):
+        """Split the source into sorted run files of at most `chunk_size` hashes."""
+        runs, chunk = [], []
+        is_sorted, previous, skipped = True, b"", 0
+
+        try:
+            with open(options["source"], encoding="utf-8", errors="replace") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        digest = self.parse_line(line, options)
+                    except ValueError:
+                        digest = None
+                    if digest is None:
+                        skipped += 1
+                        continue
+                    if not digest:
+                        continue
+
+                    if digest < previous:
+                        is_sorted = False
+                    previous = digest
+                    chunk.append(digest)
+                    if len(chunk) >= options["chunk_size"]:
+                        self.flush_run(chunk, runs, work_dir)
+        except OSError as error:
+            raise CommandError(f"Unable to read '{options['source']}': {error}") from error
+
+        if chunk:
+            self.flush_run(chunk, runs, work_dir)
+        return runs, is_sorted, skipped
+
+    def write_index(self, records, path):
+        """Write the header, fan-out table and de-duplicated records."""
+        counts = array("Q", bytes(FANOUT_ENTRIES * 8))
+        total, previous = 0, None
+
+        with open(path, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(counts.tobytes())
+
+            buffer = []
+            for record in records:
+                if record == previous:
+                    continue
+                previous = record
+                counts[int.from_bytes(record[:2], "big")] += 1
+                buffer.append(record)
+                total += 1
+                if len(buffer) >= READ_BLOCK_RECORDS:
+                    handle.write(b"".join(buffer))
+                    buffer.clear()
+            handle.write(b"".join(buffer))
+
+            running = 0
+            for prefix in range(FANOUT_ENTRIES):
+                running += counts[prefix]
+                counts[prefix] = running
+            if sys.byteorder != "little":
+                counts.byteswap()
+            handle.seek(len(MAGIC))
+            handle.write(counts.tobytes())
+
+        return total
+
+    def show_success_msg(self, msg):
+        """Displays a success message on the console."""
+        self.stdout.write(self.style.SUCCESS(msg))
+
+    def show_error_msg(self, msg):
+        """Displays an error message on the console."""
+        self.stdout.write(self.style.ERROR(msg))
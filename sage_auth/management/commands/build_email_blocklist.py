@@ -0,0 +1,71 @@
+"""Custom command to build the disposable email domain blocklist file."""
+
+import os
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sage_auth.helpers.validators.blocklist import normalize_domain
+
+
+class Command(BaseCommand):
+    """
+    Django management command for compiling a plain text domain list into the
+    sorted file read by `DisposableEmailValidator`.
+
+    The source may contain one domain per line, blank lines and `#` comments.
+    The output is written to a temporary file and atomically moved into place,
+    so running workers pick up the new list without ever seeing a partial one.
+
+    Usage:
+        python manage.py build_email_blocklist domains.txt /var/lib/app/blocklist.dat
+    """
+
+    help = "Build the sorted email domain blocklist used by DisposableEmailValidator."
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="Plain text file with one domain per line.")
+        parser.add_argument("output", help="Path of the compiled blocklist file.")
+
+    def handle(self, *args, **options):
+        source, output = options["source"], options["output"]
+
+        domains = set()
+        skipped = 0
+        try:
+            with open(source, encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.split("#", 1)[0]
+                    if not line.strip():
+                        continue
+                    domain = normalize_domain(line)
+                    if domain is None or b"\n" in domain:
+                        skipped += 1
+                        continue
+                    domains.add(domain)
+        except OSError as error:
+            raise CommandError(f"Unable to read '{source}': {error}") from error
+
+        directory = os.path.dirname(os.path.abspath(output))
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                for domain in sorted(domains):
+                    handle.write(domain + b"\n")
+            os.chmod(temp_path, 0o644)  # noqa: S103
+            os.replace(temp_path, output)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        if skipped:
+            self.show_error_msg(f"Skipped {skipped} invalid domain(s).")
+        self.show_success_msg(f"Wrote {len(domains)} domain(s) to {output}.")
+
+    def show_success_msg(self, msg):
+        """Displays a success message on the console."""
+        self.stdout.write(self.style.SUCCESS(msg))
+
+    def show_error_msg(self, msg):
+        """Displays an error message on the console."""
+        self.stdout.write(self.style.ERROR(msg))
@@ -0,0 +1,78 @@
+"""Custom command to create the indexes used by the user admin search."""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection
+
+from sage_auth.helpers.search import (
+    SEARCH_BACKENDS,
+    search_index_statements,
+    user_search_backend,
+)
+
+
+class Command(BaseCommand):
+    """
+    Django management command for creating the PostgreSQL indexes behind
+    `USER_ADMIN_SEARCH_BACKEND`.
+
+    The indexes are built with `CREATE INDEX CONCURRENTLY`, so the user table
+    stays writable while they are built. To manage them with migrations
+    instead, use `sage_auth.helpers.search.user_search_index_operations`.
+
+    Usage:
+        python manage.py create_user_search_indexes --backend trigram
+        python manage.py create_user_search_indexes --backend prefix --drop
+    """
+
+    help = "Create the PostgreSQL indexes used by the user admin search backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backend",
+            choices=SEARCH_BACKENDS,
+            help="Search backend, defaults to USER_ADMIN_SEARCH_BACKEND.",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="Drop the indexes instead of creating them.",
+        )
+        parser.add_argument(
+            "--print",
+            action="store_true",
+            dest="print_only",
+            help="Print the SQL without running it.",
+        )
+
+    def handle(self, *args, **options):
+        backend = options["backend"] or user_search_backend()
+        if backend not in SEARCH_BACKENDS:
+            raise CommandError("Pass --backend or set USER_ADMIN_SEARCH_BACKEND.")
+
+        statements = search_index_statements(
+            backend, concurrently=True, drop=options["drop"]
+        )
+        if not statements:
+            self.stdout.write("Django's pattern indexes already cover every search field.")
+            return
+        if options["print_only"]:
+            for statement in statements:
+                self.stdout.write(f"{statement};")
+            return
+
+        if connection.vendor != "postgresql":
+            raise CommandError("Search indexes are only supported on PostgreSQL.")
+
+        # CONCURRENTLY cannot run inside a transaction block; each statement
+        # is executed on its own in autocommit mode.
+        for statement in statements:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(statement)
+            except DatabaseError as error:
+                raise CommandError(f"'{statement}' failed: {error}") from error
+            self.show_success_msg(statement)
+
+    def show_success_msg(self, msg):
+        """Displays a success message on the console."""
+        self.stdout.write(self.style.SUCCESS(msg))
@@ -0,0 +1,75 @@
+"""Custom command to stream login attempts as CSV or NDJSON."""
+
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from sage_auth.repository.services.login_export import (
+    EXPORT_FORMATS,
+    LoginAttemptExporter,
+)
+
+
+def parse_moment(value):
+    """Parse an ISO date or datetime argument into an aware datetime."""
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f"Invalid date: '{value}'.")
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class Command(BaseCommand):
+    """
+    Django management command for exporting login attempts for offline
+    analysis.
+
+    Rows are streamed from a server-side cursor and written as they arrive,
+    so memory stays constant no matter how many rows are exported.
+
+    Usage:
+        python manage.py export_login_attempts --since 2024-01-01 --format ndjson > attempts.ndjson
+    """
+
+    help = "Stream login attempts as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument("--since", help="Export attempts at or after this date.")
+        parser.add_argument("--until", help="Export attempts before this date.")
+        parser.add_argument("--user", type=int, help="Only export this user id.")
+        parser.add_argument("--chunk-size", type=int, default=None)
+        parser.add_argument("--output", help="Write to this file instead of stdout.")
+
+    def handle(self, *args, **options):
+        exporter = LoginAttemptExporter(
+            start=parse_moment(options["since"]) if options["since"] else None,
+            end=parse_moment(options["until"]) if options["until"] else None,
+            user=options["user"],
+            chunk_size=options["chunk_size"],
+        )
+        lines = exporter.lines(options["format"])
+
+        if not options["output"]:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        count = 0
+        with open(options["output"], "w", encoding="utf-8", newline="") as handle:
+            for line in lines:
+                handle.write(line)
+                count += 1
+        if options["format"] == "csv":
+            count -= 1
+        self.show_success_msg(f"Exported {count} login attempt(s).")
+
+    def show_success_msg(self, msg):
+        """Displays a success message on the console."""
+        self.stdout.write(self.style.SUCCESS(msg))
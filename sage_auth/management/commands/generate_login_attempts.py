@@ -0,0 +1,84 @@
+"""Custom command to generate synthetic login attempts for benchmarking."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sage_auth.benchmarks.telemetry import LoginTelemetryGenerator
+
+
+class Command(BaseCommand):
+    """
+    Django management command for filling `LoginAttempt` with realistic
+    synthetic telemetry.
+
+    Users named `telemetry-<n>` are created first, then the attempts are
+    spread over the period with a diurnal curve, quieter weekends, a few
+    very active users and the given failure ratio. Only run it against a
+    database meant for benchmarking.
+
+    Usage:
+        python manage.py generate_login_attempts --users 10000 --attempts 5000000 --days 365
+        python manage.py generate_login_attempts --attempts 100000 --failure-ratio 0.3 --seed 1
+    """
+
+    help = "Generate synthetic login attempts for benchmarking."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--attempts", type=int, default=1_000_000)
+        parser.add_argument("--days", type=int, default=90)
+        parser.add_argument("--failure-ratio", type=float, default=0.1)
+        parser.add_argument(
+            "--staff-ratio",
+            type=float,
+            default=0.02,
+            help="Share of staff users, whose logins count as admin logins.",
+        )
+        parser.add_argument("--peak-hour", type=int, default=14)
+        parser.add_argument(
+            "--amplitude",
+            type=float,
+            default=0.8,
+            help="Strength of the daily curve, 0 (flat) to 1.",
+        )
+        parser.add_argument(
+            "--weekend-factor",
+            type=float,
+            default=0.5,
+            help="Weekend traffic relative to weekdays.",
+        )
+        parser.add_argument(
+            "--user-skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of the attempts per user, 0 spreads them evenly.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=10_000)
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            generator = LoginTelemetryGenerator(
+                users=options["users"],
+                attempts=options["attempts"],
+                days=options["days"],
+                failure_ratio=options["failure_ratio"],
+                staff_ratio=options["staff_ratio"],
+                peak_hour=options["peak_hour"],
+                amplitude=options["amplitude"],
+                weekend_factor=options["weekend_factor"],
+                user_skew=options["user_skew"],
+                chunk_size=options["chunk_size"],
+                seed=options["seed"],
+            )
+        except ValueError as error:
+            raise CommandError(str(error)) from error
+
+        for written in generator.generate():
+            self.stdout.write(f"{written}/{options['attempts']} login attempts written.")
+        self.show_success_msg(
+            f"Generated {options['attempts']} login attempts for {options['users']} users."
+        )
+
+    def show_success_msg(self, msg):
+        """Displays a success message on the console."""
+        self.stdout.write(self.style.SUCCESS(msg))
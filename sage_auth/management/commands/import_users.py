@@ -0,0 +1,106 @@
+"""Custom command to create users in bulk from a CSV or NDJSON file."""
+
+import json
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from sage_auth.repository.services.user_import import read_csv_rows, read_ndjson_rows
+
+READERS = {"csv": read_csv_rows, "ndjson": read_ndjson_rows}
+
+
+class Command(BaseCommand):
+    """
+    Django management command for bulk user creation.
+
+    Rows are streamed from the file, so its size is not limited by memory.
+    CSV files need a header line; NDJSON files hold one JSON object per line.
+    Recognized columns are `email`, `phone_number`, `username`, `password`,
+    `first_name`, `last_name`, `is_active`, `is_staff` and `is_superuser`.
+
+    Usage:
+        python manage.py import_users users.csv --batch-size 2000 --workers 8 --errors errors.ndjson
+    """
+
+    help = "Create users in bulk from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=sorted(READERS),
+            help="Input format, detected from the file extension by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Password hashing processes, defaults to the number of CPUs.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Passwords sent to a hashing process per task.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without creating any user.",
+        )
+        parser.add_argument(
+            "--errors",
+            help="Write the per-row errors to this file as NDJSON.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        input_format = options["format"]
+        if input_format is None:
+            if path.endswith((".ndjson", ".jsonl")):
+                input_format = "ndjson"
+            elif path.endswith(".csv"):
+                input_format = "csv"
+            else:
+                raise CommandError("Unable to detect the format, pass --format.")
+
+        try:
+            stream = (
+                sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+            )
+        except OSError as error:
+            raise CommandError(f"Unable to read '{path}': {error}") from error
+
+        with stream:
+            report = get_user_model().objects.bulk_import(
+                READERS[input_format](stream),
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+                workers=options["workers"],
+                chunk_size=options["chunk_size"],
+            )
+
+        if options["errors"]:
+            with open(options["errors"], "w", encoding="utf-8") as handle:
+                for error in report.errors:
+                    handle.write(json.dumps(error) + "\n")
+        else:
+            for error in report.errors:
+                self.show_error_msg(f"Row {error['row']}: {error['errors']}")
+
+        verb = "Validated" if options["dry_run"] else "Created"
+        self.show_success_msg(
+            f"{verb} {report.created} of {report.total} user(s), "
+            f"{report.failed} row(s) rejected."
+        )
+
+    def show_success_msg(self, msg):
+        """Displays a success message on the console."""
+        self.stdout.write(self.style.SUCCESS(msg))
+
+    def show_error_msg(self, msg):
+        """Displays an error message on the console."""
+        self.stdout.write(self.style.ERROR(msg))
@@ -76,6 +76,17 @@ class AuthUserManager(BaseUserManager):
         extra_fields.setdefault("is_superuser", True)
         return self.create_user(**extra_fields)
 
+    def bulk_import(self, rows, **options):
+        """Create users in batches from `(row_number, row)` pairs.
+
+        See `UserImportService` for the validation, hashing and insert
+        pipeline and the accepted options. Returns a `BulkImportReport` with
+        per-row errors.
+        """
+        from sage_auth.repository.services.user_import import UserImportService
+
+        return UserImportService(**options).import_rows(rows)
+
     def authenticate_user(self, user_data):
         """Authenticate a user using the dynamic strategy."""
         strategy = self.get_authentication_strategies(user_data)
@@ -0,0 +1,79 @@
+from django.conf import settings
+
+from sage_auth.helpers.profiler import query_profiles, record_queries
+from sage_auth.utils.flow import SignedFlowState, flow_state_ttl
+
+
+class FlowStateMiddleware:
+    """
+    Write the signed OTP flow state cookie when the flow changed.
+
+    Required when `AUTH_FLOW_STATE_BACKEND = "signed"`. The cookie is only
+    touched on responses whose request updated the flow state, and it is
+    deleted once the flow is cleared.
+
+    Usage:
+        MIDDLEWARE = [
+            ...
+            "sage_auth.middleware.FlowStateMiddleware",
+        ]
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        flow = getattr(request, "sage_auth_flow", None)
+        if isinstance(flow, SignedFlowState) and flow.modified:
+            name = SignedFlowState.cookie_name()
+            if flow.session:
+                response.set_cookie(
+                    name,
+                    flow.token(),
+                    max_age=flow_state_ttl(),
+                    secure=settings.SESSION_COOKIE_SECURE,
+                    httponly=True,
+                    samesite=settings.SESSION_COOKIE_SAMESITE,
+                )
+            else:
+                response.delete_cookie(name, samesite=settings.SESSION_COOKIE_SAMESITE)
+        return response
+
+
+class QueryProfilerMiddleware:
+    """
+    Record the queries of every request served by a `sage_auth` view.
+
+    For each request to a view built on the `sage_auth` mixins, the number
+    of queries, their total time and the slowest statement are kept in a
+    bounded ring buffer, shown by the "Query profiles" page of the
+    `Login Attempt` admin. Other views are not recorded.
+
+    Usage:
+        MIDDLEWARE = [
+            "sage_auth.middleware.QueryProfilerMiddleware",
+            ...
+        ]
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        view = self.auth_view_name(request)
+        if view is not None:
+            query_profiles.record(view, request.path, recorder)
+        return response
+
+    @staticmethod
+    def auth_view_name(request):
+        match = getattr(request, "resolver_match", None)
+        view_class = getattr(match and match.func, "view_class", None)
+        if view_class is None:
+            return None
+        if any(base.__module__.startswith("sage_auth.") for base in view_class.__mro__):
+            return f"{view_class.__module__}.{view_class.__qualname__}"
+        return None
@@ -1,17 +1,26 @@
-from .activate import ActivateAccountMixin
-from .email import EmailMixin
-from .login import LoginOtpMixin, LoginOtpVerifyMixin, SageLoginMixin
-from .otp import VerifyOtpMixin
-from .password import (
-    ForgetPasswordConfirmMixin,
-    ForgetPasswordDoneMixin,
-    ForgetPasswordMixin,
-)
-from .phone import PhoneOtpMixin
-from .reactivate import ReactivationMixin
-from .signup import UserCreationMixin
-from .resend import ResendMixin
+from sage_auth.helpers.lazy import lazy_module
+
+# Resolved on first access (PEP 562): a view importing one mixin does not
+# load the modules, forms and services of all the others.
+_LAZY_ATTRIBUTES = {
+    "ActivateAccountMixin": ".activate",
+    "EmailMixin": ".email",
+    "LoginOtpMixin": ".login",
+    "LoginOtpVerifyMixin": ".login",
+    "SageLoginMixin": ".login",
+    "OtpIssuanceMixin": ".otp",
+    "VerifyOtpMixin": ".otp",
+    "ForgetPasswordConfirmMixin": ".password",
+    "ForgetPasswordDoneMixin": ".password",
+    "ForgetPasswordMixin": ".password",
+    "PhoneOtpMixin": ".phone",
+    "ReactivationMixin": ".reactivate",
+    "UserCreationMixin": ".signup",
+    "ResendMixin": ".resend",
+}
+
 __all__ = [
+    "OtpIssuanceMixin",
     "VerifyOtpMixin",
     "ForgetPasswordMixin",
     "ForgetPasswordDoneMixin",
@@ -26,3 +35,6 @@ __all__ = [
     "ActivateAccountMixin",
     "ResendMixin"
 ]
+
+
+__getattr__, __dir__ = lazy_module(globals(), _LAZY_ATTRIBUTES)
@@ -10,22 +10,31 @@ from django.core.exceptions import ImproperlyConfigured
 from sage_auth.utils.email_sender import ActivationEmailSender
 from django.utils import timezone as django_timezone
 from django.conf import settings
+from django.core.cache import cache
 from django.contrib.auth.tokens import default_token_generator
 from django.http import HttpResponse
 import base64
+import re
 
 from sage_auth.signals import activation_failed, user_activated
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# `PasswordResetTokenGenerator` tokens are "<base36 timestamp>-<hex digest>".
+TOKEN_PATTERN = re.compile(r"^[0-9a-z]{1,13}-[0-9a-f]{20,64}$")
+RESEND_KEY_PREFIX = "sage_auth:activation-resend:"
+
+
 class ActivateAccountMixin(View):
     """
     Mixin to handle user account activation via token-based links.
 
     This class provides the `get` method to verify the token and activate
-    the user's account if the token is valid. If the token has expired,
-    a new activation email is sent to the user.
+    the user's account if the token is valid. Malformed and expired links
+    are rejected before the database is queried. If the token has expired,
+    a new activation email is sent in the background, at most once per
+    `ACTIVATION_RESEND_COOLDOWN` seconds for each user.
     """
 
     success_url = None
@@ -50,49 +59,93 @@ class ActivateAccountMixin(View):
             )
         return super().dispatch(request, *args, **kwargs)
 
+    def parse_link(self, uidb64, token, ts):
+        """
+        Decode and validate the activation link without touching the
+        database.
+
+        Returns the user id and the link timestamp, or raises `ValueError`
+        when the uid, timestamp or token is malformed.
+        """
+        uid = int(force_str(urlsafe_base64_decode(uidb64)))
+        timestamp = int(base64.urlsafe_b64decode(ts).decode())
+        if uid <= 0 or timestamp <= 0:
+            raise ValueError("Activation link has an invalid uid or timestamp.")
+        if not TOKEN_PATTERN.match(token):
+            raise ValueError("Activation link has a malformed token.")
+        return uid, timestamp
+
+    def link_expired(self, timestamp):
+        expire = getattr(settings, "ACTIVATION_LINK_EXPIRY_MINUTES", 1)
+        expiry_duration = timedelta(minutes=expire)
+        return django_timezone.now() - django_timezone.datetime.fromtimestamp(
+            timestamp, tz=timezone.utc
+        ) > expiry_duration
+
+    def resend_activation(self, uid, request):
+        """
+        Send a new activation email in the background, at most once per
+        user within `ACTIVATION_RESEND_COOLDOWN` seconds.
+
+        Within the cooldown the user is not even loaded, so replayed or
+        crawled expired links cost neither a query nor an email.
+        """
+        cooldown = getattr(settings, "ACTIVATION_RESEND_COOLDOWN", 300)
+        if not cache.add(f"{RESEND_KEY_PREFIX}{uid}", 1, cooldown):
+            logger.info("Activation email for user %s was sent recently.", uid)
+            return
+        user = User.objects.filter(id=uid, is_active=False).first()
+        if user is None:
+            return
+        logger.warning(
+            "Activation link expired for user %s. Sending a new email.",
+            user.email
+        )
+        ActivationEmailSender().send_activation_email(user, request, asynchronous=True)
+        activation_failed.send(sender=self.__class__, user=user, reason="Link expired")
+
+    def invalid_link(self, request):
+        messages.error(
+            request, "The activation link is invalid or has expired."
+        )
+        return redirect(self.register_url)
+
     def get(self, request, uidb64, token, ts):
         try:
-            uid = force_str(urlsafe_base64_decode(uidb64))
-            user = User.objects.get(id=uid)
-            timestamp = int(base64.urlsafe_b64decode(ts).decode())
-            expire = getattr(settings, "ACTIVATION_LINK_EXPIRY_MINUTES", 1)
-            expiry_duration = timedelta(minutes=expire)
-
-            if django_timezone.now() - django_timezone.datetime.fromtimestamp(
-                timestamp, tz=timezone.utc
-            ) > expiry_duration:
-                logger.warning(
-                    "Activation link expired for user %s. Sending a new email.", 
-                    user.email
-                )
-                ActivationEmailSender().send_activation_email(user, request)
-                activation_failed.send(sender=self.__class__, user=user, reason="Link expired")
-                return HttpResponse(
-                    "The activation link expired. A new activation email has been sent."
-                )
-
-            if default_token_generator.check_token(user, token):
-                user.is_active = True
-                user.save()
-                logger.info("User %s has been successfully activated.", user.email)
-
-                # Trigger user_activated signal
-                user_activated.send(sender=self.__class__, user=user)
-
-                messages.success(
-                    request,
-                    "Your account has been activated successfully. You can now log in."
-                )
-                return redirect(self.success_url)
-            else:
-                logger.warning(
-                    "Invalid activation token for user %s.",
-                    user.email
-                )
-                activation_failed.send(sender=self.__class__, user=user, reason="Invalid token")
+            uid, timestamp = self.parse_link(uidb64, token, ts)
         except (ValueError, OverflowError) as e:
             logger.error("Error in activation link processing: %s", e)
-            messages.error(
-                request, "The activation link is invalid or has expired."
+            return self.invalid_link(request)
+
+        if self.link_expired(timestamp):
+            self.resend_activation(uid, request)
+            return HttpResponse(
+                "The activation link expired. A new activation email has been sent."
             )
-            return redirect(self.register_url)
+
+        try:
+            user = User.objects.get(id=uid)
+        except User.DoesNotExist:
+            logger.error("Activation link for unknown user %s.", uid)
+            return self.invalid_link(request)
+
+        if default_token_generator.check_token(user, token):
+            user.is_active = True
+            user.save()
+            logger.info("User %s has been successfully activated.", user.email)
+
+            # Trigger user_activated signal
+            user_activated.send(sender=self.__class__, user=user)
+
+            messages.success(
+                request,
+                "Your account has been activated successfully. You can now log in."
+            )
+            return redirect(self.success_url)
+
+        logger.warning(
+            "Invalid activation token for user %s.",
+            user.email
+        )
+        activation_failed.send(sender=self.__class__, user=user, reason="Invalid token")
+        return self.invalid_link(request)
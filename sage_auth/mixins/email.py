@@ -5,7 +5,11 @@ from django.utils.translation import gettext_lazy as _
 from sage_otp.helpers.choices import ReasonOptions
 from sage_otp.repository.managers.otp import OTPManager
 
+from sage_auth.helpers.metrics import STAGE_SECONDS, metrics
+from sage_auth.mixins.phone import PhoneOtpMixin
 from sage_auth.utils import send_email_otp
+from sage_auth.utils.delivery import OtpDeliveryPolicy
+from sage_auth.utils.scheduler import delivery_scheduler
 from sage_auth.signals import otp_generated
 
 logger = logging.getLogger(__name__)
@@ -24,10 +28,14 @@ class EmailMixin:
 
     otp_manager = OTPManager()
 
-    def send_otp(self, otp, email):
-        send_email_otp(otp, email)
+    def send_otp(self, otp, email, reason=ReasonOptions.EMAIL_ACTIVATION):
+        with delivery_scheduler.slot(reason), metrics.timer(
+            STAGE_SECONDS, flow="otp_email", stage="delivery"
+        ):
+            send_email_otp(otp, email)
+        metrics.increment("sage_auth_otp_sent_total", channel="email")
         otp_generated.send(
-            sender=self.__class__, user=None, method="email", reason=ReasonOptions.EMAIL_ACTIVATION, otp=otp
+            sender=self.__class__, user=None, method="email", reason=reason, otp=otp
         )
         logger.debug("OTP sent to email: %s", email)
 
@@ -35,14 +43,27 @@ class EmailMixin:
         """Generate and send OTP if email is the USERNAME_FIELD."""
         logger.debug("Generating OTP for user ID: %s, reason: %s", user.id, reason)
 
-        otp_data = self.otp_manager.get_or_create_otp(identifier=user.id, reason=reason)
+        with metrics.timer(STAGE_SECONDS, flow="otp_email", stage="otp_db"):
+            otp_data = self.otp_manager.get_or_create_otp(identifier=user.id, reason=reason)
 
-        self.send_otp(otp_data[0].token, user.email)
-        logger.debug("Sending OTP to email: %s", user.email)
-
-        messages.info(
-            self.request, _(f"Verification code was sent to your email: {user.email}")
+        policy = OtpDeliveryPolicy(
+            {
+                "email": lambda otp, email: self.send_otp(otp, email, reason),
+                "phone": lambda otp, phone: PhoneOtpMixin().send_otp(otp, phone, reason),
+            }
         )
+        channel = policy.deliver(user, otp_data[0].token, "email", reason)
+        logger.debug("Sending OTP to %s of user ID: %s", channel, user.id)
+
+        if channel == "phone":
+            messages.info(
+                self.request,
+                _(f"Verification code was sent to your phone number: {user.phone_number}"),
+            )
+        else:
+            messages.info(
+                self.request, _(f"Verification code was sent to your email: {user.email}")
+            )
         return user.email
 
     def form_valid(self, user, reason=ReasonOptions.EMAIL_ACTIVATION):
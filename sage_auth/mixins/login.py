@@ -11,10 +11,12 @@ from django.utils.translation import gettext_lazy as _
 from django.views.generic import FormView, TemplateView
 
 from sage_otp.helpers.choices import ReasonOptions
+from sage_auth.helpers.metrics import STAGE_SECONDS, metrics
 from sage_auth.mixins.email import EmailMixin
 from sage_auth.mixins.otp import VerifyOtpMixin
 from sage_auth.mixins.phone import PhoneOtpMixin
-from sage_auth.utils import set_required_fields
+from sage_auth.utils import FlowState, set_required_fields
+from sage_auth.utils.flow import STEP_VERIFY
 from sage_auth.signals import (
     user_login_attempt,
     user_login_failed,
@@ -36,10 +38,10 @@ class LoginOtpMixin(FormView, EmailMixin):
         user = self.get_user(identifier)
 
         if user:
-            self.request.session["email"] = identifier
             self.send_otp_based_on_strategy(user)
-            self.request.session.save()
-            self.request.session["spa"] = True
+            FlowState.from_request(self.request).update(
+                email=identifier, user_id=user.pk, spa=True, step=STEP_VERIFY
+            )
 
             # Trigger user_otp_sent signal
             user_otp_sent.send(
@@ -55,11 +57,12 @@ class LoginOtpMixin(FormView, EmailMixin):
             return redirect(self.get_success_url())
 
     def get_user(self, identifier):
-        if settings.AUTHENTICATION_METHODS.get("EMAIL_PASSWORD"):
-            return User.objects.filter(email=identifier).first()
-        if settings.AUTHENTICATION_METHODS.get("PHONE_PASSWORD"):
-            return User.objects.filter(phone_number=identifier).first()
-        return None
+        with metrics.timer(STAGE_SECONDS, flow="login_otp", stage="user_lookup"):
+            if settings.AUTHENTICATION_METHODS.get("EMAIL_PASSWORD"):
+                return User.objects.filter(email=identifier).first()
+            if settings.AUTHENTICATION_METHODS.get("PHONE_PASSWORD"):
+                return User.objects.filter(phone_number=identifier).first()
+            return None
 
     def send_otp_based_on_strategy(self, user):
         if settings.AUTHENTICATION_METHODS.get("EMAIL_PASSWORD"):
@@ -77,11 +80,12 @@ class LoginOtpVerifyMixin(VerifyOtpMixin, TemplateView):
     success_url = None
 
     def post(self, request, *args, **kwargs):
-        self.request.session["reason"] = ReasonOptions.LOGIN
+        flow = FlowState.from_request(self.request)
+        flow.update(reason=ReasonOptions.LOGIN)
         response = super().post(request, *args, **kwargs)
 
         user = self.get_user()  # Assume `get_user` retrieves the user object based on session or form data
-        identifier = self.request.session.get("email")
+        identifier = flow.get("email")
         otp_success = self.verify_otp(user)  # Custom method to validate OTP
 
         # Trigger user_otp_verified signal
@@ -105,20 +109,33 @@ class SageLoginMixin(LoginView):
             raise ImproperlyConfigured("The 'reactivate_url' attribute must be set.")
         return super().dispatch(request, *args, **kwargs)
 
+    def post(self, request, *args, **kwargs):
+        with metrics.timer(STAGE_SECONDS, flow="login", stage="total"):
+            return super().post(request, *args, **kwargs)
+
     def form_invalid(self, form):
+        metrics.increment("sage_auth_logins_total", result="failure")
         identifier = form.cleaned_data.get("username")
         password = form.cleaned_data.get("password")
         username_field, __ = set_required_fields()
 
-        try:
-            user = User.objects.get(**{username_field: identifier})
-            if not check_password(password, user.password):
-                user_login_attempt.send(sender=self.__class__, user=user, identifier=identifier, success=False)
-                messages.error(self.request, _("Invalid username or password. Please try again."))
-                return super().form_invalid(form)
-        except User.DoesNotExist:
+        credentials = getattr(self.request, "sage_auth_credentials", None)
+        if credentials is None:
+            # Without SageModelBackend, check the credentials here.
+            try:
+                user = User.objects.get(**{username_field: identifier})
+                password_matches = check_password(password, user.password)
+            except User.DoesNotExist:
+                user, password_matches = None, False
+        else:
+            user, password_matches = credentials
+
+        if user is None:
             messages.error(self.request, _("Invalid username or password. Please try again."))
-            user = None
+        elif not password_matches:
+            user_login_attempt.send(sender=self.__class__, user=user, identifier=identifier, success=False)
+            messages.error(self.request, _("Invalid username or password. Please try again."))
+            return super().form_invalid(form)
 
         if user is not None:
             if user.is_block:
@@ -132,7 +149,9 @@ class SageLoginMixin(LoginView):
                     self.request,
                     _("Your account is not activated. Please check your phone number or email."),
                 )
-                self.request.session["email"] = identifier
+                FlowState.from_request(self.request).update(
+                    email=identifier, user_id=user.pk
+                )
                 user_login_attempt.send(sender=self.__class__, user=user, identifier=identifier, success=False)
                 return redirect(self.reactivate_url)
             else:
@@ -143,6 +162,7 @@ class SageLoginMixin(LoginView):
 
 
     def form_valid(self, form):
+        metrics.increment("sage_auth_logins_total", result="success")
         response = super().form_valid(form)
         user = self.request.user
         identifier = form.cleaned_data.get("username")
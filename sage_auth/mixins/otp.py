@@ -6,8 +6,44 @@ from django.contrib import messages
 from django.shortcuts import redirect, render
 from django.utils.translation import gettext_lazy as _
 
-from sage_otp.helpers.choices import ReasonOptions
+from sage_otp.helpers.choices import OTPState, ReasonOptions
+from sage_otp.helpers.exceptions import OTPDoesNotExists
 from sage_auth.repository.services import OTPVerificationService
+from sage_auth.utils import FlowState
+from sage_auth.utils.single_flight import issuance_key, single_flight
+
+
+class OtpIssuanceMixin:
+    """
+    Issue a new OTP or activation link unless an active OTP exists.
+
+    Views using it provide `otp_manager`, `reason` and
+    `create_new_otp_or_activation_link(user, request)`.
+    """
+
+    def issue_otp(self, user, request):
+        """
+        Send a new OTP or activation link unless an active OTP exists, and
+        return `"active"` or `"sent"`.
+        """
+        try:
+            otp_instance = self.otp_manager.get_otp(identifier=user.id, reason=self.reason)
+            if otp_instance.state == OTPState.ACTIVE:
+                return "active"
+        except OTPDoesNotExists:
+            pass
+        self.create_new_otp_or_activation_link(user, request)
+        return "sent"
+
+    def issue_otp_once(self, user, request):
+        """
+        Run `issue_otp` once for concurrent requests of the same user and
+        reason through `single_flight`, which returns `PENDING` to a request
+        that gave up waiting for the result.
+        """
+        return single_flight(
+            issuance_key(user, self.reason), lambda: self.issue_otp(user, request)
+        )
 
 
 class VerifyOtpMixin(View):
@@ -15,7 +51,7 @@ class VerifyOtpMixin(View):
     success_url = None
 
     def dispatch(self, request, *args, **kwargs):
-        self.user_identifier = request.session.get("email")
+        self.user_identifier = FlowState.from_request(request).get("email")
         self.service = OTPVerificationService(request, self.user_identifier, self.reason)
         user = self.service.get_user_by_identifier()
 
@@ -14,7 +14,8 @@ from sage_otp.helpers.choices import ReasonOptions
 
 from sage_auth.mixins import EmailMixin, VerifyOtpMixin
 from sage_auth.mixins.phone import PhoneOtpMixin
-from sage_auth.utils import set_required_fields
+from sage_auth.utils import FlowState, set_required_fields
+from sage_auth.utils.flow import STEP_RESET, STEP_VERIFY
 
 logger = logging.getLogger(__name__)
 
@@ -41,11 +42,14 @@ class ForgetPasswordMixin(FormView, EmailMixin):
         user = self.get_user(identifier)
 
         if user:
-            self.request.session["email"] = identifier
             self.send_otp_based_on_strategy(user)
-            self.request.session["spa"] = True
-            self.request.session["reason"] = ReasonOptions.FORGET_PASSWORD
-            self.request.session.save()
+            FlowState.from_request(self.request).update(
+                email=identifier,
+                user_id=user.pk,
+                spa=True,
+                reason=ReasonOptions.FORGET_PASSWORD,
+                step=STEP_VERIFY,
+            )
 
             return redirect(self.get_success_url())
         else:
@@ -94,8 +98,9 @@ class ForgetPasswordConfirmMixin(VerifyOtpMixin, TemplateView):
         return super().dispatch(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
-        self.request.session["changing_password"] = True
-        self.request.session["reason"] = ReasonOptions.FORGET_PASSWORD
+        FlowState.from_request(self.request).update(
+            changing_password=True, reason=ReasonOptions.FORGET_PASSWORD, step=STEP_RESET
+        )
         return super().post(request, *args, **kwargs)
 
 
@@ -117,7 +122,8 @@ class ForgetPasswordDoneMixin(FormView):
     def dispatch(self, request, *args, **kwargs):
         if not self.no_access_url:
             raise ImproperlyConfigured("The 'no_access_url' attribute must be set.")
-        if not request.session.get("changing_password"):
+        flow = FlowState.from_request(request)
+        if not flow.get("changing_password") or flow.get("step") != STEP_RESET:
             logger.warning(
                 "Attempt to access password reset confirm view without changing password."
             )
@@ -128,16 +134,21 @@ class ForgetPasswordDoneMixin(FormView):
         if form_class is None:
             form_class = self.get_form_class()
 
-        identify = self.request.session.get("email")
-        username_field, _ = set_required_fields()
-
-        user = User.objects.get(**{username_field: identify})
+        flow = FlowState.from_request(self.request)
+        user_id = flow.get("user_id")
+        if user_id is not None:
+            user = User.objects.get(pk=user_id)
+        else:
+            identify = flow.get("email")
+            username_field, _ = set_required_fields()
+            user = User.objects.get(**{username_field: identify})
 
         return form_class(user, **self.get_form_kwargs())
 
     def form_valid(self, form):
         form.save()
-        del self.request.session["changing_password"]
+        # The reset is done: end the flow so its state cannot be used again.
+        FlowState.from_request(self.request).clear()
         messages.success(
             self.request,
             _(
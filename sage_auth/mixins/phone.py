@@ -3,7 +3,10 @@ import logging
 from sage_otp.helpers.choices import ReasonOptions
 from sage_otp.repository.managers.otp import OTPManager
 
+from sage_auth.helpers.metrics import STAGE_SECONDS, metrics
 from sage_auth.utils import get_backends
+from sage_auth.utils.delivery import OtpDeliveryPolicy
+from sage_auth.utils.scheduler import delivery_scheduler
 from sage_auth.signals import otp_generated
 
 logger = logging.getLogger(__name__)
@@ -22,19 +25,38 @@ class PhoneOtpMixin:
 
     otp_manager = OTPManager()
 
-    def send_otp(self, otp, phone):
+    def send_otp(self, otp, phone, reason=None):
         logger.info("Attempting to send OTP to phone: %s", phone)
-        obj = get_backends()
-        obj.send_one_message(phone, otp)
+        reason = reason or getattr(self, "reason", None)
+        with delivery_scheduler.slot(reason), metrics.timer(
+            STAGE_SECONDS, flow="otp_phone", stage="delivery"
+        ):
+            obj = get_backends()
+            obj.send_one_message(phone, otp)
+        metrics.increment("sage_auth_otp_sent_total", channel="phone")
         otp_generated.send(
-            sender=self.__class__, user=None, method="phone", reason=self.reason, otp=otp
+            sender=self.__class__,
+            user=None,
+            method="phone",
+            reason=reason,
+            otp=otp,
         )
 
     def handle_otp(self, user, reason):
         """Generate and send OTP."""
         logger.debug("Generating OTP for user: %s with reason: %s", user.id, reason)
-        otp_data = self.otp_manager.get_or_create_otp(identifier=user.id, reason=reason)
-        self.send_otp(otp_data[0].token, str(user.phone_number))
+        with metrics.timer(STAGE_SECONDS, flow="otp_phone", stage="otp_db"):
+            otp_data = self.otp_manager.get_or_create_otp(identifier=user.id, reason=reason)
+        # Imported here since `sage_auth.mixins.email` imports this module.
+        from sage_auth.mixins.email import EmailMixin
+
+        policy = OtpDeliveryPolicy(
+            {
+                "phone": lambda otp, phone: self.send_otp(otp, phone, reason),
+                "email": lambda otp, email: EmailMixin().send_otp(otp, email, reason),
+            }
+        )
+        policy.deliver(user, otp_data[0].token, "phone", reason)
         return str(user.phone_number)
 
     def send_sms_otp(self, user, reason=ReasonOptions.PHONE_NUMBER_ACTIVATION):
@@ -7,20 +7,21 @@ from django.http import HttpResponse
 from django.shortcuts import redirect
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import TemplateView
-from sage_otp.helpers.choices import OTPState, ReasonOptions
-from sage_otp.helpers.exceptions import OTPDoesNotExists
+from sage_otp.helpers.choices import ReasonOptions
 from sage_otp.repository.managers.otp import OTPManager
 
 from sage_auth.mixins import EmailMixin, VerifyOtpMixin
+from sage_auth.mixins.otp import OtpIssuanceMixin
 from sage_auth.mixins.phone import PhoneOtpMixin
 from sage_auth.models import SageUser
-from sage_auth.utils import ActivationEmailSender, set_required_fields
+from sage_auth.utils import ActivationEmailSender, FlowState, set_required_fields
+from sage_auth.utils.single_flight import PENDING
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
-class ReactivationMixin(TemplateView, EmailMixin, VerifyOtpMixin):
+class ReactivationMixin(OtpIssuanceMixin, TemplateView, EmailMixin, VerifyOtpMixin):
     """
     Mixin to handle account reactivation requests by generating a new OTP or
     activation link for the user, if an active OTP does not already exist.
@@ -38,7 +39,7 @@ class ReactivationMixin(TemplateView, EmailMixin, VerifyOtpMixin):
     reactivate_process = True
 
     def setup(self, request, *args, **kwargs):
-        self.user_identifier = request.session.get("email")
+        self.user_identifier = FlowState.from_request(request).get("email")
         logger.debug("User identifier set to: %s", self.user_identifier)
 
         return super().setup(request, *args, **kwargs)
@@ -52,25 +53,20 @@ class ReactivationMixin(TemplateView, EmailMixin, VerifyOtpMixin):
 
             if username_field == "phone_number":
                 self.reason = ReasonOptions.PHONE_NUMBER_ACTIVATION
-            try:
-                otp_instance = self.otp_manager.get_otp(
-                    identifier=user.id, reason=self.reason
+            outcome = self.issue_otp_once(user, request)
+            if outcome == "active":
+                messages.info(
+                    request,
+                    _(
+                        "An active OTP already exists. Please check your phone for the verification code."
+                    ),
                 )
-
-                if otp_instance.state == OTPState.ACTIVE:
-                    messages.info(
-                        request,
-                        _(
-                            "An active OTP already exists. Please check your phone for the verification code."
-                        ),
-                    )
-                    logger.info("Active OTP exists for user: %s", user)
-
-                else:
-                    self.create_new_otp_or_activation_link(user, request)
-
-            except OTPDoesNotExists:
-                self.create_new_otp_or_activation_link(user, request)
+                logger.info("Active OTP exists for user: %s", user)
+            elif outcome == PENDING:
+                messages.info(
+                    request, _("A verification code is being sent. Please wait a moment.")
+                )
+                logger.info("OTP issuance still in progress for user: %s", user)
 
             return super().get(request, *args, **kwargs)
 
@@ -82,8 +78,9 @@ class ReactivationMixin(TemplateView, EmailMixin, VerifyOtpMixin):
     def create_new_otp_or_activation_link(self, user, request):
         if settings.SEND_OTP:
             self.email = self.send_otp_based_on_strategy(user)
-            self.request.session["email"] = self.email
-            self.request.session.save()
+            FlowState.from_request(self.request).update(
+                email=self.email, user_id=user.pk
+            )
 
         elif settings.USER_ACCOUNT_ACTIVATION_ENABLED:
             ActivationEmailSender().send_activation_email(user, request)
@@ -95,7 +92,7 @@ class ReactivationMixin(TemplateView, EmailMixin, VerifyOtpMixin):
             return HttpResponse("Activation link sent to your email address")
 
     def get_success_url(self):
-        self.request.session["spa"] = True
+        FlowState.from_request(self.request).update(spa=True)
         if not self.success_url:
             logger.error("The success_url attribute is not set.")
             raise ValueError("The success_url attribute is not set.")
@@ -109,5 +106,7 @@ class ReactivationMixin(TemplateView, EmailMixin, VerifyOtpMixin):
         if settings.AUTHENTICATION_METHODS.get("PHONE_PASSWORD"):
             logger.info("Sending phone-based OTP to user: %s", user)
             sms_obj = PhoneOtpMixin()
-            self.request.session["reason"] = ReasonOptions.PHONE_NUMBER_ACTIVATION
+            FlowState.from_request(self.request).update(
+                reason=ReasonOptions.PHONE_NUMBER_ACTIVATION
+            )
             return sms_obj.send_sms_otp(user)
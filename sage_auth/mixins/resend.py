@@ -6,19 +6,20 @@ from django.shortcuts import redirect
 from django.core.exceptions import PermissionDenied
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import View
-from sage_otp.helpers.choices import OTPState, ReasonOptions
-from sage_otp.helpers.exceptions import OTPDoesNotExists
+from sage_otp.helpers.choices import ReasonOptions
 from sage_otp.repository.managers.otp import OTPManager
 
 from sage_auth.mixins import EmailMixin, VerifyOtpMixin
+from sage_auth.mixins.otp import OtpIssuanceMixin
 from sage_auth.mixins.phone import PhoneOtpMixin
 from sage_auth.models import SageUser
-from sage_auth.utils import ActivationEmailSender, set_required_fields
+from sage_auth.utils import ActivationEmailSender, FlowState, set_required_fields
+from sage_auth.utils.single_flight import PENDING
 
 User = get_user_model()
 
 
-class ResendJsonMixin(View, EmailMixin):
+class ResendJsonMixin(OtpIssuanceMixin, View, EmailMixin):
     """
     Mixin to handle account reactivation requests by generating a new OTP or
     activation link for the user, if an active OTP does not already exist.
@@ -33,10 +34,11 @@ class ResendJsonMixin(View, EmailMixin):
     reason = ReasonOptions.EMAIL_ACTIVATION
 
     def setup(self, request, *args, **kwargs):
-        self.user_identifier = request.session.get("email")
+        flow = FlowState.from_request(request)
+        self.user_identifier = flow.get("email")
         if self.user_identifier is None:
             raise PermissionDenied("You have been blocked")
-        self.reason = request.session.get("reason", ReasonOptions.EMAIL_ACTIVATION)
+        self.reason = flow.get("reason", ReasonOptions.EMAIL_ACTIVATION)
         return super().setup(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
@@ -47,18 +49,12 @@ class ResendJsonMixin(View, EmailMixin):
             if self.reason == ReasonOptions.EMAIL_ACTIVATION:
                 if username_field == "phone_number":
                     self.reason = ReasonOptions.PHONE_NUMBER_ACTIVATION
-            try:
-                otp_instance = self.otp_manager.get_otp(
-                    identifier=user.id, reason=self.reason
-                )
-
-                if otp_instance.state == OTPState.ACTIVE:
-                    message = _("An active OTP already exists. Please check your phone for the verification code.")
-                else:
-                    self.create_new_otp_or_activation_link(user, request)
-                    message = _("OTP has been resent successfully.")
-            except OTPDoesNotExists:
-                self.create_new_otp_or_activation_link(user, request)
+            outcome = self.issue_otp_once(user, request)
+            if outcome == "active":
+                message = _("An active OTP already exists. Please check your phone for the verification code.")
+            elif outcome == PENDING:
+                message = _("A verification code is being sent. Please wait a moment.")
+            else:
                 message = _("OTP has been resent successfully.")
 
             response = {"status": "success", "message": message}
@@ -77,8 +73,9 @@ class ResendJsonMixin(View, EmailMixin):
     def create_new_otp_or_activation_link(self, user, request):
         if settings.SEND_OTP:
             self.email = self.send_otp_based_on_strategy(user)
-            self.request.session["email"] = self.email
-            self.request.session.save()
+            FlowState.from_request(self.request).update(
+                email=self.email, user_id=user.pk
+            )
         elif settings.USER_ACCOUNT_ACTIVATION_ENABLED:
             ActivationEmailSender().send_activation_email(user, request)
 
@@ -87,11 +84,13 @@ class ResendJsonMixin(View, EmailMixin):
             return EmailMixin.form_valid(self, user,self.reason)
         if settings.AUTHENTICATION_METHODS.get("PHONE_PASSWORD"):
             sms_obj = PhoneOtpMixin()
-            self.request.session["reason"] = ReasonOptions.PHONE_NUMBER_ACTIVATION
+            FlowState.from_request(self.request).update(
+                reason=ReasonOptions.PHONE_NUMBER_ACTIVATION
+            )
             return sms_obj.send_sms_otp(user)
 
 
-class ResendMixin(View,EmailMixin):
+class ResendMixin(OtpIssuanceMixin, View, EmailMixin):
     """
     Mixin for handling resend requests for OTP or activation links.
     """
@@ -100,10 +99,11 @@ class ResendMixin(View,EmailMixin):
     reason = ReasonOptions.EMAIL_ACTIVATION
 
     def setup(self, request, *args, **kwargs):
-        self.user_identifier = request.session.get("email")
+        flow = FlowState.from_request(request)
+        self.user_identifier = flow.get("email")
         if not self.user_identifier:
             raise PermissionDenied("You have been blocked")
-        self.reason = request.session.get("reason", ReasonOptions.EMAIL_ACTIVATION)
+        self.reason = flow.get("reason", ReasonOptions.EMAIL_ACTIVATION)
         return super().setup(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
@@ -114,23 +114,19 @@ class ResendMixin(View,EmailMixin):
             if self.reason == ReasonOptions.EMAIL_ACTIVATION:
                 if username_field == "phone_number":
                     self.reason = ReasonOptions.PHONE_NUMBER_ACTIVATION
-            try:
-                otp_instance = self.otp_manager.get_otp(
-                    identifier=user.id, reason=self.reason
+            outcome = self.issue_otp_once(user, request)
+            if outcome == "active":
+                messages.info(
+                    request,
+                    _(
+                        "An active OTP already exists. Please check your phone for the verification code."
+                    ),
                 )
-
-                if otp_instance.state == OTPState.ACTIVE:
-                    messages.info(
-                        request,
-                        _(
-                            "An active OTP already exists. Please check your phone for the verification code."
-                        ),
-                    )
-                else:
-                    self.create_new_otp_or_activation_link(user, request)
-
-            except OTPDoesNotExists:
-                self.create_new_otp_or_activation_link(user, request)
+            elif outcome == PENDING:
+                messages.info(
+                    request, _("A verification code is being sent. Please wait a moment.")
+                )
+            else:
                 messages.success(request, _("OTP has been resent successfully."))
         except SageUser.DoesNotExist:
             messages.error(request, _("No user found with this email."))
@@ -140,8 +136,9 @@ class ResendMixin(View,EmailMixin):
     def create_new_otp_or_activation_link(self, user, request):
         if settings.SEND_OTP:
             self.email = self.send_otp_based_on_strategy(user)
-            self.request.session["email"] = self.email
-            self.request.session.save()
+            FlowState.from_request(self.request).update(
+                email=self.email, user_id=user.pk
+            )
         elif settings.USER_ACCOUNT_ACTIVATION_ENABLED:
             ActivationEmailSender().send_activation_email(user, request)
             messages.success(
@@ -11,7 +11,8 @@ from sage_otp.helpers.choices import ReasonOptions
 
 from sage_auth.mixins.email import EmailMixin
 from sage_auth.mixins.phone import PhoneOtpMixin
-from sage_auth.utils import ActivationEmailSender
+from sage_auth.utils import ActivationEmailSender, FlowState
+from sage_auth.utils.flow import STEP_VERIFY
 from sage_auth.signals import user_registered
 
 logger = logging.getLogger(__name__)
@@ -54,10 +55,13 @@ class UserCreationMixin(CreateView, EmailMixin):
 
         if settings.SEND_OTP:
             self.email = self.send_otp_based_on_strategy(user)
-            self.request.session["email"] = self.email
-            self.request.session["spa"] = True
-            self.request.session["reason"] = ReasonOptions.EMAIL_ACTIVATION
-            self.request.session.save()
+            FlowState.from_request(self.request).update(
+                email=self.email,
+                user_id=user.pk,
+                spa=True,
+                reason=ReasonOptions.EMAIL_ACTIVATION,
+                step=STEP_VERIFY,
+            )
 
         elif settings.USER_ACCOUNT_ACTIVATION_ENABLED:
             user.is_active = False
@@ -82,7 +86,9 @@ class UserCreationMixin(CreateView, EmailMixin):
             return EmailMixin.form_valid(self, user)
         if settings.AUTHENTICATION_METHODS.get("PHONE_PASSWORD"):
             sms_obj = PhoneOtpMixin()
-            self.request.session["reason"] = ReasonOptions.PHONE_NUMBER_ACTIVATION
+            FlowState.from_request(self.request).update(
+                reason=ReasonOptions.PHONE_NUMBER_ACTIVATION
+            )
             messages.info(
                 self.request, f"OTP sent to your phone number: {user.phone_number}"
             )
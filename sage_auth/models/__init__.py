@@ -1,4 +1,4 @@
-from .security import LoginAttempt, SecurityAnnouncement
+from .security import LoginAttempt, LoginSummary, SecurityAnnouncement
 from .user import SageUser
 
-__all__ = ["SageUser", "LoginAttempt", "SecurityAnnouncement"]
+__all__ = ["SageUser", "LoginAttempt", "LoginSummary", "SecurityAnnouncement"]
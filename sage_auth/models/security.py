@@ -4,7 +4,13 @@ from django.utils.translation import gettext_lazy as _
 from sage_tools.mixins.models import TimeStampMixin
 
 from sage_auth.helpers.choices import GroupChoices
-from sage_auth.repository import LoginAttemptManager
+from sage_auth.repository import (
+    LoginAttemptManager,
+    LoginSummaryManager,
+    SecurityAnnouncementManager,
+)
+
+from .user import SageUser
 
 
 class LoginAttempt(TimeStampMixin):
@@ -73,10 +79,31 @@ class LoginAttempt(TimeStampMixin):
     class Meta:
         verbose_name = _("Login Attempt")
         verbose_name_plural = _("Login Attempt")
-        indexes = [models.Index(fields=["user"], name="idx_security_user")]
+        indexes = [
+            models.Index(fields=["user", "-timestamp"], name="idx_security_user"),
+            models.Index(fields=["-timestamp", "-id"], name="idx_security_timestamp"),
+        ]
         db_table_comment = "Tracks security-related metrics such as login counts and failed attempts for users."
 
 
+class LoginSummary(SageUser):
+    """
+    A read-only proxy of the user model with one row per user that has
+    login attempts, annotated with their total, admin and failed logins and
+    the time of their last attempt.
+    """
+
+    objects = LoginSummaryManager()
+
+    def __str__(self):
+        return f"Login Summary for {super().__str__()}"
+
+    class Meta:
+        proxy = True
+        verbose_name = _("Login Summary")
+        verbose_name_plural = _("Login Summaries")
+
+
 class SecurityAnnouncement(TimeStampMixin):
     """
     Model representing a security announcement or alert for users,
@@ -153,6 +180,7 @@ class SecurityAnnouncement(TimeStampMixin):
         ),
         db_comment="Optional location details for the announcement.",
     )
+    objects = SecurityAnnouncementManager()
 
     def __str__(self):
         return f"{self.title} ({self.date})" if self.date else self.title
@@ -1,3 +1,7 @@
-from .manager import LoginAttemptManager
+from .manager import (
+    LoginAttemptManager,
+    LoginSummaryManager,
+    SecurityAnnouncementManager,
+)
 
-__all__ = ['LoginAttemptManager']
\ No newline at end of file
+__all__ = ['LoginAttemptManager', 'LoginSummaryManager', 'SecurityAnnouncementManager']
\ No newline at end of file
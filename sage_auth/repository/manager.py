@@ -1,5 +1,24 @@
-from django.db import models
-from .queryset import  LoginAttemptQuerySet
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models import Count, Max, Sum
+
+from sage_auth.helpers.choices import GroupChoices
+from .queryset import  LoginAttemptQuerySet, SecurityAnnouncementQuerySet
+
+ANNOUNCEMENT_FEED_KEY = "sage_auth:security_announcements"
+
+
+def announcement_cache():
+    return caches[getattr(settings, "ANNOUNCEMENT_CACHE_ALIAS", "default")]
+
+
+def invalidate_announcement_feed():
+    """
+    Drop the cached announcement feed once the current transaction commits,
+    so a concurrent request cannot cache the rows from before the change.
+    """
+    transaction.on_commit(lambda: announcement_cache().delete(ANNOUNCEMENT_FEED_KEY))
 
 
 class LoginAttemptManager(models.Manager):
@@ -40,4 +59,66 @@ class LoginAttemptManager(models.Manager):
         """
         Aggregate metrics for the last year.
         """
-        return self.get_queryset().yearly_metrics()
\ No newline at end of file
+        return self.get_queryset().yearly_metrics()
+
+
+class LoginSummaryManager(models.Manager):
+    """
+    Manager for the per-user login summary.
+
+    Every user with at least one login attempt is returned once, annotated
+    with the totals of all their `LoginAttempt` rows. The rows are grouped
+    in a single `GROUP BY` query over the `(user, timestamp)` index, so
+    filtering and ordering on the annotations run in the database.
+    """
+
+    def get_queryset(self):
+        # Filtering before annotating makes both use the same inner join.
+        return (
+            super()
+            .get_queryset()
+            .filter(security__isnull=False)
+            .annotate(
+                attempts=Count("security"),
+                total_logins=Sum("security__total_logins"),
+                admin_logins=Sum("security__admin_logins"),
+                failed_attempts=Sum("security__failed_attempts"),
+                last_attempt=Max("security__timestamp"),
+            )
+        )
+
+
+class SecurityAnnouncementManager(models.Manager):
+    def get_queryset(self):
+        return SecurityAnnouncementQuerySet(self.model, using=self._db)
+
+    def active(self):
+        """
+        Active announcements, newest first.
+        """
+        return self.get_queryset().active()
+
+    def cached_feed(self):
+        """
+        The active announcements grouped by `GroupChoices`, e.g.
+        `{"ALERT": [...], "GUIDELINE": [...]}`.
+
+        The feed is read from the cache and only queried again after an
+        announcement is saved, deleted or bulk updated, so rendering it
+        costs no query in the common case.
+        """
+        cache = announcement_cache()
+        feed = cache.get(ANNOUNCEMENT_FEED_KEY)
+        if feed is None:
+            feed = {group: [] for group in GroupChoices.values}
+            for announcement in self.active():
+                feed.setdefault(announcement.group, []).append(announcement)
+            cache.set(
+                ANNOUNCEMENT_FEED_KEY,
+                feed,
+                getattr(settings, "ANNOUNCEMENT_CACHE_TIMEOUT", 3600),
+            )
+        return feed
+
+    def invalidate_feed(self):
+        invalidate_announcement_feed()
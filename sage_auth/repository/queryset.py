@@ -186,3 +186,22 @@ class LoginAttemptQuerySet(models.QuerySet):
             "years": [data['year'] for data in yearly_data],
             "totals": [data["total_attempts"] for data in yearly_data],
         }
+
+
+class SecurityAnnouncementQuerySet(models.QuerySet):
+    def active(self):
+        """
+        Active announcements, newest first.
+        """
+        return self.filter(is_active=True).order_by('-date', 'title')
+
+    def update(self, **kwargs):
+        """
+        Update the rows and drop the cached feed, since bulk updates do not
+        send `post_save`.
+        """
+        from sage_auth.repository.manager import invalidate_announcement_feed
+
+        rows = super().update(**kwargs)
+        invalidate_announcement_feed()
+        return rows
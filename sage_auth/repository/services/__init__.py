@@ -1 +1,24 @@
-from .token_verification import OTPVerificationService
\ No newline at end of file
+from sage_auth.helpers.lazy import lazy_module
+
+# Resolved on first access (PEP 562): loading one service, as the models do
+# for the login export, does not import the others and their dependencies.
+_LAZY_ATTRIBUTES = {
+    "LoginAttemptExporter": ".login_export",
+    "OTPVerificationService": ".token_verification",
+    "BulkImportReport": ".user_import",
+    "UserImportService": ".user_import",
+    "read_csv_rows": ".user_import",
+    "read_ndjson_rows": ".user_import",
+}
+
+__all__ = [
+    "OTPVerificationService",
+    "LoginAttemptExporter",
+    "BulkImportReport",
+    "UserImportService",
+    "read_csv_rows",
+    "read_ndjson_rows",
+]
+
+
+__getattr__, __dir__ = lazy_module(globals(), _LAZY_ATTRIBUTES)
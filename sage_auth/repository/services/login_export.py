@@ -0,0 +1,94 @@
+import csv
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from sage_auth.models import LoginAttempt
+
+EXPORT_FIELDS = (
+    "id",
+    "user_id",
+    "timestamp",
+    "total_logins",
+    "admin_logins",
+    "failed_attempts",
+)
+EXPORT_FORMATS = ("csv", "ndjson")
+CONTENT_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+class Echo:
+    """A file-like object that returns what is written instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+class LoginAttemptExporter:
+    """
+    Stream `LoginAttempt` rows as CSV or NDJSON lines.
+
+    Rows are read with `iterator(chunk_size=...)`, which uses a server-side
+    cursor on PostgreSQL, and are formatted one at a time, so the memory
+    used does not depend on how many rows are exported. Only the columns in
+    `EXPORT_FIELDS` are fetched, without instantiating models.
+
+    Parameters
+    ----------
+    queryset : QuerySet, optional
+        The attempts to export, all of them by default.
+    start, end : datetime, optional
+        Only export attempts with `start <= timestamp < end`.
+    user : int, optional
+        Only export the attempts of this user id.
+    chunk_size : int, optional
+        Rows fetched per round trip, defaults to the `LOGIN_EXPORT_CHUNK_SIZE`
+        setting or 2000.
+
+    Examples
+    --------
+    >>> exporter = LoginAttemptExporter(start=since)
+    >>> for line in exporter.lines("ndjson"):
+    >>>     stream.write(line)
+    """
+
+    def __init__(self, queryset=None, start=None, end=None, user=None, chunk_size=None):
+        if queryset is None:
+            queryset = LoginAttempt.objects.all()
+        if start is not None:
+            queryset = queryset.filter(timestamp__gte=start)
+        if end is not None:
+            queryset = queryset.filter(timestamp__lt=end)
+        if user is not None:
+            queryset = queryset.filter(user_id=user)
+        self.queryset = queryset
+        self.chunk_size = chunk_size or getattr(settings, "LOGIN_EXPORT_CHUNK_SIZE", 2000)
+
+    def rows(self):
+        """Yield the exported rows as tuples ordered by `(timestamp, id)`."""
+        return (
+            self.queryset.order_by("timestamp", "id")
+            .values_list(*EXPORT_FIELDS)
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+    def lines(self, export_format):
+        """Yield the export as lines of text in `export_format`."""
+        if export_format == "csv":
+            return self.csv_lines()
+        if export_format == "ndjson":
+            return self.ndjson_lines()
+        raise ValueError(f"Unknown export format: {export_format}")
+
+    def csv_lines(self):
+        writer = csv.writer(Echo())
+        yield writer.writerow(EXPORT_FIELDS)
+        for row in self.rows():
+            yield writer.writerow(
+                [value.isoformat() if hasattr(value, "isoformat") else value for value in row]
+            )
+
+    def ndjson_lines(self):
+        encoder = DjangoJSONEncoder()
+        for row in self.rows():
+            yield encoder.encode(dict(zip(EXPORT_FIELDS, row, strict=True))) + "\n"
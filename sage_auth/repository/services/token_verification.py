@@ -10,8 +10,10 @@ from sage_otp.models import OTP
 from sage_otp.repository.managers.otp import OTPManager
 from sage_otp.helpers.choices import OTPState, ReasonOptions
 
+from sage_auth.helpers.metrics import STAGE_SECONDS, metrics
 from sage_auth.models import SageUser
 from sage_auth.utils import get_backends, send_email_otp
+from sage_auth.utils.scheduler import delivery_scheduler
 from sage_auth.signals import otp_expired, otp_failed, otp_verified
 
 logger = logging.getLogger(__name__)
@@ -100,10 +102,11 @@ class OTPVerificationService:
         """
         try:
             logger.debug("Attempting to retrieve user by identifier: %s", self.user_identifier)
-            if "@" in self.user_identifier:
-                user = SageUser.objects.get(email=self.user_identifier)
-            else:
-                user = SageUser.objects.get(phone_number=self.user_identifier)
+            with metrics.timer(STAGE_SECONDS, flow="otp_verify", stage="user_lookup"):
+                if "@" in self.user_identifier:
+                    user = SageUser.objects.get(email=self.user_identifier)
+                else:
+                    user = SageUser.objects.get(phone_number=self.user_identifier)
             logger.info("User retrieved successfully: User ID %s", user.id)
             return user
         except SageUser.DoesNotExist:
@@ -111,9 +114,16 @@ class OTPVerificationService:
             return None
 
     def verify_otp(self, user, entered_otp):
+        with metrics.timer(STAGE_SECONDS, flow="otp_verify", stage="total"):
+            result = self.check_otp(user, entered_otp)
+        metrics.increment("sage_auth_otp_verifications_total", status=result["status"])
+        return result
+
+    def check_otp(self, user, entered_otp):
         try:
             logger.debug("Verifying OTP for user ID: %s", user.id)
-            otp_instance = self.otp_manager.get_otp(identifier=user.id, reason=self.reason)
+            with metrics.timer(STAGE_SECONDS, flow="otp_verify", stage="otp_db"):
+                otp_instance = self.otp_manager.get_otp(identifier=user.id, reason=self.reason)
 
             otp_max_attempts = getattr(settings, "OTP_MAX_FAILED_ATTEMPTS", 4)
             otp_expiry_time = otp_instance.last_sent_at + timedelta(
@@ -147,13 +157,15 @@ class OTPVerificationService:
                 logger.info("OTP verified successfully for user ID: %s", user.id)
                 otp_instance.state = OTPState.CONSUMED
                 user.is_active = True
-                user.save()
-                otp_instance.save()
+                with metrics.timer(STAGE_SECONDS, flow="otp_verify", stage="otp_db"):
+                    user.save()
+                    otp_instance.save()
                 otp_verified.send(sender=self.__class__, user=user, success=True, reason=self.reason)
                 return {"success": True, "status": "verified", "user": user}
             else:
                 otp_instance.failed_attempts_count += 1
-                otp_instance.save()
+                with metrics.timer(STAGE_SECONDS, flow="otp_verify", stage="otp_db"):
+                    otp_instance.save()
                 logger.warning(
                     "Incorrect OTP entered for user ID: %s. Failed attempts: %d",
                     user.id,
@@ -204,15 +216,19 @@ class OTPVerificationService:
             if "@" in self.user_identifier:
                 logger.debug("Generating new OTP for user ID: %s via email.", user.id)
                 otp_data = self.otp_manager.get_or_create_otp(identifier=user.id, reason=self.reason)
-                send_email_otp(otp_data[0].token, user.email)
+                with delivery_scheduler.slot(self.reason):
+                    send_email_otp(otp_data[0].token, user.email)
                 logger.info("New OTP sent via email to user ID: %s", user.id)
             else:
                 logger.debug("Generating new OTP for user ID: %s via SMS.", user.id)
                 otp_data = self.otp_manager.get_or_create_otp(identifier=user.id, reason=self.reason)
-                sms_obj = get_backends()
-                sms_obj.send_one_message(str(user.phone_number), otp_data[0].token)
+                with delivery_scheduler.slot(self.reason):
+                    sms_obj = get_backends()
+                    sms_obj.send_one_message(str(user.phone_number), otp_data[0].token)
                 logger.info("New OTP sent via SMS to user ID: %s", user.id)
         except Exception as e:
+            channel = "email" if "@" in self.user_identifier else "phone"
+            metrics.increment("sage_auth_otp_send_failures_total", channel=channel)
             logger.error("Failed to send new OTP to user ID: %s. Error: %s", user.id, str(e))
 
     def block_user(self, user):
@@ -0,0 +1,277 @@
+import csv
+import json
+import logging
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from sage_auth.strategies import (
+    CombinedStrategy,
+    EmailStrategy,
+    PhoneStrategy,
+    UsernameStrategy,
+)
+from sage_auth.utils.hashing import PasswordHashingPool
+
+logger = logging.getLogger(__name__)
+
+IDENTIFIER_FIELDS = ("email", "phone_number", "username")
+BOOLEAN_FIELDS = ("is_active", "is_staff", "is_superuser")
+PROFILE_FIELDS = ("first_name", "last_name")
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+
+
+def read_csv_rows(stream):
+    """Yield `(row_number, row)` pairs from a CSV stream with a header line."""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_ndjson_rows(stream):
+    """Yield `(row_number, row)` pairs from a newline delimited JSON stream."""
+    for row_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            row = {"__error__": f"Invalid JSON: {error}"}
+        else:
+            if not isinstance(row, dict):
+                row = {"__error__": "Expected a JSON object."}
+        yield row_number, row
+
+
+class BulkImportReport:
+    """
+    Outcome of a bulk import: how many rows were read and created, and the
+    validation errors of every rejected row keyed by its row number.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.errors = []
+
+    @property
+    def failed(self):
+        return len(self.errors)
+
+    def add_error(self, row_number, error):
+        if isinstance(error, ValidationError) and hasattr(error, "error_dict"):
+            messages = error.message_dict
+        elif isinstance(error, ValidationError):
+            messages = {"__all__": error.messages}
+        else:
+            messages = {"__all__": [str(error)]}
+        self.errors.append({"row": row_number, "errors": messages})
+
+    def as_dict(self):
+        return {
+            "total": self.total,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
+
+
+class UserImportService:
+    """
+    A service for creating users in bulk from a stream of rows.
+
+    Rows are processed in batches. Every row is validated against the same
+    authentication strategies `AuthUserManager.create_user` uses, plus the
+    model field validators, without touching the database. Uniqueness of
+    the identifiers is then checked for the whole batch with set-based
+    query instead of one `exists()` per row, and the valid users are
+    inserted with `bulk_create` inside one transaction per batch.
+
+    Rows that fail are reported with their row number and do not stop the
+    import. If a batch insert still hits a unique constraint (for instance
+    because of a concurrent signup) the batch is retried row by row so the
+    offending rows can be reported precisely.
+
+    Passwords are hashed in a `PasswordHashingPool` across all cores. The
+    pipeline overlaps the stages: while the workers hash one batch, the next
+    batch is being validated, and the hashed batch is then inserted.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        Rows validated and inserted together, defaults to the
+        `BULK_IMPORT_BATCH_SIZE` setting or 1000.
+    dry_run : bool
+        Validate every row but roll back all inserts.
+    workers : int, optional
+        Password hashing processes, see `PasswordHashingPool`.
+    chunk_size : int, optional
+        Passwords handed to a hashing process per task.
+
+    Examples
+    --------
+    >>> with open("users.csv", newline="") as stream:
+    >>>     report = UserImportService(batch_size=2000).import_rows(read_csv_rows(stream))
+    >>> print(report.created, report.failed)
+    """
+
+    def __init__(self, batch_size=None, dry_run=False, workers=None, chunk_size=None):
+        self.batch_size = batch_size or getattr(settings, "BULK_IMPORT_BATCH_SIZE", 1000)
+        self.dry_run = dry_run
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.User = get_user_model()
+        self.strategy = CombinedStrategy(
+            [EmailStrategy(), PhoneStrategy(), UsernameStrategy()]
+        )
+
+    def import_rows(self, rows):
+        """Import `(row_number, row)` pairs and return a `BulkImportReport`."""
+        report = BulkImportReport()
+        rows = iter(rows)
+        pending = None
+        # Identifiers accepted so far; a dry run inserts nothing, so the
+        # database alone cannot reveal duplicates across batches.
+        seen = {field: set() for field in IDENTIFIER_FIELDS}
+        with PasswordHashingPool(self.workers, self.chunk_size) as pool:
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    break
+                report.total += len(batch)
+                candidates = self.build_batch(batch, report)
+
+                # The previous batch was hashed by the pool while this one was
+                # validated. Inserting it before the uniqueness check lets the
+                # check see its rows.
+                if pending:
+                    self.insert(*pending, report)
+                candidates = self.exclude_conflicts(candidates, report, seen)
+                pending = (candidates, self.hash_passwords(pool, candidates))
+                logger.info(
+                    "Bulk import progress: %s rows read, %s created, %s failed.",
+                    report.total,
+                    report.created,
+                    report.failed,
+                )
+            if pending:
+                self.insert(*pending, report)
+        return report
+
+    def build_batch(self, batch, report):
+        candidates = []
+        for row_number, row in batch:
+            try:
+                candidates.append((row_number, *self.build_user(row)))
+            except (ValidationError, ValueError) as error:
+                report.add_error(row_number, error)
+        return candidates
+
+    def hash_passwords(self, pool, candidates):
+        """Submit the passwords of a batch to the hashing pool."""
+        return pool.map([password for __, __, password in candidates if password])
+
+    def clean_row(self, row):
+        """Reduce a raw row to the user data understood by the strategies."""
+        if "__error__" in row:
+            raise ValueError(row["__error__"])
+
+        user_data = {}
+        for field in IDENTIFIER_FIELDS + PROFILE_FIELDS:
+            value = row.get(field)
+            if value not in (None, ""):
+                user_data[field] = str(value).strip()
+        for field in BOOLEAN_FIELDS:
+            value = row.get(field)
+            if value not in (None, ""):
+                user_data[field] = (
+                    value if isinstance(value, bool) else str(value).lower() in TRUE_VALUES
+                )
+        user_data["password"] = row.get("password") or None
+        return user_data
+
+    def build_user(self, row):
+        """
+        Validate a row and return the unsaved user built from it along with
+        its raw password, which is hashed later in the pool.
+        """
+        user_data = self.clean_row(row)
+        password = user_data.pop("password")
+        strategy = self.User.objects.get_authentication_strategies(user_data)
+        strategy.validate_format(user_data)
+
+        user = strategy.build_user(user_data)
+        for field in PROFILE_FIELDS:
+            setattr(user, field, user_data.get(field, ""))
+        if "is_active" in user_data:
+            user.is_active = user_data["is_active"]
+        user.clean_fields(exclude=["password"])
+        user.clean()
+        # `clean()` normalizes a missing email to "", which would collide
+        # with every other user without an email on the unique index.
+        for field in IDENTIFIER_FIELDS:
+            if not getattr(user, field):
+                setattr(user, field, None)
+        return user, password
+
+    def exclude_conflicts(self, candidates, report, seen):
+        """
+        Drop candidates whose identifiers already exist in the database or
+        are in `seen`, the identifiers accepted earlier in the import, with a
+        single query per batch. Accepted identifiers are added to `seen`.
+        """
+        conflicts = self.strategy.find_conflicts(
+            {field: getattr(user, field) for field in IDENTIFIER_FIELDS}
+            for __, user, __ in candidates
+        )
+
+        accepted = []
+        for (row_number, user, password), taken in zip(candidates, conflicts, strict=True):
+            errors = {
+                field: [f"A user with this {field} already exists."] for field in taken
+            }
+            for field in IDENTIFIER_FIELDS:
+                value = getattr(user, field)
+                if value and field not in errors and str(value) in seen[field]:
+                    errors[field] = [f"Duplicate {field} in the import."]
+            if errors:
+                report.add_error(row_number, ValidationError(errors))
+                continue
+            for field in IDENTIFIER_FIELDS:
+                value = getattr(user, field)
+                if value:
+                    seen[field].add(str(value))
+            accepted.append((row_number, user, password))
+        return accepted
+
+    def insert(self, candidates, hashes, report):
+        hashes = iter(hashes)
+        for __, user, password in candidates:
+            if password:
+                user.password = next(hashes)
+            else:
+                user.set_unusable_password()
+        users = [user for __, user, __ in candidates]
+        if not users:
+            return
+        try:
+            with transaction.atomic():
+                self.User.objects.bulk_create(users, batch_size=self.batch_size)
+                if self.dry_run:
+                    transaction.set_rollback(True)
+            report.created += len(users)
+        except IntegrityError:
+            logger.warning("Bulk insert conflicted, retrying the batch row by row.")
+            for row_number, user, __ in candidates:
+                user.pk = None
+                try:
+                    with transaction.atomic():
+                        user.save(force_insert=True)
+                        if self.dry_run:
+                            transaction.set_rollback(True)
+                    report.created += 1
+                except IntegrityError as error:
+                    report.add_error(row_number, error)
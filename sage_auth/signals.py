@@ -1,24 +1,26 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.signals import user_logged_in, user_login_failed
-from django.dispatch import Signal, receiver
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
-from .models import LoginAttempt
+from .dispatch import DeferredSignal
+from .models import LoginAttempt, SecurityAnnouncement
 
 # Login Scenarios
-user_login_attempt = Signal()
-user_otp_sent = Signal()
-user_otp_verified = Signal()
+user_login_attempt = DeferredSignal()
+user_otp_sent = DeferredSignal()
+user_otp_verified = DeferredSignal()
 
 # Register Scenarios
-user_registered = Signal()
-user_activated = Signal()
-activation_failed = Signal()
+user_registered = DeferredSignal()
+user_activated = DeferredSignal()
+activation_failed = DeferredSignal()
 
 # OTP Scenarios
-otp_generated = Signal()
-otp_verified = Signal()
-otp_expired = Signal()
-otp_failed = Signal()
+otp_generated = DeferredSignal()
+otp_verified = DeferredSignal()
+otp_expired = DeferredSignal()
+otp_failed = DeferredSignal()
 
 
 @receiver(user_logged_in)
@@ -44,3 +46,10 @@ def handle_failed_login(sender, credentials, **kwargs):
         LoginAttempt.objects.create(
             user=user, total_logins=0, admin_logins=0, failed_attempts=1
         )
+
+
+@receiver(post_save, sender=SecurityAnnouncement)
+@receiver(post_delete, sender=SecurityAnnouncement)
+def invalidate_announcement_feed(sender, **kwargs):
+    """Drop the cached announcement feed when an announcement changes."""
+    SecurityAnnouncement.objects.invalidate_feed()
@@ -2,7 +2,27 @@ from abc import ABC, abstractmethod
 
 
 class AuthStrategy(ABC):
+    #: The unique user field this strategy identifies users by.
+    field = None
+    #: The error raised when `field` is already taken.
+    exists_message = None
+
     @abstractmethod
     def validate(self, user_data):
         """Validates user data (email, phone, etc.)."""
         pass
+
+    @abstractmethod
+    def validate_format(self, user_data):
+        """Validates user data without touching the database."""
+        pass
+
+    def build_user(self, user_data, user=None):
+        """Populate an unsaved user from `user_data`."""
+        raise NotImplementedError
+
+    def create_user(self, user_data, user=None):
+        """Create and save a user from `user_data`."""
+        user = self.build_user(user_data, user=user)
+        user.save()
+        return user
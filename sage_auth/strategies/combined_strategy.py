@@ -1,6 +1,8 @@
 # sage_auth/strategies/combined_strategy.py
 
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db.models import Q
 
 from sage_auth.strategies.email_strategy import EmailStrategy
 from sage_auth.strategies.phone_strategy import PhoneStrategy
@@ -24,17 +26,103 @@ class CombinedStrategy(AuthStrategy):
         """Initialize with multiple strategies."""
         self.strategies = strategies
 
+    @property
+    def fields(self):
+        """The unique user fields of all strategies."""
+        return [strategy.field for strategy in self.strategies if strategy.field]
+
     def validate(self, user_data):
-        """Validate user data with all strategies."""
-        for strategy in self.strategies:
-            strategy.validate(user_data)
+        """
+        Validate user data with all strategies.
 
-    def create_user(self, user_data):
-        """Create a user using data from all strategies."""
+        The format checks run first, then the uniqueness of every identifier
+        is checked with a single query. The raised error names each field
+        that is already taken. This includes the email, which is unique in
+        the database but was not checked before.
+        """
+        self.validate_format(user_data)
+        conflicts = self.find_conflicts([user_data])[0]
+        if conflicts:
+            raise ValidationError(
+                {
+                    strategy.field: strategy.exists_message
+                    for strategy in self.strategies
+                    if strategy.field in conflicts
+                }
+            )
+
+    def find_conflicts(self, users_data):
+        """
+        Return the set of fields already taken for each candidate.
+
+        All identifiers of all candidates are checked in one
+        `Q(email__in=...) | Q(phone_number__in=...) | ...` query, so a batch
+        of users costs the same single round trip as one signup.
+
+        Parameters
+        ----------
+        users_data : iterable of dict
+            The candidate user data, keyed by field name.
+
+        Returns
+        -------
+        list of set
+            The colliding fields of each candidate, in input order.
+        """
         User = get_user_model()
+        fields = self.fields
+        users_data = list(users_data)
+
+        candidates = []
+        values = {field: set() for field in fields}
+        for user_data in users_data:
+            normalized = {}
+            for field in fields:
+                value = user_data.get(field)
+                value = self.normalize(User, field, value) if value else None
+                if value:
+                    normalized[field] = value
+                    values[field].add(value)
+            candidates.append(normalized)
 
-        # Create base user object
-        user = User()
+        query = Q()
+        for field, field_values in values.items():
+            if field_values:
+                query |= Q(**{f"{field}__in": field_values})
+        if not query:
+            return [set() for __ in candidates]
+
+        taken = {field: set() for field in fields}
+        for row in User.objects.filter(query).values_list(*fields):
+            for field, value in zip(fields, row, strict=True):
+                if value:
+                    taken[field].add(str(value))
+
+        return [
+            {field for field, value in normalized.items() if value in taken[field]}
+            for normalized in candidates
+        ]
+
+    @staticmethod
+    def normalize(User, field, value):
+        """Convert `value` to the string the database returns for `field`."""
+        try:
+            value = User._meta.get_field(field).to_python(value)
+        except ValidationError:
+            pass
+        return str(value)
+
+    def validate_format(self, user_data):
+        """Validate user data with all strategies without touching the database."""
+        for strategy in self.strategies:
+            strategy.validate_format(user_data)
+
+    def build_user(self, user_data, user=None):
+        """Populate a user using data from all strategies without saving it."""
+        if user is None:
+            User = get_user_model()
+            # Create base user object
+            user = User()
 
         # Set fields from each strategy
         for strategy in self.strategies:
@@ -51,6 +139,10 @@ class CombinedStrategy(AuthStrategy):
         password = user_data.get("password")
         if password:
             user.set_password(password)
+        return user
 
+    def create_user(self, user_data, user=None):
+        """Create a user using data from all strategies."""
+        user = self.build_user(user_data, user=user)
         user.save()
         return user
@@ -15,13 +15,19 @@ class EmailStrategy(AuthStrategy):
     and customize the user model with email as the primary identifier.
     """
 
+    field = "email"
+    exists_message = "Email already exists."
+
     def validate(self, user_data):
+        self.validate_format(user_data)
+
+    def validate_format(self, user_data):
         email = user_data.get("email")
         if not email:
             raise ValidationError("Email is required.")
 
-    def create_user(self, user_data, user=None):
-        """Create a user using the email field."""
+    def build_user(self, user_data, user=None):
+        """Populate a user using the email field without saving it."""
         if user is None:
             User = get_user_model()
             user = User()
@@ -32,6 +38,4 @@ class EmailStrategy(AuthStrategy):
         password = user_data.get("password")
         if password:
             user.set_password(password)
-
-        user.save()
         return user
@@ -15,18 +15,25 @@ class PhoneStrategy(AuthStrategy):
     and other configuration options such as `is_staff` and `is_superuser`.
     """
 
+    field = "phone_number"
+    exists_message = "Phone number already exists."
+
     def validate(self, user_data):
+        self.validate_format(user_data)
+        phone_number = user_data.get("phone_number")
+        if get_user_model().objects.filter(phone_number=phone_number).exists():
+            raise ValidationError(self.exists_message)
+
+    def validate_format(self, user_data):
         phone_number = user_data.get("phone_number")
         if not phone_number:
             raise ValidationError("Phone number is required.")
 
-        if not re.match(r"^\+?\d{10,15}$", phone_number):
+        if not re.match(r"^\+?\d{10,15}$", str(phone_number)):
             raise ValidationError("Invalid phone number format.")
-        if get_user_model().objects.filter(phone_number=phone_number).exists():
-            raise ValidationError("Phone number already exists.")
 
-    def create_user(self, user_data, user=None):
-        """Create a user using the phone number field."""
+    def build_user(self, user_data, user=None):
+        """Populate a user using the phone number field without saving it."""
         if user is None:
             User = get_user_model()
             user = User()
@@ -37,5 +44,4 @@ class PhoneStrategy(AuthStrategy):
         password = user_data.get("password")
         if password:
             user.set_password(password)
-        user.save()
         return user
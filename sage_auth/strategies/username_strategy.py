@@ -13,15 +13,22 @@ class UsernameStrategy(AuthStrategy):
     field population on creation.
     """
 
+    field = "username"
+    exists_message = "Username already exists."
+
     def validate(self, user_data):
+        self.validate_format(user_data)
+        username = user_data.get("username")
+        if get_user_model().objects.filter(username=username).exists():
+            raise ValidationError(self.exists_message)
+
+    def validate_format(self, user_data):
         username = user_data.get("username")
         if not username:
             raise ValidationError("Username is required.")
-        if get_user_model().objects.filter(username=username).exists():
-            raise ValidationError("Username already exists.")
 
-    def create_user(self, user_data, user=None):
-        """Create a user using the username field."""
+    def build_user(self, user_data, user=None):
+        """Populate a user using the username field without saving it."""
         if user is None:
             User = get_user_model()
             user = User()
@@ -30,5 +37,4 @@ class UsernameStrategy(AuthStrategy):
         password = user_data.get("password")
         if password:
             user.set_password(password)
-        user.save()
         return user
@@ -0,0 +1,114 @@
+# sage_auth/tests/test_activate.py
+import base64
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+from django.core.cache import cache
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from sage_auth.mixins import ActivateAccountMixin
+from sage_auth.utils.email_sender import ActivationEmailSender
+
+User = get_user_model()
+
+
+class ActivateView(ActivateAccountMixin):
+    success_url = "/login/"
+    register_url = "/register/"
+
+
+def encode_ts(timestamp):
+    return base64.urlsafe_b64encode(str(int(timestamp)).encode()).decode()
+
+
+@pytest.fixture
+def activation_request(rf):
+    request = rf.get("/activate/")
+    request.session = SessionStore()
+    request._messages = FallbackStorage(request)
+    return request
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        ActivationEmailSender,
+        "send_activation_email",
+        lambda self, user, request, asynchronous=False: calls.append(user.pk),
+    )
+    cache.clear()
+    return calls
+
+
+@pytest.mark.django_db
+class TestActivateAccountMixin:
+    """Test cases for the activation link validation pipeline."""
+
+    def test_malformed_link_skips_database(
+        self, activation_request, django_assert_num_queries
+    ):
+        """Test that malformed links are rejected without a query."""
+        view = ActivateView.as_view()
+        with django_assert_num_queries(0):
+            response = view(activation_request, uidb64="!!", token="x", ts="y")
+            assert response.url == "/register/"
+            response = view(
+                activation_request,
+                uidb64=urlsafe_base64_encode(b"1"),
+                token="not-a-token",
+                ts=encode_ts(time.time()),
+            )
+            assert response.url == "/register/"
+
+    def test_expired_link_resends_once(
+        self, activation_request, sent, django_assert_num_queries
+    ):
+        """Test that resends are deduplicated within the cooldown."""
+        user = User.objects.create(
+            username="inactive", email="inactive@example.com", is_active=False
+        )
+        kwargs = {
+            "uidb64": urlsafe_base64_encode(force_bytes(user.pk)),
+            "token": default_token_generator.make_token(user),
+            "ts": encode_ts(time.time() - 3600),
+        }
+        view = ActivateView.as_view()
+        view(activation_request, **kwargs)
+        with django_assert_num_queries(0):
+            response = view(activation_request, **kwargs)
+
+        assert response.status_code == 200
+        assert sent == [user.pk]
+
+    def test_valid_link_activates(self, activation_request, sent):
+        """Test that a fresh link activates the user."""
+        user = User.objects.create(
+            username="new", email="new@example.com", is_active=False
+        )
+        response = ActivateView.as_view()(
+            activation_request,
+            uidb64=urlsafe_base64_encode(force_bytes(user.pk)),
+            token=default_token_generator.make_token(user),
+            ts=encode_ts(time.time()),
+        )
+        user.refresh_from_db()
+
+        assert response.url == "/login/"
+        assert user.is_active
+        assert sent == []
+
+    def test_unknown_user_is_invalid(self, activation_request):
+        """Test that a link for a missing user redirects instead of failing."""
+        response = ActivateView.as_view()(
+            activation_request,
+            uidb64=urlsafe_base64_encode(b"999999"),
+            token="c1a2b3-" + "0" * 32,
+            ts=encode_ts(time.time()),
+        )
+        assert response.url == "/register/"
@@ -0,0 +1,181 @@
+# sage_auth/tests/test_admin.py
+import io
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from sage_auth.admin import (
+    LoginAttemptModelAdmin,
+    LoginSummaryModelAdmin,
+    SageUserAdmin,
+)
+from sage_auth.helpers.admin import (
+    CURSOR_VAR,
+    EstimatedCountPaginator,
+    KeysetChangeList,
+)
+from sage_auth.helpers.search import search_index_statements
+from sage_auth.models import LoginAttempt, LoginSummary
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestLoginAttemptAdminPerformanceMode:
+    """Test cases for the LoginAttempt changelist in performance mode."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, rf):
+        """Enable performance mode and create a few login attempts."""
+        settings.ADMIN_PERFORMANCE_MODE = True
+        self.rf = rf
+        self.model_admin = LoginAttemptModelAdmin(LoginAttempt, admin.site)
+        self.model_admin.list_per_page = 2
+        self.superuser = User.objects.create(
+            username="root", email="root@example.com", is_superuser=True, is_staff=True
+        )
+        for name in ["alice", "bob", "carol"]:
+            user = User.objects.create(username=name, email=f"{name}@example.com")
+            LoginAttempt.objects.create(user=user)
+
+    def get_changelist(self, **params):
+        request = self.rf.get("/", params)
+        request.user = self.superuser
+        return self.model_admin.get_changelist_instance(request)
+
+    def test_keyset_pages(self):
+        """Test that the cursor walks every row once without an offset."""
+        changelist = self.get_changelist()
+        assert isinstance(changelist, KeysetChangeList)
+        assert isinstance(changelist.paginator, EstimatedCountPaginator)
+        assert changelist.result_count == 3
+        first_page = list(changelist.result_list)
+        assert len(first_page) == 2
+        assert changelist.next_cursor
+
+        changelist = self.get_changelist(**{CURSOR_VAR: changelist.next_cursor})
+        second_page = list(changelist.result_list)
+        assert len(second_page) == 1
+        assert changelist.next_cursor is None
+        usernames = {attempt.user.username for attempt in first_page + second_page}
+        assert usernames == {"alice", "bob", "carol"}
+
+    def test_rows_are_selected_with_their_user(self, django_assert_num_queries):
+        """Test that listing users does not issue a query per row."""
+        changelist = self.get_changelist()
+        with django_assert_num_queries(0):
+            [attempt.user.username for attempt in changelist.result_list]
+
+    def test_prefix_search(self):
+        """Test that the search matches identifier prefixes only."""
+        changelist = self.get_changelist(q="bo")
+        assert [attempt.user.username for attempt in changelist.result_list] == ["bob"]
+
+        changelist = self.get_changelist(q="ob")
+        assert list(changelist.result_list) == []
+
+    def test_prefix_search_normalizes_phone_numbers(self):
+        """Test that phone numbers are matched like in the user admin."""
+        User.objects.filter(username="carol").update(phone_number="+491510000001")
+
+        changelist = self.get_changelist(q=" 0049 151 000")
+        assert [attempt.user.username for attempt in changelist.result_list] == ["carol"]
+
+
+@pytest.mark.django_db
+class TestLoginSummaryAdmin:
+    """Test cases for the per-user login summary."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, rf):
+        """Create users with several login attempts each."""
+        self.rf = rf
+        self.superuser = User.objects.create(
+            username="root", email="root@example.com", is_superuser=True, is_staff=True
+        )
+        alice = User.objects.create(username="alice", email="alice@example.com")
+        bob = User.objects.create(username="bob", email="bob@example.com")
+        LoginAttempt.objects.create(user=alice, total_logins=1)
+        LoginAttempt.objects.create(user=alice, failed_attempts=12)
+        LoginAttempt.objects.create(user=bob, total_logins=1, admin_logins=1)
+
+    def test_one_row_per_user(self):
+        """Test that the attempts of a user are summed into one row."""
+        summaries = {summary.username: summary for summary in LoginSummary.objects.all()}
+
+        assert set(summaries) == {"alice", "bob"}
+        assert summaries["alice"].attempts == 2
+        assert summaries["alice"].total_logins == 1
+        assert summaries["alice"].failed_attempts == 12
+        assert summaries["bob"].admin_logins == 1
+
+    def test_admin_checks_pass(self):
+        """Test that the admin passes the system checks."""
+        assert LoginSummaryModelAdmin(LoginSummary, admin.site).check() == []
+
+    def test_sort_and_filter_on_annotations(self):
+        """Test that the changelist sorts and filters on the aggregates."""
+        model_admin = LoginSummaryModelAdmin(LoginSummary, admin.site)
+        failed_column = model_admin.list_display.index("display_failed_attempts")
+        request = self.rf.get("/", {"o": f"-{failed_column}"})
+        request.user = self.superuser
+        changelist = model_admin.get_changelist_instance(request)
+        assert [row.username for row in changelist.result_list] == ["alice", "bob"]
+
+        request = self.rf.get("/", {"failures": "none"})
+        request.user = self.superuser
+        changelist = model_admin.get_changelist_instance(request)
+        assert [row.username for row in changelist.result_list] == ["bob"]
+
+
+@pytest.mark.django_db
+class TestSageUserAdminSearch:
+    """Test cases for the optional user admin search backends."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings, rf):
+        """Enable the prefix search backend."""
+        settings.USER_ADMIN_SEARCH_BACKEND = "prefix"
+        self.rf = rf
+        self.model_admin = SageUserAdmin(User, admin.site)
+        User.objects.create(username="alice", email="alice@example.com")
+        User.objects.create(username="malice", email="malice@example.com")
+
+    def search(self, term):
+        request = self.rf.get("/", {"q": term})
+        queryset, __ = self.model_admin.get_search_results(
+            request, User.objects.all(), term
+        )
+        return sorted(user.username for user in queryset)
+
+    def test_prefix_search(self):
+        """Test that only identifiers starting with the term match."""
+        assert self.search("ali") == ["alice"]
+        assert self.search("mal") == ["malice"]
+
+    def test_estimated_paginator(self):
+        """Test that the changelist does not count the whole table."""
+        assert not self.model_admin.show_full_result_count
+        paginator = self.model_admin.get_paginator(
+            None, User.objects.order_by("pk"), 10
+        )
+        assert isinstance(paginator, EstimatedCountPaginator)
+        assert paginator.count == 2
+
+    def test_print_index_statements(self):
+        """Test the SQL printed by create_user_search_indexes."""
+        stdout = io.StringIO()
+        call_command(
+            "create_user_search_indexes", backend="trigram", print_only=True, stdout=stdout
+        )
+        output = stdout.getvalue()
+        assert "CREATE EXTENSION IF NOT EXISTS pg_trgm;" in output
+        assert "CONCURRENTLY" in output
+        assert "gin_trgm_ops" in output
+
+    def test_prefix_skips_django_pattern_indexes(self):
+        """Test that columns with Django's `_like` index get no second one."""
+        assert search_index_statements("prefix") == []
+        assert len(search_index_statements("prefix", drop=True)) == 3
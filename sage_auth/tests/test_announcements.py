@@ -0,0 +1,71 @@
+# sage_auth/tests/test_announcements.py
+import pytest
+from django.contrib import admin
+from django.core.cache import cache
+from django.template import Context, Template
+
+from sage_auth.admin import SecurityAnnouncementAdmin
+from sage_auth.context_processors import security_announcements
+from sage_auth.helpers.choices import GroupChoices
+from sage_auth.models import SecurityAnnouncement
+
+
+@pytest.mark.django_db
+class TestCachedAnnouncementFeed:
+    """Test cases for the cached security announcement feed."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, django_capture_on_commit_callbacks):
+        """Start from an empty cache with one alert and one guideline."""
+        cache.clear()
+        self.capture = django_capture_on_commit_callbacks
+        with self.capture(execute=True):
+            self.alert = SecurityAnnouncement.objects.create(
+                title="Phishing", content="Beware", group=GroupChoices.ALERT
+            )
+            SecurityAnnouncement.objects.create(
+                title="Use 2FA", content="Enable it", group=GroupChoices.GUIDELINE
+            )
+            SecurityAnnouncement.objects.create(
+                title="Old", content="Gone", is_active=False
+            )
+
+    def test_feed_is_grouped_and_cached(self, django_assert_num_queries):
+        """Test that the feed is grouped and served from the cache."""
+        with django_assert_num_queries(1):
+            feed = SecurityAnnouncement.objects.cached_feed()
+        with django_assert_num_queries(0):
+            assert SecurityAnnouncement.objects.cached_feed() == feed
+
+        assert [a.title for a in feed[GroupChoices.ALERT]] == ["Phishing"]
+        assert [a.title for a in feed[GroupChoices.GUIDELINE]] == ["Use 2FA"]
+
+    def test_save_invalidates(self):
+        """Test that saving an announcement refreshes the feed."""
+        SecurityAnnouncement.objects.cached_feed()
+        with self.capture(execute=True):
+            self.alert.title = "Phishing wave"
+            self.alert.save()
+
+        feed = SecurityAnnouncement.objects.cached_feed()
+        assert [a.title for a in feed[GroupChoices.ALERT]] == ["Phishing wave"]
+
+    def test_admin_action_invalidates(self, rf):
+        """Test that the bulk mark_inactive action refreshes the feed."""
+        SecurityAnnouncement.objects.cached_feed()
+        model_admin = SecurityAnnouncementAdmin(SecurityAnnouncement, admin.site)
+        model_admin.message_user = lambda *args, **kwargs: None
+        with self.capture(execute=True):
+            model_admin.mark_inactive(rf.get("/"), SecurityAnnouncement.objects.all())
+
+        feed = SecurityAnnouncement.objects.cached_feed()
+        assert feed == {GroupChoices.ALERT: [], GroupChoices.GUIDELINE: []}
+
+    def test_context_processor_is_lazy(self, rf, django_assert_num_queries):
+        """Test that the context processor reads the feed only when used."""
+        with django_assert_num_queries(0):
+            context = security_announcements(rf.get("/"))
+        template = Template(
+            "{% for a in security_announcements.ALERT %}{{ a.title }}{% endfor %}"
+        )
+        assert template.render(Context(context)) == "Phishing"
@@ -0,0 +1,24 @@
+# sage_auth/tests/test_benchmarks.py
+import pytest
+
+from sage_auth.benchmarks.flows import FLOWS, AuthFlowBenchmark
+
+
+@pytest.mark.django_db
+class TestAuthFlowBenchmark:
+    """Test cases for the auth flow benchmark suite."""
+
+    def test_every_flow_succeeds(self, settings):
+        """Test that each benchmarked request takes its success path."""
+        settings.ROOT_URLCONF = "sage_auth.benchmarks.urls"
+        settings.SMS_CONFIGS = {"debug": False, "provider": {"NAME": "memory"}}
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        settings.AUTH_BACKGROUND_TASKS = False
+
+        results = AuthFlowBenchmark(iterations=2).run()
+
+        assert set(results) == set(FLOWS)
+        for flow, summary in results.items():
+            assert summary["operations"] == 2, flow
+            assert summary["errors"] == 0, flow
+            assert summary["queries_per_request"] > 0, flow
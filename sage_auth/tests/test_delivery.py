@@ -0,0 +1,151 @@
+# sage_auth/tests/test_delivery.py
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from sage_otp.helpers.choices import ReasonOptions
+
+from sage_auth.backends import memory
+from sage_auth.mixins.phone import PhoneOtpMixin
+from sage_auth.utils.delivery import OtpDeliveryPolicy
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    return User(id=1, email="user@example.com", phone_number="+491510000001")
+
+
+def email_only(user, channel):
+    return channel == "email"
+
+
+class Recorder:
+    def __init__(self, error=None, block=None):
+        self.sent = []
+        self.error = error
+        self.block = block
+
+    def __call__(self, token, address):
+        if self.block is not None:
+            self.block.wait()
+        if self.error is not None:
+            raise self.error
+        self.sent.append((token, address))
+
+
+class TestOtpDeliveryPolicy:
+    """Test cases for the cross-channel OTP delivery policy."""
+
+    def test_primary_only_when_disabled(self, settings, user):
+        """Test that without the setting a failing primary is not retried."""
+        settings.OTP_CHANNEL_FALLBACK = False
+        email, phone = Recorder(error=RuntimeError("down")), Recorder()
+        policy = OtpDeliveryPolicy({"email": email, "phone": phone})
+
+        with pytest.raises(RuntimeError):
+            policy.deliver(user, "12345", "email", ReasonOptions.LOGIN)
+        assert phone.sent == []
+
+    def test_falls_back_on_error(self, settings, user):
+        """Test that a failing primary channel falls back to the other one."""
+        settings.OTP_CHANNEL_FALLBACK = True
+        email, phone = Recorder(error=RuntimeError("down")), Recorder()
+        policy = OtpDeliveryPolicy({"email": email, "phone": phone})
+
+        assert policy.deliver(user, "12345", "email", ReasonOptions.LOGIN) == "phone"
+        assert phone.sent == [("12345", "+491510000001")]
+
+    def test_falls_back_after_deadline(self, settings, user):
+        """Test that a primary channel missing the deadline falls back."""
+        settings.OTP_CHANNEL_FALLBACK = True
+        release = threading.Event()
+        email, phone = Recorder(block=release), Recorder()
+        policy = OtpDeliveryPolicy({"email": email, "phone": phone}, deadline=0.05)
+
+        try:
+            assert policy.deliver(user, "12345", "email", ReasonOptions.LOGIN) == "phone"
+        finally:
+            release.set()
+        assert phone.sent == [("12345", "+491510000001")]
+
+    def test_no_fallback_without_address(self, settings, user):
+        """Test that the primary channel is used alone without another address."""
+        settings.OTP_CHANNEL_FALLBACK = True
+        user.phone_number = None
+        email, phone = Recorder(), Recorder()
+        policy = OtpDeliveryPolicy({"email": email, "phone": phone})
+
+        assert policy.deliver(user, "12345", "email", ReasonOptions.LOGIN) == "email"
+        assert email.sent == [("12345", "user@example.com")]
+
+    @pytest.mark.parametrize(
+        "reason",
+        [ReasonOptions.EMAIL_ACTIVATION, ReasonOptions.PHONE_NUMBER_ACTIVATION],
+    )
+    def test_activation_never_changes_channel(self, settings, user, reason):
+        """Test that an activation code is never sent to the other channel."""
+        settings.OTP_CHANNEL_FALLBACK = True
+        email, phone = Recorder(error=RuntimeError("down")), Recorder()
+        policy = OtpDeliveryPolicy({"email": email, "phone": phone})
+
+        with pytest.raises(RuntimeError):
+            policy.deliver(user, "12345", "email", reason)
+        assert phone.sent == []
+
+    def test_no_fallback_for_inactive_user(self, settings, user):
+        """Test that the channels of an inactive user are not verified."""
+        settings.OTP_CHANNEL_FALLBACK = True
+        user.is_active = False
+        policy = OtpDeliveryPolicy({"email": Recorder(), "phone": Recorder()})
+
+        assert policy.fallback_channel(user, "email", ReasonOptions.LOGIN) is None
+
+    def test_verified_channel_hook(self, settings, user):
+        """Test that OTP_CHANNEL_VERIFIED replaces the default check."""
+        settings.OTP_CHANNEL_FALLBACK = True
+        settings.OTP_CHANNEL_VERIFIED = "sage_auth.tests.test_delivery.email_only"
+        policy = OtpDeliveryPolicy({"email": Recorder(), "phone": Recorder()})
+
+        assert policy.fallback_channel(user, "email", ReasonOptions.LOGIN) is None
+        assert policy.fallback_channel(user, "phone", ReasonOptions.LOGIN) == "email"
+
+
+@pytest.mark.django_db
+class TestPhoneOtpFallback:
+    """Test cases for the email fallback of phone OTPs."""
+
+    def test_phone_otp_falls_back_to_email(self, settings):
+        """Test that the OTP of a failing SMS provider is emailed instead."""
+        memory.outbox.clear()
+        settings.OTP_CHANNEL_FALLBACK = True
+        settings.SMS_CONFIGS = {
+            "debug": False,
+            "provider": {"NAME": "memory", "ERROR_RATE": 1},
+        }
+        user = User.objects.create(
+            username="fallback", email="fallback@example.com", phone_number="+491510000002"
+        )
+
+        PhoneOtpMixin().send_sms_otp(user, ReasonOptions.LOGIN)
+
+        assert len(memory.outbox) == 0
+        assert mail.outbox[0].to == ["fallback@example.com"]
+
+    def test_phone_activation_is_not_emailed(self, settings):
+        """Test that a failing activation SMS is not replaced by an email."""
+        memory.outbox.clear()
+        settings.OTP_CHANNEL_FALLBACK = True
+        settings.SMS_CONFIGS = {
+            "debug": False,
+            "provider": {"NAME": "memory", "ERROR_RATE": 1},
+        }
+        user = User.objects.create(
+            username="signup", email="signup@example.com", phone_number="+491510000003"
+        )
+
+        with pytest.raises(memory.SmsProviderError):
+            PhoneOtpMixin().send_sms_otp(user, ReasonOptions.PHONE_NUMBER_ACTIVATION)
+        assert mail.outbox == []
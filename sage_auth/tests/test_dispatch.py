@@ -0,0 +1,154 @@
+# sage_auth/tests/test_dispatch.py
+import threading
+
+import pytest
+
+from sage_auth.dispatch import DeferredSignal, SignalDispatcher, dispatcher
+from sage_auth.helpers.metrics import metrics
+
+
+class TestDeferredSignal:
+    """Test cases for the deferred signal dispatch mode."""
+
+    def test_sync_mode_runs_every_receiver_inline(self):
+        """Test that the default mode behaves like a regular signal."""
+        signal = DeferredSignal()
+        calls = []
+
+        def on_event(sender, **kwargs):
+            calls.append(kwargs["value"])
+
+        def on_batch(signal, events, **kwargs):
+            calls.append([named["value"] for _, named in events])
+
+        signal.connect(on_event)
+        signal.connect(on_batch, batch=True)
+        signal.send(sender=None, value=1)
+
+        assert calls == [1, [1]]
+
+    @pytest.mark.django_db
+    def test_deferred_mode_queues_after_commit(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        """Test that only synchronous receivers run before the commit."""
+        settings.AUTH_SIGNAL_DISPATCH = "deferred"
+        signal = DeferredSignal()
+        inline, deferred, batches = [], [], []
+
+        def on_inline(sender, **kwargs):
+            inline.append(kwargs["value"])
+
+        def on_event(sender, **kwargs):
+            deferred.append(kwargs["value"])
+
+        def on_batch(signal, events, **kwargs):
+            batches.extend(named["value"] for _, named in events)
+
+        signal.connect(on_inline, synchronous=True)
+        signal.connect(on_event)
+        signal.connect(on_batch, batch=True)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            signal.send(sender=None, value=1)
+            signal.send(sender=None, value=2)
+            assert inline == [1, 2]
+            assert deferred == []
+        dispatcher.flush()
+
+        assert len(callbacks) == 2
+        assert deferred == [1, 2]
+        assert batches == [1, 2]
+
+    @pytest.mark.django_db
+    def test_failing_deferred_receiver_is_isolated(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        """Test that a failing receiver does not stop the worker."""
+        settings.AUTH_SIGNAL_DISPATCH = "deferred"
+        signal = DeferredSignal()
+        calls = []
+
+        def broken(sender, **kwargs):
+            raise RuntimeError("receiver failed")
+
+        def on_event(sender, **kwargs):
+            calls.append(kwargs["value"])
+
+        signal.connect(broken)
+        signal.connect(on_event)
+        with django_capture_on_commit_callbacks(execute=True):
+            signal.send(sender=None, value=1)
+        dispatcher.flush()
+
+        assert calls == [1]
+
+
+class TestSignalDispatcher:
+    """Test cases for the background signal dispatcher."""
+
+    def test_full_queue_delivers_inline(self, settings):
+        """Test that events past the queue size run on the sending thread."""
+        settings.AUTH_SIGNAL_QUEUE_SIZE = 1
+        settings.AUTH_METRICS_ENABLED = True
+        metrics.reset()
+        worker = SignalDispatcher()
+        signal = DeferredSignal()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def on_event(sender, **kwargs):
+            if kwargs["value"] == 1:
+                started.set()
+                release.wait(5)
+            calls.append((kwargs["value"], threading.current_thread().name))
+
+        signal.connect(on_event)
+        worker.put(signal, None, {"value": 1})
+        assert started.wait(5)
+        worker.put(signal, None, {"value": 2})
+        worker.put(signal, None, {"value": 3})
+        assert calls == [(3, threading.current_thread().name)]
+
+        release.set()
+        worker.flush()
+        assert [value for value, _ in calls] == [3, 1, 2]
+        counters, _, _ = metrics.collect()
+        assert counters[("sage_auth_signal_overflow_total", ())] == 1
+
+    def test_restarts_after_fork_and_dead_thread(self):
+        """Test that a dead thread or a new process gets a fresh worker."""
+        worker = SignalDispatcher()
+        worker.start()
+        first_queue, first_thread = worker.queue, worker._thread
+
+        worker._pid = -1
+        worker.start()
+        assert worker.queue is not first_queue
+        assert worker._thread is not first_thread
+
+        worker._thread = threading.Thread(target=lambda: None)
+        worker._thread.start()
+        worker._thread.join()
+        assert not worker.running()
+        worker.start()
+        assert worker.running()
+
+    def test_flush_gives_up_after_timeout(self):
+        """Test that a hung receiver does not block the flush forever."""
+        worker = SignalDispatcher()
+        signal = DeferredSignal()
+        started, release = threading.Event(), threading.Event()
+
+        def on_event(sender, **kwargs):
+            started.set()
+            release.wait(5)
+
+        signal.connect(on_event)
+        worker.put(signal, None, {"value": 1})
+        assert started.wait(5)
+        worker.put(signal, None, {"value": 2})
+
+        worker.flush(timeout=0.05)
+        assert worker.queue.qsize() == 0
+        release.set()
@@ -0,0 +1,133 @@
+# sage_auth/tests/test_flow.py
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+from django.http import HttpResponse
+
+from sage_auth.checks import check_flow_state_backend
+from sage_auth.middleware import FlowStateMiddleware
+from sage_auth.utils.flow import (
+    EXPIRY_KEY,
+    STEP_RESET,
+    FlowState,
+    SignedFlowState,
+)
+
+User = get_user_model()
+
+
+class TestFlowState:
+    """Test cases for the session backed OTP flow state."""
+
+    def test_update_sets_flat_keys_once(self, rf):
+        """Test that values are stored flat and shared on the request."""
+        request = rf.get("/")
+        request.session = SessionStore()
+        flow = FlowState.from_request(request)
+        flow.update(email="user@example.com", spa=True, reason="LOGIN")
+
+        assert FlowState.from_request(request) is flow
+        assert request.session["email"] == "user@example.com"
+        assert flow.get("reason") == "LOGIN"
+        assert request.session[EXPIRY_KEY] > time.time()
+
+    def test_expired_flow_is_cleared(self, settings):
+        """Test that an idle flow is removed on the next read."""
+        settings.AUTH_FLOW_STATE_TTL = 60
+        session = SessionStore()
+        session["unrelated"] = 1
+        flow = FlowState(session)
+        flow.update(email="user@example.com", changing_password=True)
+        session[EXPIRY_KEY] = time.time() - 1
+
+        assert flow.get("email") is None
+        assert "changing_password" not in session
+        assert session["unrelated"] == 1
+
+    def test_pop(self):
+        """Test that a single flag can be removed."""
+        flow = FlowState(SessionStore())
+        flow.update(changing_password=True)
+
+        assert flow.pop("changing_password") is True
+        assert flow.get("changing_password") is None
+
+
+class TestSignedFlowState:
+    """Test cases for the signed cookie OTP flow state."""
+
+    @pytest.mark.django_db
+    def test_round_trip_through_middleware(self, rf, settings):
+        """Test that the state written by the middleware is read back."""
+        settings.AUTH_FLOW_STATE_BACKEND = "signed"
+        user = User.objects.create(email="flow@example.com", username="flow")
+        request = rf.get("/")
+
+        def view(request):
+            FlowState.from_request(request).update(
+                user_id=user.pk, reason="LOGIN", step=STEP_RESET
+            )
+            return HttpResponse()
+
+        response = FlowStateMiddleware(view)(request)
+        cookie = response.cookies[SignedFlowState.cookie_name()]
+        assert cookie["httponly"]
+
+        request = rf.get("/")
+        request.COOKIES[SignedFlowState.cookie_name()] = cookie.value
+        flow = FlowState.from_request(request)
+        assert isinstance(flow, SignedFlowState)
+        assert flow.get("user_id") == user.pk
+        assert flow.get("reason") == "LOGIN"
+        assert flow.get("step") == STEP_RESET
+        assert not flow.modified
+
+    @pytest.mark.django_db
+    def test_password_change_invalidates_token(self):
+        """Test that a token stops working once the user's password changes."""
+        user = User.objects.create(email="reset@example.com", username="reset")
+        flow = SignedFlowState()
+        flow.update(user_id=user.pk, changing_password=True, step=STEP_RESET)
+        token = flow.token()
+        assert SignedFlowState.from_cookie(token).get("changing_password")
+
+        user.set_password("a-new-password")
+        user.save()
+
+        flow = SignedFlowState.from_cookie(token)
+        assert flow.get("changing_password") is None
+        assert flow.modified
+
+    def test_forged_token_is_empty(self):
+        """Test that a tampered token is ignored and marked for deletion."""
+        flow = SignedFlowState()
+        flow.update(email="user@example.com")
+        flow = SignedFlowState.from_cookie(flow.token() + "x")
+
+        assert flow.get("email") is None
+        assert flow.modified
+
+    def test_cleared_flow_deletes_cookie(self, rf, settings):
+        """Test that the cookie is removed once the flow is cleared."""
+        settings.AUTH_FLOW_STATE_BACKEND = "signed"
+        flow = SignedFlowState()
+        flow.update(email="user@example.com")
+        request = rf.get("/")
+        request.COOKIES[SignedFlowState.cookie_name()] = flow.token()
+
+        def view(request):
+            FlowState.from_request(request).clear()
+            return HttpResponse()
+
+        response = FlowStateMiddleware(view)(request)
+        assert response.cookies[SignedFlowState.cookie_name()]["max-age"] == 0
+
+    def test_check_requires_middleware(self, settings):
+        """Test that the signed backend needs the middleware installed."""
+        settings.AUTH_FLOW_STATE_BACKEND = "signed"
+        settings.MIDDLEWARE = []
+
+        errors = check_flow_state_backend(None)
+        assert [error.id for error in errors] == ["authentication.E015"]
@@ -0,0 +1,75 @@
+# sage_auth/tests/test_imports.py
+import os
+import subprocess
+import sys
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+import sage_auth.utils
+from sage_auth.benchmarks.imports import package_roots, parse_importtime
+from sage_auth.utils import set_required_fields
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     phonenumbers
+import time:        50 |        150 |   sage_auth.models.user
+import time:        20 |        170 | sage_auth.models
+import time:        10 |         10 | json
+"""
+
+
+class TestLazyImports:
+    """Test cases for the lazily imported sage_auth packages."""
+
+    def test_packages_import_no_heavy_dependencies(self):
+        """Test that importing the packages loads none of their modules."""
+        code = (
+            "import sys, sage_auth.utils, sage_auth.mixins\n"
+            "print(sorted(m for m in sys.modules if m.startswith(('sage_auth.', 'sage_sms'))))"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        ).stdout
+        assert output.strip() == (
+            "['sage_auth.helpers', 'sage_auth.helpers.lazy', 'sage_auth.mixins', 'sage_auth.utils']"
+        )
+
+    def test_attributes_resolve_on_access(self):
+        """Test that lazy attributes import their module and unknown ones fail."""
+        from sage_auth.utils.flow import FlowState
+
+        assert sage_auth.utils.FlowState is FlowState
+        assert "get_backends" in dir(sage_auth.utils)
+        with pytest.raises(AttributeError):
+            sage_auth.utils.missing_helper
+
+    def test_required_fields_follow_settings(self, settings):
+        """Test that the cached required fields change with the settings."""
+        settings.AUTHENTICATION_METHODS = {"EMAIL_PASSWORD": True, "PHONE_PASSWORD": True}
+        assert set_required_fields() == ("email", ["phone_number"])
+
+        settings.AUTHENTICATION_METHODS = {"PHONE_PASSWORD": True}
+        assert set_required_fields() == ("phone_number", [])
+
+
+class TestImportBenchmark:
+    """Test cases for the import time benchmark."""
+
+    def test_parse_importtime(self):
+        """Test that the report is rebuilt as a tree of imports."""
+        roots = parse_importtime(REPORT)
+        assert [root.name for root in roots] == ["sage_auth.models", "json"]
+        assert [node.name for node in roots[0].walk()] == [
+            "sage_auth.models",
+            "sage_auth.models.user",
+            "phonenumbers",
+        ]
+        assert [node.cumulative_us for node in package_roots(roots)] == [170]
+
+    def test_threshold_fails_command(self):
+        """Test that exceeding the threshold fails the command."""
+        with pytest.raises(CommandError, match="exceeds the threshold"):
+            call_command("benchmark_imports", repeat=1, threshold_ms=0.001, stdout=StringIO())
@@ -0,0 +1,112 @@
+# sage_auth/tests/test_login_export.py
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+from sage_auth.admin import LoginAttemptModelAdmin
+from sage_auth.models import LoginAttempt
+from sage_auth.repository.services.login_export import LoginAttemptExporter
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestLoginAttemptExport:
+    """Test cases for the streaming login attempt export."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Create attempts for two users on two days."""
+        self.alice = User.objects.create(username="alice", email="alice@example.com")
+        self.bob = User.objects.create(username="bob", email="bob@example.com")
+        self.old = LoginAttempt.objects.create(user=self.alice, failed_attempts=1)
+        LoginAttempt.objects.filter(pk=self.old.pk).update(
+            timestamp=timezone.now() - timedelta(days=2)
+        )
+        LoginAttempt.objects.create(user=self.alice, total_logins=1)
+        LoginAttempt.objects.create(user=self.bob, total_logins=1)
+
+    def test_csv_lines(self):
+        """Test that the CSV export has a header and one line per attempt."""
+        lines = list(LoginAttemptExporter(chunk_size=1).lines("csv"))
+
+        assert lines[0].startswith("id,user_id,timestamp")
+        assert len(lines) == 4
+        assert lines[1].startswith(f"{self.old.pk},{self.alice.pk},")
+
+    def test_filters(self):
+        """Test the time window and user filters."""
+        since = timezone.now() - timedelta(days=1)
+        exporter = LoginAttemptExporter(start=since, user=self.alice.pk)
+        rows = [json.loads(line) for line in exporter.lines("ndjson")]
+
+        assert len(rows) == 1
+        assert rows[0]["user_id"] == self.alice.pk
+        assert rows[0]["total_logins"] == 1
+
+    def test_export_command(self):
+        """Test that the command streams NDJSON to stdout."""
+        stdout = io.StringIO()
+        call_command("export_login_attempts", format="ndjson", user=self.bob.pk, stdout=stdout)
+
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [row["user_id"] for row in rows] == [self.bob.pk]
+
+    def test_admin_action_streams(self, rf):
+        """Test that the admin action returns a streaming download."""
+        model_admin = LoginAttemptModelAdmin(LoginAttempt, admin.site)
+        response = model_admin.export_csv(rf.get("/"), LoginAttempt.objects.all())
+
+        assert response.streaming
+        assert "attachment" in response["Content-Disposition"]
+        assert len(b"".join(response.streaming_content).splitlines()) == 4
+
+
+@pytest.mark.django_db
+class TestParquetExport:
+    """Test cases for the resumable Parquet export."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Skip when pyarrow is not installed."""
+        self.pq = pytest.importorskip("pyarrow.parquet")
+        user = User.objects.create(username="alice", email="alice@example.com")
+        for days in (3, 3, 1):
+            attempt = LoginAttempt.objects.create(user=user, total_logins=1)
+            LoginAttempt.objects.filter(pk=attempt.pk).update(
+                timestamp=timezone.now() - timedelta(days=days)
+            )
+        self.user = user
+
+    def test_incremental_export(self, tmp_path):
+        """Test partitioning and that a second run only writes new rows."""
+        from sage_auth.repository.services.parquet_export import ParquetExporter
+
+        written = ParquetExporter(str(tmp_path)).export()
+        assert len(written) == 2
+        assert self.pq.read_table(written[0]).num_rows == 2
+
+        assert ParquetExporter(str(tmp_path)).export() == []
+        LoginAttempt.objects.create(user=self.user, failed_attempts=1)
+        written = ParquetExporter(str(tmp_path)).export()
+        assert self.pq.read_table(written[0]).column("failed_attempts").to_pylist() == [1]
+
+    def test_full_export_replaces_partitions(self, tmp_path):
+        """Test that a full export after incremental runs keeps each row once."""
+        from sage_auth.repository.services.parquet_export import ParquetExporter
+
+        ParquetExporter(str(tmp_path), batch_size=1).export()
+        LoginAttempt.objects.create(user=self.user, failed_attempts=1)
+        ParquetExporter(str(tmp_path), batch_size=1).export()
+
+        call_command(
+            "export_login_parquet", str(tmp_path), "--full", stdout=io.StringIO()
+        )
+
+        assert self.pq.read_table(str(tmp_path)).num_rows == 4
@@ -0,0 +1,149 @@
+# sage_auth/tests/test_metrics.py
+import gc
+import threading
+
+import pytest
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.http import Http404
+
+from sage_auth.benchmarks.urls import LoginView
+from sage_auth.helpers.metrics import STAGE_SECONDS, MetricsRegistry, metrics
+from sage_auth.views import metrics_view
+
+User = get_user_model()
+
+
+class TestMetricsRegistry:
+    """Test cases for the in-process metrics registry."""
+
+    def test_disabled_registry_records_nothing(self, settings):
+        """Test that recording is a no-op unless metrics are enabled."""
+        settings.AUTH_METRICS_ENABLED = False
+        registry = MetricsRegistry()
+        registry.increment("sage_auth_logins_total", result="success")
+        with registry.timer(STAGE_SECONDS, flow="login", stage="total"):
+            pass
+
+        assert registry.collect() == ({}, {}, {})
+
+    def test_thread_shards_are_merged(self, settings):
+        """Test that counters recorded on several threads add up."""
+        settings.AUTH_METRICS_ENABLED = True
+        registry = MetricsRegistry()
+
+        def record():
+            for _ in range(100):
+                registry.increment("sage_auth_logins_total", result="success")
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        counters, _, _ = registry.collect()
+        assert counters[("sage_auth_logins_total", (("result", "success"),))] == 400
+
+    def test_finished_thread_shards_are_folded(self, settings):
+        """Test that the shards of exited threads do not accumulate."""
+        settings.AUTH_METRICS_ENABLED = True
+        registry = MetricsRegistry()
+
+        for _ in range(20):
+            thread = threading.Thread(
+                target=registry.increment, args=("sage_auth_logins_total",)
+            )
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert registry._shards == {}
+        counters, _, _ = registry.collect()
+        assert counters[("sage_auth_logins_total", ())] == 20
+
+    def test_render_prometheus_text(self, settings):
+        """Test the exposition of counters, gauges and histograms."""
+        settings.AUTH_METRICS_ENABLED = True
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.increment("sage_auth_otp_sent_total", channel="email")
+        registry.set_gauge("sage_auth_queue_size", 3)
+        registry.observe(STAGE_SECONDS, 0.05, flow="login", stage="hashing")
+        registry.observe(STAGE_SECONDS, 0.5, flow="login", stage="hashing")
+
+        text = registry.render()
+        assert '# TYPE sage_auth_otp_sent_total counter' in text
+        assert 'sage_auth_otp_sent_total{channel="email"} 1' in text
+        assert "sage_auth_queue_size 3" in text
+        assert 'sage_auth_stage_seconds_bucket{flow="login",stage="hashing",le="0.1"} 1' in text
+        assert 'sage_auth_stage_seconds_bucket{flow="login",stage="hashing",le="+Inf"} 2' in text
+        assert 'sage_auth_stage_seconds_count{flow="login",stage="hashing"} 2' in text
+
+
+class TestMetricsView:
+    """Test cases for the Prometheus endpoint."""
+
+    def test_disabled_view_is_not_found(self, rf, settings):
+        """Test that the endpoint is hidden while metrics are disabled."""
+        settings.AUTH_METRICS_ENABLED = False
+        with pytest.raises(Http404):
+            metrics_view(rf.get("/metrics/"))
+
+    def test_enabled_view_serves_text(self, rf, settings):
+        """Test that the endpoint serves the Prometheus content type."""
+        settings.AUTH_METRICS_ENABLED = True
+        response = metrics_view(rf.get("/metrics/"))
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+
+
+@pytest.mark.django_db
+class TestSageModelBackend:
+    """Test cases for the login stage timings of the auth backend."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        """Use the timed backend with a fast hasher."""
+        settings.AUTH_METRICS_ENABLED = True
+        settings.AUTHENTICATION_BACKENDS = ["sage_auth.backends.auth.SageModelBackend"]
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        metrics.reset()
+
+    def create_user(self, **fields):
+        user = User(email="login@example.com", username="login", **fields)
+        user.set_password("secret123")
+        user.save()
+        return user
+
+    def test_successful_login_records_stages(self, rf):
+        """Test that the lookup and hashing stages are recorded on success."""
+        user = self.create_user()
+        request = rf.post("/login/")
+
+        assert authenticate(request, username=user.email, password="secret123") == user
+        assert request.sage_auth_credentials == (user, True)
+        _, _, histograms = metrics.collect()
+        for stage in ("user_lookup", "hashing"):
+            key = (STAGE_SECONDS, (("flow", "login"), ("stage", stage)))
+            assert sum(histograms[key][:-1]) == 1
+
+    def test_inactive_login_is_not_hashed_twice(self, rf, monkeypatch):
+        """Test that the login view reuses the backend's password check."""
+        self.create_user(is_active=False)
+        monkeypatch.setattr(
+            "sage_auth.mixins.login.check_password",
+            lambda *args: pytest.fail("The password was hashed again."),
+        )
+        request = rf.post(
+            "/login/", {"username": "login@example.com", "password": "secret123"}
+        )
+        SessionMiddleware(lambda request: None).process_request(request)
+        request._messages = FallbackStorage(request)
+        request._dont_enforce_csrf_checks = True
+
+        response = LoginView.as_view()(request)
+
+        assert response.status_code == 302
+        assert response.url == "/reactivate/"
@@ -0,0 +1,99 @@
+# sage_auth/tests/test_profiler.py
+import base64
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+from django.urls import ResolverMatch
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from sage_auth.helpers.profiler import (
+    QueryProfileBuffer,
+    QueryRecorder,
+    assert_query_budget,
+    query_profiles,
+)
+from sage_auth.middleware import QueryProfilerMiddleware
+from sage_auth.mixins import ActivateAccountMixin
+
+User = get_user_model()
+
+
+class ActivateView(ActivateAccountMixin):
+    success_url = "/login/"
+    register_url = "/register/"
+
+
+@pytest.mark.django_db
+class TestQueryBudget:
+    """Test cases for the per-view query budget helper."""
+
+    def test_budget_exceeded_lists_statements(self):
+        """Test that going over the budget fails with the statements."""
+        with pytest.raises(AssertionError, match="2 queries executed, the budget is 1"):
+            with assert_query_budget(1):
+                User.objects.count()
+                User.objects.exists()
+
+    def test_activation_view_budget(self, rf):
+        """Test that a valid activation link stays within two queries."""
+        user = User.objects.create(username="new", email="new@example.com", is_active=False)
+        request = rf.get("/activate/")
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+        view = ActivateView.as_view()
+
+        with assert_query_budget(2):
+            view(
+                request,
+                uidb64=urlsafe_base64_encode(force_bytes(user.pk)),
+                token=default_token_generator.make_token(user),
+                ts=base64.urlsafe_b64encode(str(int(time.time())).encode()).decode(),
+            )
+
+
+@pytest.mark.django_db
+class TestQueryProfilerMiddleware:
+    """Test cases for recording query profiles of auth views."""
+
+    def test_auth_view_is_recorded(self, rf):
+        """Test that the queries of a sage_auth view land in the buffer."""
+        query_profiles.clear()
+        view = ActivateView.as_view()
+
+        def get_response(request):
+            request.resolver_match = ResolverMatch(view, (), {})
+            User.objects.count()
+            return None
+
+        QueryProfilerMiddleware(get_response)(rf.get("/activate/"))
+        worst = query_profiles.worst()
+
+        assert worst[0]["view"].endswith("test_profiler.ActivateView")
+        assert worst[0]["max_queries"] == 1
+        assert "COUNT" in worst[0]["slowest_sql"]
+
+    def test_buffer_is_bounded(self):
+        """Test that only the most recent requests are kept."""
+        buffer = QueryProfileBuffer(size=2)
+        for index in range(3):
+            recorder = QueryRecorder()
+            recorder.count = index
+            buffer.record("view", "/", recorder)
+
+        assert [entry["queries"] for entry in buffer.entries] == [1, 2]
+
+    def test_admin_page(self, client):
+        """Test that the worst offenders page renders for staff."""
+        superuser = User.objects.create(
+            username="root", email="root@example.com", is_superuser=True, is_staff=True
+        )
+        client.force_login(superuser)
+        response = client.get("/admin/sage_auth/loginattempt/query-profiles/")
+
+        assert response.status_code == 200
+        assert b"Query profiles" in response.content
@@ -0,0 +1,104 @@
+# sage_auth/tests/test_scheduler.py
+import threading
+import time
+
+import pytest
+from sage_otp.helpers.choices import ReasonOptions
+
+from sage_auth.helpers.metrics import metrics
+from sage_auth.utils.scheduler import DeliveryScheduler, lane_for
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not reached.")
+        time.sleep(0.005)
+
+
+def hold_slot(scheduler, reason, release, order):
+    def run():
+        with scheduler.slot(reason) as lane:
+            order.append(lane)
+            release.wait()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+class TestDeliveryScheduler:
+    """Test cases for the priority lane delivery scheduler."""
+
+    def test_lanes_follow_reasons(self):
+        """Test that reasons map to their priority lane."""
+        assert lane_for(ReasonOptions.LOGIN) == "interactive"
+        assert lane_for(ReasonOptions.FORGET_PASSWORD) == "interactive"
+        assert lane_for(ReasonOptions.EMAIL_ACTIVATION) == "activation"
+        assert lane_for("bulk") == "bulk"
+        assert lane_for(None) == "bulk"
+
+    def test_disabled_without_lanes(self, settings):
+        """Test that slots are not limited without AUTH_DELIVERY_LANES."""
+        settings.AUTH_DELIVERY_LANES = None
+        scheduler = DeliveryScheduler()
+        with scheduler.slot("bulk"), scheduler.slot("bulk"):
+            assert scheduler.in_flight()["bulk"] == 0
+
+    def test_bulk_backlog_does_not_delay_login(self, settings):
+        """Test that a full bulk lane leaves interactive sends running."""
+        settings.AUTH_DELIVERY_LANES = {"bulk": 1}
+        scheduler = DeliveryScheduler()
+        release, order = threading.Event(), []
+        threads = [hold_slot(scheduler, "bulk", release, order) for _ in range(3)]
+        wait_for(lambda: len(order) == 1)
+
+        with scheduler.slot(ReasonOptions.LOGIN) as lane:
+            assert lane == "interactive"
+            assert scheduler.in_flight() == {"interactive": 1, "activation": 0, "bulk": 1}
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert order == ["bulk"] * 3
+
+    def test_capacity_goes_to_highest_priority(self, settings):
+        """Test that a freed slot goes to the waiting interactive send first."""
+        settings.AUTH_DELIVERY_LANES = {}
+        settings.AUTH_DELIVERY_CAPACITY = 1
+        scheduler = DeliveryScheduler()
+        release, order = threading.Event(), []
+        threads = [hold_slot(scheduler, "bulk", release, order)]
+        wait_for(lambda: order == ["bulk"])
+
+        threads.append(hold_slot(scheduler, "bulk", release, order))
+        wait_for(lambda: len(scheduler._waiting) == 1)
+        threads.append(hold_slot(scheduler, ReasonOptions.LOGIN, release, order))
+        wait_for(lambda: len(scheduler._waiting) == 2)
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert order == ["bulk", "interactive", "bulk"]
+
+    def test_wait_timeout_sends_without_slot(self, settings):
+        """Test that a send stuck behind a full lane goes out after the wait."""
+        settings.AUTH_DELIVERY_LANES = {"bulk": 1}
+        settings.AUTH_DELIVERY_WAIT = 0.05
+        settings.AUTH_METRICS_ENABLED = True
+        metrics.reset()
+        scheduler = DeliveryScheduler()
+        release, order = threading.Event(), []
+        thread = hold_slot(scheduler, "bulk", release, order)
+        wait_for(lambda: order == ["bulk"])
+
+        with scheduler.slot("bulk") as lane:
+            assert lane == "bulk"
+            assert scheduler.in_flight()["bulk"] == 1
+
+        release.set()
+        thread.join()
+        assert scheduler.in_flight()["bulk"] == 0
+        counters, _, _ = metrics.collect()
+        assert counters[("sage_auth_delivery_wait_timeouts_total", (("lane", "bulk"),))] == 1
@@ -0,0 +1,109 @@
+# sage_auth/tests/test_single_flight.py
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.messages import get_messages
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from sage_otp.helpers.choices import ReasonOptions
+
+from sage_auth.mixins import ReactivationMixin
+from sage_auth.utils import FlowState
+from sage_auth.utils.single_flight import (
+    KEY_PREFIX,
+    PENDING,
+    forget,
+    issuance_key,
+    single_flight,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestSingleFlight:
+    """Test cases for the single-flight guard of OTP issuance."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that concurrent callers run the function once and share its result."""
+        started, release = threading.Event(), threading.Event()
+        calls, results = [], []
+
+        def issue():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "sent"
+
+        def caller():
+            results.append(single_flight("otp:1:login", issue))
+
+        threads = [threading.Thread(target=caller) for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["sent"] * 5
+
+    def test_result_is_shared_until_forgotten(self):
+        """Test that a finished result is reused until it is forgotten."""
+        assert single_flight("otp:1:login", lambda: "sent") == "sent"
+        assert single_flight("otp:1:login", lambda: "active") == "sent"
+
+        forget("otp:1:login")
+        assert single_flight("otp:1:login", lambda: "active") == "active"
+
+    def test_failed_call_releases_lock(self):
+        """Test that the next caller runs again after a failure."""
+        def fail():
+            raise RuntimeError("provider down")
+
+        with pytest.raises(RuntimeError):
+            single_flight("otp:1:login", fail)
+        assert single_flight("otp:1:login", lambda: "sent") == "sent"
+
+    def test_waiter_gets_pending_after_timeout(self, settings):
+        """Test that a waiter gives up with PENDING while the lock is held."""
+        settings.AUTH_SINGLE_FLIGHT_WAIT = 0
+        cache.add(f"{KEY_PREFIX}:lock:otp:1:login", "other")
+
+        assert single_flight("otp:1:login", lambda: "sent") == PENDING
+
+
+@pytest.mark.django_db
+class TestReactivationIssuance:
+    """Test cases for the single-flight OTP issuance of reactivation."""
+
+    def test_pending_issuance_is_reported(self, rf, settings):
+        """Test that a request giving up on a running issuance is told so."""
+        settings.AUTH_SINGLE_FLIGHT_WAIT = 0
+        user = User.objects.create(email="inactive@example.com", username="inactive")
+        cache.add(
+            f"{KEY_PREFIX}:lock:{issuance_key(user, ReasonOptions.EMAIL_ACTIVATION)}",
+            "other",
+        )
+        request = rf.get("/reactivate/")
+        SessionMiddleware(lambda request: None).process_request(request)
+        request._messages = FallbackStorage(request)
+        FlowState.from_request(request).update(email=user.email)
+
+        view = ReactivationMixin(template_name="reactivate.html")
+        view.setup(request)
+        view.get(request)
+
+        assert [str(message) for message in get_messages(request)] == [
+            "A verification code is being sent. Please wait a moment."
+        ]
@@ -0,0 +1,98 @@
+# sage_auth/tests/test_sms_memory.py
+import pytest
+
+from sage_auth.backends import memory
+from sage_auth.backends.memory import (
+    MemoryOutbox,
+    MemorySms,
+    SmsProviderError,
+    SmsRateLimitError,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_outbox():
+    memory.outbox.clear()
+    memory._rate_limiters.clear()
+    memory._rngs.clear()
+    yield
+    memory.outbox.clear()
+    memory._rate_limiters.clear()
+    memory._rngs.clear()
+
+
+class TestMemorySms:
+    """Test cases for the in-memory SMS provider."""
+
+    def test_reads_provider_from_sms_configs(self, settings):
+        """Test that the provider is configured from `SMS_CONFIGS`."""
+        settings.SMS_CONFIGS = {
+            "debug": False,
+            "provider": {"NAME": "memory", "LABEL": "primary"},
+        }
+        MemorySms(settings).send_one_message("+491510000001", "12345")
+
+        [message] = memory.outbox.messages()
+        assert message["provider"] == "primary"
+        assert message["phone_number"] == "+491510000001"
+        assert message["message"] == "12345"
+
+    def test_outbox_is_bounded(self):
+        """Test that the outbox keeps only the most recent messages."""
+        outbox = MemoryOutbox(size=2)
+        for index in range(3):
+            outbox.append(index)
+        assert outbox.messages() == [1, 2]
+
+    def test_latency_distributions(self):
+        """Test that latencies are drawn from the configured distribution."""
+        provider = MemorySms(
+            {"LATENCY": {"DISTRIBUTION": "uniform", "MIN_MS": 10, "MAX_MS": 20}, "SEED": 1}
+        )
+        samples = [provider.sample_latency() for _ in range(100)]
+        assert all(0.01 <= sample <= 0.02 for sample in samples)
+
+        provider = MemorySms({"LATENCY": {"DISTRIBUTION": "normal", "MEAN_MS": 0}})
+        assert provider.sample_latency() == 0
+
+        with pytest.raises(ValueError):
+            MemorySms({"LATENCY": {"DISTRIBUTION": "pareto"}})
+
+    def test_error_rate(self):
+        """Test that sends fail at the configured error rate."""
+        provider = MemorySms({"ERROR_RATE": 1})
+        with pytest.raises(SmsProviderError):
+            provider.send_one_message("+491510000001", "12345")
+        assert len(memory.outbox) == 0
+
+    def test_seeded_sequence_spans_instances(self):
+        """Test that a seeded provider created per send still varies its draws."""
+        config = {
+            "LABEL": "seeded",
+            "SEED": 0,
+            "ERROR_RATE": 0.5,
+            "LATENCY": {"DISTRIBUTION": "uniform", "MIN_MS": 0, "MAX_MS": 0.01},
+        }
+        failures, latencies = 0, set()
+        for index in range(200):
+            provider = MemorySms(config)
+            latencies.add(provider.sample_latency())
+            try:
+                provider.send_one_message("+491510000001", str(index))
+            except SmsProviderError:
+                failures += 1
+
+        assert 60 < failures < 140
+        assert len(memory.outbox) == 200 - failures
+        assert len(latencies) > 1
+
+    def test_rate_limit_is_shared_by_label(self):
+        """Test that instances with the same label share one rate limit."""
+        config = {"LABEL": "limited", "RATE_LIMIT": {"REQUESTS": 2, "PERIOD": 60}}
+        MemorySms(config).send_one_message("+491510000001", "1")
+        MemorySms(config).send_one_message("+491510000001", "2")
+
+        with pytest.raises(SmsRateLimitError) as error:
+            MemorySms(config).send_one_message("+491510000001", "3")
+        assert 0 < error.value.retry_after <= 60
+        assert len(memory.outbox) == 2
@@ -0,0 +1,105 @@
+# sage_auth/tests/test_sms_router.py
+import pytest
+
+from sage_auth.backends import memory, router
+from sage_auth.backends.router import RouterSms, SmsRoutingError, routing_state
+from sage_auth.checks import check_sms_router
+from sage_auth.helpers.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    memory.outbox.clear()
+    router._health.clear()
+    yield
+    memory.outbox.clear()
+    router._health.clear()
+
+
+def router_settings(*providers, **options):
+    return {"debug": False, "provider": {"NAME": "router", "PROVIDERS": list(providers), **options}}
+
+
+HEALTHY = {"NAME": "memory", "LABEL": "healthy"}
+BROKEN = {"NAME": "memory", "LABEL": "broken", "ERROR_RATE": 1}
+
+
+class TestRouterSms:
+    """Test cases for the failover SMS router."""
+
+    def test_sends_through_first_provider(self):
+        """Test that a healthy primary provider gets the message."""
+        RouterSms(router_settings(HEALTHY, BROKEN)).send_one_message("+491510000001", "1")
+
+        [message] = memory.outbox.messages()
+        assert message["provider"] == "healthy"
+
+    def test_fails_over_and_opens_circuit(self, settings):
+        """Test that failures fail over and open the primary's circuit."""
+        settings.AUTH_METRICS_ENABLED = True
+        metrics.reset()
+        provider = RouterSms(router_settings(BROKEN, HEALTHY, FAILURE_THRESHOLD=2))
+
+        for index in range(3):
+            provider.send_one_message("+491510000001", str(index))
+
+        assert [m["provider"] for m in memory.outbox.messages()] == ["healthy"] * 3
+        state = routing_state()
+        assert state["broken"]["state"] == "open"
+        assert state["broken"]["failures"] == 2
+        assert state["healthy"]["state"] == "closed"
+
+        _, gauges, _ = metrics.collect()
+        assert gauges[("sage_auth_sms_provider_circuit_open", (("provider", "broken"),))] == 1
+
+    def test_half_open_probe_closes_circuit(self):
+        """Test that a successful probe after the reset period closes the circuit."""
+        health = router.provider_health("flaky")
+        health.record_failure(threshold=1)
+        assert not health.allow(reset_seconds=60)
+
+        assert health.allow(reset_seconds=0)
+        assert not health.allow(reset_seconds=0)
+        health.record_success(10, alpha=0.2, slow_ms=None)
+        assert health.state == "closed"
+
+    def test_skips_providers_slower_than_budget(self):
+        """Test that a provider whose average latency exceeds the budget is skipped."""
+        router.provider_health("healthy").ewma_ms = 10_000
+        provider = RouterSms(
+            router_settings(HEALTHY, {"NAME": "memory", "LABEL": "fast"}, LATENCY_BUDGET_MS=1000)
+        )
+        provider.send_one_message("+491510000001", "1")
+
+        [message] = memory.outbox.messages()
+        assert message["provider"] == "fast"
+
+    def test_slow_provider_is_still_tried(self):
+        """Test that one send slower than the budget does not starve the router."""
+        router.provider_health("healthy").record_success(300, alpha=0.2, slow_ms=None)
+        provider = RouterSms(router_settings(HEALTHY, LATENCY_BUDGET_MS=200))
+
+        assert provider.route("send_one_message", "+491510000001", "1") == "healthy"
+        assert routing_state()["healthy"]["state"] == "closed"
+
+    def test_stale_latency_is_forgotten(self):
+        """Test that the average latency is dropped after the reset period."""
+        health = router.provider_health("healthy")
+        health.record_success(300, alpha=0.2, slow_ms=None)
+
+        assert health.expected_ms(reset_seconds=60) == 300
+        assert health.expected_ms(reset_seconds=0) is None
+        assert health.ewma_ms is None
+
+    def test_raises_when_every_provider_fails(self):
+        """Test that SmsRoutingError is raised when nothing delivered."""
+        with pytest.raises(SmsRoutingError):
+            RouterSms(router_settings(BROKEN)).send_one_message("+491510000001", "1")
+
+    def test_configuration_check(self, settings):
+        """Test that a router without providers is reported."""
+        settings.SMS_CONFIGS = router_settings()
+        assert [error.id for error in check_sms_router(None)] == ["authentication.E017"]
+
+        settings.SMS_CONFIGS = router_settings(HEALTHY)
+        assert check_sms_router(None) == []
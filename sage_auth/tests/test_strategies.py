@@ -132,3 +132,31 @@ class TestCombinedStrategy:
         assert user.is_staff
         assert not user.is_superuser
         assert user.check_password("testpassword123")
+
+    def test_validate_reports_every_colliding_field(self):
+        """Test that all taken identifiers are reported from one query."""
+        User.objects.create(email="taken@example.com", username="taken")
+        combined_strategy = CombinedStrategy(
+            [EmailStrategy(), PhoneStrategy(), UsernameStrategy()]
+        )
+        user_data = {
+            "email": "taken@example.com",
+            "phone_number": "+12345678901",
+            "username": "taken",
+        }
+        with pytest.raises(ValidationError) as error:
+            combined_strategy.validate(user_data)
+        assert set(error.value.message_dict) == {"email", "username"}
+
+    def test_find_conflicts_for_a_batch(self, django_assert_num_queries):
+        """Test that a batch of candidates is checked with a single query."""
+        User.objects.create(phone_number="+12345678901", username="existing")
+        combined_strategy = CombinedStrategy([PhoneStrategy(), UsernameStrategy()])
+        users_data = [
+            {"phone_number": "+12345678901", "username": "fresh"},
+            {"phone_number": "+19876543210", "username": "existing"},
+            {"phone_number": "+11111111111", "username": "other"},
+        ]
+        with django_assert_num_queries(1):
+            conflicts = combined_strategy.find_conflicts(users_data)
+        assert conflicts == [{"phone_number"}, {"username"}, set()]
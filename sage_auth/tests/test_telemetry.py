@@ -0,0 +1,57 @@
+# sage_auth/tests/test_telemetry.py
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Sum
+
+from sage_auth.benchmarks.telemetry import LoginTelemetryGenerator
+from sage_auth.models import LoginAttempt
+
+
+@pytest.mark.django_db
+class TestLoginTelemetryGenerator:
+    """Test cases for the synthetic login attempt generator."""
+
+    def test_generates_attempts_in_period(self):
+        """Test the row count, the period and the failure ratio."""
+        end = datetime(2024, 6, 3, 12, tzinfo=timezone.utc)
+        generator = LoginTelemetryGenerator(
+            users=20, attempts=2000, days=14, failure_ratio=0.25,
+            chunk_size=500, seed=1, end=end,
+        )
+        assert list(generator.generate()) == [500, 1000, 1500, 2000]
+
+        attempts = LoginAttempt.objects.all()
+        assert attempts.count() == 2000
+        assert attempts.filter(timestamp__lt=generator.start).count() == 0
+        assert attempts.filter(timestamp__gte=end).count() == 0
+        assert attempts.filter(created_at=None).count() == 0
+        failed = attempts.aggregate(total=Sum("failed_attempts"))["total"]
+        assert 400 < failed < 600
+
+    def test_diurnal_pattern(self):
+        """Test that the peak hour sees more traffic than the opposite hour."""
+        end = datetime(2024, 6, 3, tzinfo=timezone.utc)
+        generator = LoginTelemetryGenerator(
+            users=5, attempts=3000, days=7, peak_hour=14, amplitude=0.9, seed=2, end=end
+        )
+        list(generator.generate())
+        hours = [attempt.timestamp.hour for attempt in LoginAttempt.objects.all()]
+
+        assert hours.count(14) > 3 * hours.count(2)
+
+    def test_benchmark_command(self):
+        """Test that every metrics method is timed."""
+        call_command(
+            "generate_login_attempts", users=3, attempts=50, seed=0, stdout=io.StringIO()
+        )
+        out = io.StringIO()
+        call_command("benchmark_login_metrics", repeat=2, stdout=out)
+        results = json.loads(out.getvalue())["results"]
+
+        assert results["rows"] == 50
+        assert results["daily_metrics"]["operations"] == 2
+        assert results["sum_metrics"]["queries"] == 1
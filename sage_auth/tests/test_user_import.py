@@ -0,0 +1,146 @@
+# sage_auth/tests/test_user_import.py
+import io
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
+from django.core.management import call_command
+
+from sage_auth.repository.services.user_import import (
+    UserImportService,
+    read_csv_rows,
+    read_ndjson_rows,
+)
+from sage_auth.utils.hashing import PasswordHashingPool
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestUserImportService:
+    """Test cases for bulk user creation."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        """Enable email and username authentication."""
+        settings.AUTHENTICATION_METHODS = {
+            "EMAIL_PASSWORD": True,
+            "USERNAME_PASSWORD": True,
+        }
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+        settings.BULK_IMPORT_HASH_WORKERS = 1
+
+    def test_import_csv(self):
+        """Test that valid CSV rows are created with hashed passwords."""
+        stream = io.StringIO(
+            "email,username,password,first_name\n"
+            "a@example.com,alice,secret123,Alice\n"
+            "b@example.com,bob,secret456,Bob\n"
+        )
+        report = UserImportService(batch_size=1).import_rows(read_csv_rows(stream))
+
+        assert report.created == 2
+        assert report.failed == 0
+        alice = User.objects.get(username="alice")
+        assert alice.first_name == "Alice"
+        assert alice.check_password("secret123")
+
+    def test_reports_row_errors(self):
+        """Test that invalid, existing and duplicate rows are reported by row."""
+        User.objects.create(email="taken@example.com", username="taken")
+        rows = [
+            {"email": "taken@example.com", "username": "new"},
+            {"email": "not-an-email", "username": "broken"},
+            {"email": "dup@example.com", "username": "dup1"},
+            {"email": "dup@example.com", "username": "dup2"},
+            {"password": "secret"},
+        ]
+        report = UserImportService().import_rows(enumerate(rows, start=1))
+
+        assert report.created == 1
+        assert [error["row"] for error in report.errors] == [2, 5, 1, 4]
+        assert "email" in report.errors[2]["errors"]
+        assert "Duplicate email" in report.errors[3]["errors"]["email"][0]
+
+    def test_dry_run(self):
+        """Test that a dry run validates without creating users."""
+        rows = [{"email": "a@example.com", "username": "alice"}]
+        report = UserImportService(dry_run=True).import_rows(enumerate(rows, start=1))
+
+        assert report.created == 1
+        assert not User.objects.exists()
+
+    def test_rows_without_password_are_unusable(self):
+        """Test that a user imported without a password cannot log in."""
+        rows = [{"email": "a@example.com", "username": "alice"}]
+        UserImportService().import_rows(enumerate(rows, start=1))
+
+        assert not User.objects.get(username="alice").has_usable_password()
+
+    def test_dry_run_reports_duplicates_across_batches(self):
+        """Test that a dry run finds identifiers repeated in later batches."""
+        rows = [
+            {"email": "a@example.com", "username": "alice"},
+            {"email": "a@example.com", "username": "again"},
+        ]
+        report = UserImportService(batch_size=1, dry_run=True).import_rows(
+            enumerate(rows, start=1)
+        )
+
+        assert report.created == 1
+        assert [error["row"] for error in report.errors] == [2]
+
+    def test_import_users_command(self, tmp_path):
+        """Test the management command with an NDJSON file and error output."""
+        source = tmp_path / "users.ndjson"
+        source.write_text(
+            json.dumps({"email": "a@example.com", "username": "alice"})
+            + "\n{broken\n"
+        )
+        errors = tmp_path / "errors.ndjson"
+
+        call_command(
+            "import_users", str(source), errors=str(errors), stdout=io.StringIO()
+        )
+
+        assert User.objects.filter(username="alice").exists()
+        assert json.loads(errors.read_text())["row"] == 2
+
+    def test_parallel_hashing_across_batches(self):
+        """Test the process pool path and duplicates spread over batches."""
+        rows = [
+            {"email": f"user{i}@example.com", "username": f"user{i}", "password": f"pw{i}"}
+            for i in range(5)
+        ]
+        rows.append({"email": "user0@example.com", "username": "again"})
+        service = UserImportService(batch_size=2, workers=2, chunk_size=1)
+
+        report = service.import_rows(enumerate(rows, start=1))
+
+        assert report.created == 5
+        assert [error["row"] for error in report.errors] == [6]
+        assert User.objects.get(username="user3").check_password("pw3")
+
+    def test_hashing_pool_keeps_order(self):
+        """Test that the pool returns hashes in input order."""
+        passwords = [f"secret{i}" for i in range(10)]
+        with PasswordHashingPool(workers=2, chunk_size=3) as pool:
+            hashes = list(pool.map(passwords))
+
+        assert all(check_password(p, h) for p, h in zip(passwords, hashes))
+
+    def test_read_ndjson_rows_skips_blank_lines(self):
+        """Test that blank NDJSON lines are skipped but keep numbering."""
+        rows = list(read_ndjson_rows(io.StringIO('{"a": 1}\n\n{"b": 2}\n')))
+
+        assert rows == [(1, {"a": 1}), (3, {"b": 2})]
+
+    def test_read_ndjson_rows_rejects_non_objects(self):
+        """Test that JSON values other than objects become error rows."""
+        rows = list(read_ndjson_rows(io.StringIO('[1]\n5\n"user"\n{"a": 1}\n')))
+
+        assert [row for __, row in rows[:3]] == [
+            {"__error__": "Expected a JSON object."}
+        ] * 3
+        assert rows[3] == (4, {"a": 1})
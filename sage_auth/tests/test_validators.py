@@ -1,9 +1,18 @@
 # sage_auth/tests/test_validators.py
 
+import hashlib
+from io import StringIO
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.conf import settings
-from sage_auth.helpers.validators import CompanyEmailValidator
+from sage_auth.helpers.validators import (
+    BreachedPasswordValidator,
+    CompanyEmailValidator,
+    DisposableEmailValidator,
+)
+from sage_auth.helpers.validators.password import BreachedHashIndex
 
 
 class TestCompanyEmailValidator:
@@ -44,3 +53,137 @@ class TestCompanyEmailValidator:
         validator = CompanyEmailValidator()
 
         validator("user@anydomain.com")
+
+
+class TestDisposableEmailValidator:
+    """Test the memory-mapped DisposableEmailValidator."""
+
+    @pytest.fixture
+    def blocklist_path(self, tmp_path):
+        """Build a blocklist file with the management command."""
+        source = tmp_path / "domains.txt"
+        source.write_text(
+            "# disposable providers\nMailinator.com\n\ntempmail.org.\nguerrillamail.com\n"
+        )
+        output = tmp_path / "blocklist.dat"
+        call_command("build_email_blocklist", str(source), str(output), stdout=StringIO())
+        return str(output)
+
+    def test_build_sorts_and_normalizes(self, blocklist_path):
+        """Test the builder writes normalized domains in byte order."""
+        with open(blocklist_path, "rb") as handle:
+            assert handle.read() == b"guerrillamail.com\nmailinator.com\ntempmail.org\n"
+
+    def test_blocked_domain(self, blocklist_path, settings):
+        """Test that a listed domain is rejected."""
+        settings.EMAIL_DOMAIN_BLOCKLIST_PATH = blocklist_path
+        validator = DisposableEmailValidator()
+
+        with pytest.raises(ValidationError):
+            validator("user@mailinator.com")
+        with pytest.raises(ValidationError):
+            validator("user@TempMail.org")
+
+    def test_blocked_parent_domain(self, blocklist_path):
+        """Test that subdomains of a listed domain are rejected."""
+        validator = DisposableEmailValidator(path=blocklist_path)
+
+        with pytest.raises(ValidationError):
+            validator("user@mx.mailinator.com")
+
+    def test_allowed_domain(self, blocklist_path):
+        """Test that unlisted domains pass, including near misses."""
+        validator = DisposableEmailValidator(path=blocklist_path)
+
+        validator("user@example.com")
+        validator("user@notmailinator.com")
+        validator("user@com")
+
+    def test_empty_blocklist(self, tmp_path):
+        """Test that an empty blocklist file allows every domain."""
+        path = tmp_path / "empty.dat"
+        path.write_bytes(b"")
+
+        DisposableEmailValidator(path=str(path))("user@mailinator.com")
+
+    def test_no_blocklist_configured(self, settings):
+        """Test that the validator is a no-op without a configured file."""
+        settings.EMAIL_DOMAIN_BLOCKLIST_PATH = None
+
+        DisposableEmailValidator()("user@mailinator.com")
+
+
+class TestBreachedPasswordValidator:
+    """Test the memory-mapped BreachedPasswordValidator."""
+
+    BREACHED = ["password", "123456", "qwerty", "letmein", "dragon"]
+
+    @pytest.fixture
+    def hashes_path(self, tmp_path):
+        """Build an unsorted, multi-run hash file with the management command."""
+        source = tmp_path / "hashes.txt"
+        lines = [
+            f"{hashlib.sha1(p.encode()).hexdigest().upper()}:{i + 1}"
+            for i, p in enumerate(self.BREACHED)
+        ]
+        source.write_text("\n".join(reversed(lines + lines[:2])) + "\nnot-a-hash\n")
+        output = tmp_path / "breached.dat"
+        call_command(
+            "build_breached_passwords",
+            str(source),
+            str(output),
+            chunk_size=2,
+            stdout=StringIO(),
+        )
+        return str(output)
+
+    def test_build_deduplicates(self, hashes_path):
+        """Test the builder merges runs into one de-duplicated index."""
+        index = BreachedHashIndex(hashes_path)
+
+        assert len(index) == len(self.BREACHED)
+        records = [index.record(i) for i in range(len(index))]
+        assert records == sorted(records)
+
+    def test_breached_password(self, hashes_path, settings):
+        """Test that every listed password is rejected."""
+        settings.BREACHED_PASSWORDS_PATH = hashes_path
+        validator = BreachedPasswordValidator()
+
+        for password in self.BREACHED:
+            with pytest.raises(ValidationError):
+                validator.validate(password)
+
+    def test_safe_password(self, hashes_path):
+        """Test that unlisted passwords pass."""
+        validator = BreachedPasswordValidator(path=hashes_path)
+
+        validator.validate("correct horse battery staple")
+        validator.validate("Password")
+
+    def test_min_count(self, hashes_path, tmp_path):
+        """Test that rarely seen hashes can be left out of the build."""
+        output = tmp_path / "common.dat"
+        call_command(
+            "build_breached_passwords",
+            str(tmp_path / "hashes.txt"),
+            str(output),
+            min_count=4,
+            stdout=StringIO(),
+        )
+
+        assert len(BreachedHashIndex(str(output))) == 2
+
+    def test_invalid_file(self, tmp_path):
+        """Test that a file without the header is refused."""
+        path = tmp_path / "bogus.dat"
+        path.write_bytes(b"nope")
+
+        with pytest.raises(ValueError):
+            BreachedHashIndex(str(path))
+
+    def test_no_hash_file_configured(self, settings):
+        """Test that the validator is a no-op without a configured file."""
+        settings.BREACHED_PASSWORDS_PATH = None
+
+        BreachedPasswordValidator().validate("password")
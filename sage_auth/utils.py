@@ -10,7 +10,6 @@ from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
-from sage_sms.factory import SMSBackendFactory
 
 
 def otpCreate():
@@ -99,6 +98,8 @@ class ActivationEmailSender:
 
 
 def send_sms():
+    from sage_sms.factory import SMSBackendFactory
+
     factory = SMSBackendFactory(settings.SMS_CONFIGS, "sage_auth.backends")
     sms_provider_class = factory.get_backend()
     sms_provider = sms_provider_class(settings)
@@ -1,14 +1,24 @@
-from .email_sender import (
-    send_email_otp,
-    ActivationEmailSender
-)
-from .field import set_required_fields
+from sage_auth.helpers.lazy import lazy_module
 
-from .sms import get_backends
+# Resolved on first access (PEP 562), so importing `sage_auth.utils` for
+# one helper does not load the mail, hashing and SMS stacks of the others.
+_LAZY_ATTRIBUTES = {
+    "send_email_otp": "sage_auth.utils.email_sender",
+    "ActivationEmailSender": "sage_auth.utils.email_sender",
+    "set_required_fields": "sage_auth.utils.field",
+    "FlowState": "sage_auth.utils.flow",
+    "PasswordHashingPool": "sage_auth.utils.hashing",
+    "get_backends": "sage_auth.utils.sms",
+}
 
 __all__ = [
     "send_email_otp",
     "set_required_fields",
+    "FlowState",
     "get_backends",
-    "ActivationEmailSender"
+    "ActivationEmailSender",
+    "PasswordHashingPool",
 ]
+
+
+__getattr__, __dir__ = lazy_module(globals(), _LAZY_ATTRIBUTES)
@@ -0,0 +1,57 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def background_enabled():
+    return getattr(settings, "AUTH_BACKGROUND_TASKS", True)
+
+
+def get_executor():
+    """Return the process-wide thread pool, created on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "AUTH_BACKGROUND_WORKERS", 2),
+                    thread_name_prefix="sage_auth",
+                )
+    return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed.", getattr(func, "__name__", func))
+    finally:
+        close_old_connections()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Run `func(*args, **kwargs)` on a worker thread once the current
+    transaction commits, so slow I/O such as sending an email does not hold
+    the request.
+
+    Exceptions are logged instead of raised, since the response has already
+    been returned. With `AUTH_BACKGROUND_TASKS = False` the call runs inline,
+    which is useful in tests and management commands.
+
+    Examples
+    --------
+    >>> run_in_background(send_mail, subject, message, sender, [user.email])
+    """
+    if not background_enabled():
+        transaction.on_commit(lambda: func(*args, **kwargs))
+        return
+    transaction.on_commit(lambda: get_executor().submit(_run, func, args, kwargs))
@@ -0,0 +1,152 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils.module_loading import import_string
+from sage_otp.helpers.choices import ReasonOptions
+
+from sage_auth.helpers.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CHANNELS = ("email", "phone")
+CHANNEL_FIELDS = {"email": "email", "phone": "phone_number"}
+# Activation codes prove ownership of their channel, so they never move.
+FALLBACK_REASONS = (
+    ReasonOptions.LOGIN,
+    ReasonOptions.FORGET_PASSWORD,
+    ReasonOptions.RESET_PASSWORD,
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def otp_fallback_enabled():
+    return getattr(settings, "OTP_CHANNEL_FALLBACK", False)
+
+
+def get_delivery_executor():
+    """Return the thread pool sending OTPs under a deadline, created on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, "OTP_DELIVERY_WORKERS", 4),
+                    thread_name_prefix="sage_auth_otp",
+                )
+    return _executor
+
+
+def channel_address(user, channel):
+    """Return the user's email or phone number, or None if it is not set."""
+    value = getattr(user, CHANNEL_FIELDS[channel])
+    return str(value) if value else None
+
+
+def channel_verified(user, channel):
+    """
+    Return whether `user` has verified `channel`.
+
+    By default a channel counts as verified when the user is active and has
+    an address on it: `SageUser` keeps no per-channel verification, and an
+    account only becomes active through a completed activation. Set
+    `OTP_CHANNEL_VERIFIED` to the dotted path of a `check(user, channel)`
+    callable for user models that track each channel.
+    """
+    check = getattr(settings, "OTP_CHANNEL_VERIFIED", None)
+    if check is not None:
+        return bool(import_string(check)(user, channel))
+    return bool(user.is_active and channel_address(user, channel))
+
+
+def _send(sender, token, address):
+    try:
+        sender(token, address)
+    finally:
+        close_old_connections()
+
+
+class OtpDeliveryPolicy:
+    """
+    Send an OTP on its primary channel and fall back to the other one.
+
+    With `OTP_CHANNEL_FALLBACK` enabled, an OTP for login or a password
+    reset, and a verified address on the other channel (see
+    `channel_verified`), the primary send runs on a worker thread and gets `OTP_DELIVERY_DEADLINE`
+    seconds (3 by default). If it fails or is still running then, the same
+    token is sent on the other channel, so both messages carry the code of
+    the same OTP record. A late primary send is not cancelled. Otherwise the
+    primary send runs inline, as before; activation codes in particular are
+    only ever sent to the channel they activate.
+
+    Parameters
+    ----------
+    senders : dict
+        Maps each channel to a `sender(token, address)` callable.
+    deadline : float, optional
+        Seconds given to the primary channel.
+
+    Examples
+    --------
+    >>> policy = OtpDeliveryPolicy({"email": send_email_otp, "phone": send_sms})
+    >>> channel = policy.deliver(user, otp.token, "email", ReasonOptions.LOGIN)
+    """
+
+    def __init__(self, senders, deadline=None):
+        self.senders = senders
+        if deadline is None:
+            deadline = getattr(settings, "OTP_DELIVERY_DEADLINE", 3)
+        self.deadline = deadline
+
+    def fallback_channel(self, user, primary, reason):
+        if not otp_fallback_enabled() or reason not in FALLBACK_REASONS:
+            return None
+        for channel in CHANNELS:
+            if (
+                channel != primary
+                and channel in self.senders
+                and channel_address(user, channel)
+                and channel_verified(user, channel)
+            ):
+                return channel
+        return None
+
+    def deliver(self, user, token, primary, reason):
+        """Send `token` for `reason` to `user` and return the channel used."""
+        address = channel_address(user, primary)
+        fallback = self.fallback_channel(user, primary, reason)
+        if fallback is None:
+            self.senders[primary](token, address)
+            return primary
+
+        future = get_delivery_executor().submit(
+            _send, self.senders[primary], token, address
+        )
+        try:
+            future.result(timeout=self.deadline)
+            return primary
+        except FutureTimeoutError:
+            cause = "deadline"
+            logger.warning(
+                "OTP delivery by %s missed its %ss deadline for user ID: %s.",
+                primary,
+                self.deadline,
+                user.id,
+            )
+        except Exception as error:
+            cause = "error"
+            logger.warning(
+                "OTP delivery by %s failed for user ID: %s. Error: %s",
+                primary,
+                user.id,
+                error,
+            )
+
+        metrics.increment("sage_auth_otp_fallbacks_total", channel=fallback, cause=cause)
+        self.senders[fallback](token, channel_address(user, fallback))
+        return fallback
@@ -8,6 +8,12 @@ from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 import base64
 
+from sage_otp.helpers.choices import ReasonOptions
+
+from sage_auth.helpers.metrics import STAGE_SECONDS, metrics
+from sage_auth.utils.background import run_in_background
+from sage_auth.utils.scheduler import delivery_scheduler
+
 
 def send_email_otp(token, email):
     """
@@ -41,7 +47,12 @@ class ActivationEmailSender:
     embedded into an email message. The link allows the user to activate their 
     account by clicking it, verifying their identity in the process.
     """
-    def send_activation_email(self, user, request):
+    def send_activation_email(self, user, request, asynchronous=False):
+        """
+        Send the activation email to `user`. With `asynchronous=True` the
+        link and message are built in the request and the SMTP send runs on
+        a background thread after the transaction commits.
+        """
         # Generate token, UID, and timestamp
         token = default_token_generator.make_token(user)
         uid = urlsafe_base64_encode(force_bytes(user.pk))
@@ -58,4 +69,14 @@ class ActivationEmailSender:
                 "activation_url": activation_url,
             },
         )
-        send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [user.email])
+        if asynchronous:
+            run_in_background(self.deliver, subject, message, user.email)
+        else:
+            self.deliver(subject, message, user.email)
+
+    def deliver(self, subject, message, email):
+        with delivery_scheduler.slot(ReasonOptions.EMAIL_ACTIVATION), metrics.timer(
+            STAGE_SECONDS, flow="activation", stage="delivery"
+        ):
+            send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, [email])
+        metrics.increment("sage_auth_activation_emails_total")
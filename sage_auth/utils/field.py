@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.conf import settings
 
 def set_required_fields():
@@ -10,6 +12,9 @@ def set_required_fields():
     and any additional required fields for user creation
     or login (e.g., email, phone number, username). 
 
+    The result is cached per value of `AUTHENTICATION_METHODS`, so the
+    modules and requests calling it repeatedly only inspect it once, while
+    overridden settings still get their own answer.
     """
     if not any(settings.AUTHENTICATION_METHODS.values()):
         auth_methods = {
@@ -18,11 +23,20 @@ def set_required_fields():
         }
         settings.AUTHENTICATION_METHODS = auth_methods
 
+    username_field, required_fields = _fields_for_methods(
+        tuple(settings.AUTHENTICATION_METHODS.items())
+    )
+    # A new list each time, so callers can extend it.
+    return username_field, list(required_fields)
+
+
+@lru_cache(maxsize=16)
+def _fields_for_methods(methods):
     username_field = None
     required_fields = []
 
-    for method in settings.AUTHENTICATION_METHODS:
-        if settings.AUTHENTICATION_METHODS[method]:
+    for method, enabled in methods:
+        if enabled:
             if username_field is None:
                 if method == "EMAIL_PASSWORD":
                     username_field = "email"
@@ -38,5 +52,5 @@ def set_required_fields():
                 elif method == "USERNAME_PASSWORD":
                     required_fields.append("username")
 
-    required_fields = list(set(required_fields))
-    return username_field, required_fields
+    return username_field, tuple(set(required_fields))
+
@@ -0,0 +1,187 @@
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+FLOW_KEYS = ("email", "user_id", "spa", "reason", "step", "changing_password")
+EXPIRY_KEY = "flow_expires_at"
+FLOW_BACKENDS = ("session", "signed")
+
+# The flow steps: a code was sent, then verified for a password reset.
+STEP_VERIFY = "verify"
+STEP_RESET = "reset"
+
+# Short aliases keep the signed token compact.
+TOKEN_ALIASES = {
+    "email": "e",
+    "user_id": "u",
+    "spa": "s",
+    "reason": "r",
+    "step": "t",
+    "changing_password": "c",
+    EXPIRY_KEY: "x",
+}
+FINGERPRINT_KEY = "f"
+TOKEN_SALT = "sage_auth.flow"  # noqa: S105 - a signing namespace, not a secret
+
+
+def flow_state_ttl():
+    return getattr(settings, "AUTH_FLOW_STATE_TTL", 1800)
+
+
+def password_fingerprint(user_id):
+    """Return a keyed digest of the password hash of `user_id`, or None."""
+    password = (
+        get_user_model()
+        ._default_manager.filter(pk=user_id)
+        .values_list("password", flat=True)
+        .first()
+    )
+    if password is None:
+        return None
+    return salted_hmac(f"{TOKEN_SALT}.password", password).hexdigest()[:16]
+
+
+class FlowState:
+    """
+    The state of an OTP flow (signup, login, password reset) for a request.
+
+    The mixins keep the user identifier, the OTP reason and a few flags
+    between the steps of a flow. `FlowState` gathers all of them in one
+    place: values are set together with `update()` and written by the
+    session middleware once at the end of the response, instead of being
+    assigned one by one with explicit `session.save()` calls in between.
+
+    Every update refreshes an expiry timestamp. Once the flow has been idle
+    for `AUTH_FLOW_STATE_TTL` seconds (1800 by default) its keys are removed
+    from the session on the next read, so abandoned flows do not linger.
+
+    The keys are stored flat in the session (`email`, `user_id`, `spa`,
+    `reason`, `step`, `changing_password`), so templates and views reading
+    them directly keep working.
+
+    With `AUTH_FLOW_STATE_BACKEND = "signed"`, `from_request` returns a
+    `SignedFlowState` instead, which keeps the same values in a signed
+    cookie.
+
+    Examples
+    --------
+    >>> flow = FlowState.from_request(request)
+    >>> flow.update(email=user.email, spa=True, reason=ReasonOptions.LOGIN)
+    >>> flow.get("email")
+    """
+
+    def __init__(self, session):
+        self.session = session
+
+    @classmethod
+    def from_request(cls, request):
+        """Return the flow state of `request`, shared by all mixins."""
+        flow = getattr(request, "sage_auth_flow", None)
+        if flow is None:
+            if getattr(settings, "AUTH_FLOW_STATE_BACKEND", "session") == "signed":
+                flow = SignedFlowState.from_cookie(
+                    request.COOKIES.get(SignedFlowState.cookie_name())
+                )
+            else:
+                flow = cls(request.session)
+            request.sage_auth_flow = flow
+        return flow
+
+    @property
+    def ttl(self):
+        return flow_state_ttl()
+
+    def expired(self):
+        expires_at = self.session.get(EXPIRY_KEY)
+        return expires_at is not None and expires_at < time.time()
+
+    def get(self, key, default=None):
+        if self.expired():
+            self.clear()
+        return self.session.get(key, default)
+
+    def update(self, **values):
+        """Set several flow values at once and extend the expiry."""
+        for key, value in values.items():
+            self.session[key] = value
+        self.session[EXPIRY_KEY] = int(time.time()) + self.ttl
+
+    def pop(self, key, default=None):
+        return self.session.pop(key, default)
+
+    def clear(self):
+        """Remove every flow key from the session."""
+        for key in FLOW_KEYS + (EXPIRY_KEY,):
+            self.session.pop(key, None)
+
+
+class SignedFlowState(FlowState):
+    """
+    A flow state carried in a compact signed cookie instead of the session.
+
+    The values, including the user's pk, are serialized with
+    `django.core.signing` (compressed, with a timestamp) and checked against
+    `AUTH_FLOW_STATE_TTL` when read back, so the OTP flow needs no session
+    store read or write. `FlowStateMiddleware` writes the cookie when the
+    state changed during the request.
+
+    A token carrying a user also carries a fingerprint of that user's
+    password hash. Once the password changes, for instance when the reset
+    the token was issued for completes, the token no longer matches and is
+    read as an empty flow, so a captured cookie cannot be replayed.
+    """
+
+    def __init__(self, data=None):
+        super().__init__(data or {})
+        self.modified = False
+
+    @staticmethod
+    def cookie_name():
+        return getattr(settings, "AUTH_FLOW_COOKIE_NAME", "sage_auth_flow")
+
+    @classmethod
+    def from_cookie(cls, token):
+        """Decode a cookie value; a missing, forged or stale token is empty."""
+        if not token:
+            return cls()
+        try:
+            payload = signing.loads(token, salt=TOKEN_SALT, max_age=flow_state_ttl())
+        except signing.BadSignature:
+            return cls.rejected()
+        fingerprint = payload.pop(FINGERPRINT_KEY, None)
+        user_id = payload.get(TOKEN_ALIASES["user_id"])
+        if user_id is not None and not constant_time_compare(
+            fingerprint or "", password_fingerprint(user_id) or ""
+        ):
+            return cls.rejected()
+        names = {alias: key for key, alias in TOKEN_ALIASES.items()}
+        return cls({names.get(alias, alias): value for alias, value in payload.items()})
+
+    @classmethod
+    def rejected(cls):
+        """Return an empty flow that deletes the cookie it replaces."""
+        flow = cls()
+        flow.modified = True
+        return flow
+
+    def token(self):
+        payload = {TOKEN_ALIASES.get(key, key): value for key, value in self.session.items()}
+        user_id = self.session.get("user_id")
+        if user_id is not None:
+            payload[FINGERPRINT_KEY] = password_fingerprint(user_id)
+        return signing.dumps(payload, salt=TOKEN_SALT, compress=True)
+
+    def update(self, **values):
+        super().update(**values)
+        self.modified = True
+
+    def pop(self, key, default=None):
+        self.modified = self.modified or key in self.session
+        return super().pop(key, default)
+
+    def clear(self):
+        self.modified = self.modified or bool(self.session)
+        super().clear()
@@ -0,0 +1,88 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+logger = logging.getLogger(__name__)
+
+
+def _initialize_worker(settings_module):
+    """
+    Make sure Django is configured in a pool worker.
+
+    Forked workers inherit the parent's configured settings; workers started
+    with the `spawn` or `forkserver` methods import Django from scratch and
+    need `django.setup()` before any hasher can be loaded.
+    """
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        if settings_module:
+            os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+        django.setup()
+
+
+class PasswordHashingPool:
+    """
+    Hash passwords across all CPU cores with a process pool.
+
+    Password hashers such as PBKDF2 and Argon2 are deliberately slow and hold
+    the GIL, so hashing a large number of passwords in one process is bound to
+    a single core. This pool fans `make_password` out to worker processes in
+    chunks and yields the encoded hashes in input order.
+
+    With `workers` set to 1 (or less) the passwords are hashed inline, which
+    avoids the process start-up cost for small jobs.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of worker processes. Defaults to `BULK_IMPORT_HASH_WORKERS` or
+        the number of CPUs.
+    chunk_size : int, optional
+        Passwords sent to a worker per task. Defaults to
+        `BULK_IMPORT_HASH_CHUNK_SIZE` or 64.
+
+    Examples
+    --------
+    >>> with PasswordHashingPool(workers=8) as pool:
+    >>>     hashes = list(pool.map(["secret1", "secret2"]))
+    """
+
+    def __init__(self, workers=None, chunk_size=None):
+        self.workers = workers or getattr(
+            settings, "BULK_IMPORT_HASH_WORKERS", None
+        ) or os.cpu_count() or 1
+        self.chunk_size = chunk_size or getattr(
+            settings, "BULK_IMPORT_HASH_CHUNK_SIZE", 64
+        )
+        self._executor = None
+
+    def __enter__(self):
+        if self.workers > 1:
+            logger.debug("Starting password hashing pool with %s workers.", self.workers)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_initialize_worker,
+                initargs=(os.environ.get("DJANGO_SETTINGS_MODULE"),),
+            )
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def map(self, passwords):
+        """
+        Start hashing `passwords` and return an iterator over the encoded
+        hashes. With a pool the work is submitted immediately, so the caller
+        can keep preparing the next batch while the workers run.
+        """
+        if self._executor is None:
+            return map(make_password, passwords)
+        return self._executor.map(make_password, passwords, chunksize=self.chunk_size)
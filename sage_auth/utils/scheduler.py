@@ -0,0 +1,138 @@
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from sage_otp.helpers.choices import ReasonOptions
+
+from sage_auth.helpers.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+LANES = ("interactive", "activation", "bulk")
+LANE_PRIORITIES = {lane: priority for priority, lane in enumerate(LANES)}
+REASON_LANES = {
+    ReasonOptions.LOGIN: "interactive",
+    ReasonOptions.FORGET_PASSWORD: "interactive",
+    ReasonOptions.RESET_PASSWORD: "interactive",
+    ReasonOptions.EMAIL_ACTIVATION: "activation",
+    ReasonOptions.PHONE_NUMBER_ACTIVATION: "activation",
+}
+DEFAULT_LANE_LIMITS = {"interactive": 16, "activation": 4, "bulk": 2}
+
+
+def lane_limits():
+    """Return the concurrency limit per lane, or None if lanes are disabled."""
+    configured = getattr(settings, "AUTH_DELIVERY_LANES", None)
+    if configured is None:
+        return None
+    return {**DEFAULT_LANE_LIMITS, **configured}
+
+
+def lane_for(reason):
+    """Return the lane of an OTP `reason`; lane names map to themselves."""
+    if reason in LANE_PRIORITIES:
+        return reason
+    return REASON_LANES.get(reason, "bulk")
+
+
+class DeliveryScheduler:
+    """
+    Share the email and SMS capacity between priority lanes.
+
+    Every send takes a slot in the lane of its reason: `interactive` for
+    login and password codes, `activation` for activation emails and codes,
+    and `bulk` for everything else, such as announcement campaigns. A lane
+    never runs more sends at once than its limit in `AUTH_DELIVERY_LANES`,
+    so a bulk backlog can only hold its own slots. When the total of
+    `AUTH_DELIVERY_CAPACITY` is reached, freed slots go to the waiting send
+    of the highest priority lane first, then in arrival order. A send that
+    waited `AUTH_DELIVERY_WAIT` seconds (10 by default, None waits forever)
+    goes out without a slot rather than not at all, and is counted in
+    `sage_auth_delivery_wait_timeouts_total`.
+
+    Without `AUTH_DELIVERY_LANES` the slots are free and sends are not
+    limited.
+
+    Examples
+    --------
+    >>> with delivery_scheduler.slot(ReasonOptions.LOGIN):
+    >>>     send_email_otp(token, email)
+    >>> with delivery_scheduler.slot("bulk"):
+    >>>     send_mass_mail(messages)
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._in_flight = dict.fromkeys(LANES, 0)
+        self._waiting = []
+        self._sequence = itertools.count()
+
+    def _can_start(self, ticket, limits, capacity):
+        lane = ticket[2]
+        if self._in_flight[lane] >= limits[lane]:
+            return False
+        if capacity is not None and sum(self._in_flight.values()) >= capacity:
+            return False
+        # Leave the slot to a more urgent or earlier send that can use it.
+        return not any(
+            other < ticket and self._in_flight[other[2]] < limits[other[2]]
+            for other in self._waiting
+        )
+
+    def _set_in_flight(self, lane, delta):
+        self._in_flight[lane] += delta
+        metrics.set_gauge("sage_auth_delivery_in_flight", self._in_flight[lane], lane=lane)
+
+    @contextmanager
+    def slot(self, reason):
+        """Wait for a slot in the lane of `reason` and hold it in the block."""
+        lane = lane_for(reason)
+        limits = lane_limits()
+        if limits is None:
+            yield lane
+            return
+
+        capacity = getattr(settings, "AUTH_DELIVERY_CAPACITY", None)
+        timeout = getattr(settings, "AUTH_DELIVERY_WAIT", 10)
+        ticket = (LANE_PRIORITIES[lane], next(self._sequence), lane)
+        started = time.monotonic()
+        with self._condition:
+            self._waiting.append(ticket)
+            try:
+                acquired = self._condition.wait_for(
+                    lambda: self._can_start(ticket, limits, capacity), timeout
+                )
+            finally:
+                self._waiting.remove(ticket)
+                self._condition.notify_all()
+            if acquired:
+                self._set_in_flight(lane, 1)
+        metrics.observe(
+            "sage_auth_delivery_wait_seconds", time.monotonic() - started, lane=lane
+        )
+        if not acquired:
+            metrics.increment("sage_auth_delivery_wait_timeouts_total", lane=lane)
+            logger.warning(
+                "No %s delivery slot freed up within %ss; sending without one.",
+                lane,
+                timeout,
+            )
+            yield lane
+            return
+        try:
+            yield lane
+        finally:
+            with self._condition:
+                self._set_in_flight(lane, -1)
+                self._condition.notify_all()
+
+    def in_flight(self):
+        """Return the number of sends holding a slot, per lane."""
+        with self._condition:
+            return dict(self._in_flight)
+
+
+delivery_scheduler = DeliveryScheduler()
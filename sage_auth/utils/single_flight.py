@@ -0,0 +1,78 @@
+import logging
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from sage_auth.helpers.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "sage_auth:single-flight"
+PENDING = "pending"
+POLL_INTERVAL = 0.05
+
+
+def issuance_key(user, reason):
+    """Return the single-flight key of issuing an OTP for `reason` to `user`."""
+    return f"otp:{user.pk}:{reason}"
+
+
+def single_flight(key, func):
+    """
+    Run `func()` once for concurrent callers sharing `key` and give all of
+    them its result.
+
+    The first caller takes a lock with `cache.add` and runs `func`. Its
+    result is kept for `AUTH_SINGLE_FLIGHT_RESULT_TTL` seconds (10 by
+    default), and callers arriving meanwhile wait for it instead of running
+    `func` again. A waiter that gets no result within
+    `AUTH_SINGLE_FLIGHT_WAIT` seconds (5 by default) receives `PENDING`.
+    If the first caller fails, a waiter takes over the lock and runs `func`.
+    The lock expires after `AUTH_SINGLE_FLIGHT_LOCK_TTL` seconds (30 by
+    default) should its holder die. Results must be picklable and not
+    None, and the cache must be shared between the workers for the guard
+    to span them.
+
+    Examples
+    --------
+    >>> outcome = single_flight(issuance_key(user, reason), lambda: issue(user))
+    """
+    lock_key = f"{KEY_PREFIX}:lock:{key}"
+    result_key = f"{KEY_PREFIX}:result:{key}"
+    lock_ttl = getattr(settings, "AUTH_SINGLE_FLIGHT_LOCK_TTL", 30)
+    result_ttl = getattr(settings, "AUTH_SINGLE_FLIGHT_RESULT_TTL", 10)
+    deadline = time.monotonic() + getattr(settings, "AUTH_SINGLE_FLIGHT_WAIT", 5)
+    owner = uuid.uuid4().hex
+
+    while True:
+        if cache.add(lock_key, owner, timeout=lock_ttl):
+            break
+        result = cache.get(result_key)
+        if result is not None:
+            metrics.increment("sage_auth_single_flight_total", outcome="shared")
+            return result
+        if time.monotonic() >= deadline:
+            metrics.increment("sage_auth_single_flight_total", outcome="pending")
+            return PENDING
+        time.sleep(POLL_INTERVAL)
+
+    try:
+        result = cache.get(result_key)
+        if result is not None:
+            # Another caller finished between our read and the lock.
+            metrics.increment("sage_auth_single_flight_total", outcome="shared")
+            return result
+        result = func()
+        cache.set(result_key, result, timeout=result_ttl)
+        metrics.increment("sage_auth_single_flight_total", outcome="leader")
+        return result
+    finally:
+        if cache.get(lock_key) == owner:
+            cache.delete(lock_key)
+
+
+def forget(key):
+    """Drop the shared result of `key`, so the next caller runs again."""
+    cache.delete(f"{KEY_PREFIX}:result:{key}")
@@ -1,5 +1,5 @@
 from django.conf import settings
-from sage_sms.factory import SMSBackendFactory
+
 
 def get_backends():
     """
@@ -9,6 +9,9 @@ def get_backends():
     initialize an SMS provider backend as specified in the Django settings.The 
     SMS provider can then be used to send messages based on application needs.
     """
+    # Imported on first send: the factory is only needed by phone OTPs.
+    from sage_sms.factory import SMSBackendFactory
+
     factory = SMSBackendFactory(settings.SMS_CONFIGS, "sage_auth.backends")
     sms_provider_class = factory.get_backend()
     sms_provider = sms_provider_class(settings)
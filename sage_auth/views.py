@@ -0,0 +1,23 @@
+from django.http import Http404, HttpResponse
+
+from sage_auth.helpers.metrics import metrics, metrics_enabled
+
+
+def metrics_view(request):
+    """
+    Serve the `sage_auth` metrics in the Prometheus text format.
+
+    Returns 404 unless `AUTH_METRICS_ENABLED` is True. The endpoint exposes
+    operational figures only; restrict access to it in your proxy or with a
+    decorator if it is reachable from outside.
+
+    Usage:
+        urlpatterns = [
+            path("metrics/auth/", metrics_view),
+        ]
+    """
+    if not metrics_enabled():
+        raise Http404("Metrics are disabled.")
+    return HttpResponse(
+        metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )